@@ -0,0 +1,61 @@
+"""Shared helpers for the benchmark suite."""
+import time
+from typing import Any, Callable, Optional
+
+
+def result(
+    name: str,
+    params: dict[str, Any],
+    operations: int,
+    wall_s: float,
+    events: Optional[int] = None,
+    simulated_ns: Optional[int] = None,
+) -> dict[str, Any]:
+    """
+    Build one benchmark result record.
+
+    :param name: The benchmark name.
+    :param params: The workload parameters.
+    :param operations: The number of timed operations.
+    :param wall_s: The wall time in seconds.
+    :param events: The number of scheduler events processed, if relevant.
+    :param simulated_ns: The simulated time covered, if relevant.
+    :returns: The result record.
+    """
+    record: dict[str, Any] = {
+        "name": name,
+        "params": params,
+        "operations": operations,
+        "wall_s": wall_s,
+        "ns_per_op": wall_s * 1e9 / operations,
+    }
+    if events is not None:
+        record["events"] = events
+        record["events_per_s"] = events / wall_s
+    if simulated_ns is not None:
+        record["simulated_ns"] = simulated_ns
+        record["simulated_ns_per_wall_s"] = simulated_ns / wall_s
+    return record
+
+
+def best_of(
+    repeat: int, setup: Callable[[], Any], run: Callable[[Any], Any]
+) -> tuple[float, Any]:
+    """
+    Time a workload several times and keep the fastest run.
+
+    :param repeat: The number of runs.
+    :param setup: Builds fresh untimed state for each run.
+    :param run: The timed workload, called with the setup state.
+    :returns: The fastest wall time in seconds and that run's return value.
+    """
+    best = float("inf")
+    value = None
+    for _ in range(repeat):
+        state = setup()
+        start = time.perf_counter()
+        out = run(state)
+        elapsed = time.perf_counter() - start
+        if elapsed < best:
+            best, value = elapsed, out
+    return best, value
@@ -0,0 +1,239 @@
+"""
+Measure full RAM62256LP12 read and write bus cycles driven through nets.
+
+Each cycle is a sequence of timed steps replayed by one re-armed
+driver event, so the measurement covers the scheduler, nets, buses
+and the RAM model but not the construction of the stimulus.
+
+Run with ``python benchmarks/bench_ram.py``.
+"""
+import contextlib
+import os
+import tempfile
+from typing import Any, Callable, Iterator
+
+from _harness import best_of, result
+from sim8bit.components.ram62256lp12 import RAM62256LP12
+from sim8bit.events import EventScheduler, Timestamp
+from sim8bit.waveform import WaveformRecorder
+from sim8bit.wire import BusMember, Net
+
+CYCLES = 2000
+CYCLE_NS = 300
+REPEAT = 3
+
+Step = tuple[int, Callable[[int], Any]]
+
+
+class _Circuit:
+    """A RAM chip with a tester driving its nets."""
+
+    def __init__(self, fast: bool = False, chips: int = 1):
+        """
+        Build the circuit.
+
+        :param fast: If True, run the RAM in fast mode.
+        :param chips: The number of RAM chips sharing the buses.
+            Only the first one is ever selected.
+        """
+        self.sched = EventScheduler()
+        addr_nets = [Net() for _ in range(15)]
+        data_nets = [Net() for _ in range(8)]
+        self.cs = Net()
+        self.oe = Net()
+        self.we = Net()
+        self.ram = RAM62256LP12(
+            self.sched,
+            BusMember(addr_nets),
+            BusMember(data_nets),
+            self.cs,
+            self.oe,
+            self.we,
+            fast=fast,
+        )
+        for _ in range(chips - 1):
+            deselected = Net()
+            deselected.take_high()
+            RAM62256LP12(
+                self.sched,
+                BusMember(addr_nets),
+                BusMember(data_nets),
+                deselected,
+                self.oe,
+                self.we,
+                fast=fast,
+            )
+        self.addr = BusMember(addr_nets)
+        self.data = BusMember(data_nets)
+        self.cs_hdl = self.cs.take_high()
+        self.oe_hdl = self.oe.take_high()
+        self.we_hdl = self.we.take_high()
+
+    def write_steps(self) -> list[Step]:
+        """Get the steps of one write cycle for a cycle number."""
+        return [
+            (0, lambda i: (self.addr.write(i), self.cs.take_low(self.cs_hdl))),
+            (80, lambda i: (self.we.take_low(self.we_hdl), self.data.write(i & 255))),
+            (160, lambda i: self.we.take_high(self.we_hdl)),
+            (170, lambda i: (self.data.float_(), self.cs.take_high(self.cs_hdl))),
+        ]
+
+    def read_steps(self) -> list[Step]:
+        """Get the steps of one read cycle for a cycle number."""
+        return [
+            (0, lambda i: (self.addr.write(i), self.cs.take_low(self.cs_hdl))),
+            (60, lambda i: self.oe.take_low(self.oe_hdl)),
+            (200, lambda i: self.oe.take_high(self.oe_hdl)),
+            (220, lambda i: self.cs.take_high(self.cs_hdl)),
+        ]
+
+    def run(self, steps: list[Step], cycles: int):
+        """
+        Replay the steps once per cycle.
+
+        :param steps: The cycle steps.
+        :param cycles: The number of cycles.
+        :returns: The run statistics.
+        """
+
+        def step(stamp: Timestamp, cycle: int, index: int):
+            offset, action = steps[index]
+            action(cycle)
+            start = stamp.total_nanoseconds - offset
+            if index + 1 < len(steps):
+                driver.args = (cycle, index + 1)
+                next_ns = start + steps[index + 1][0]
+            elif cycle + 1 < cycles:
+                driver.args = (cycle + 1, 0)
+                next_ns = start + CYCLE_NS
+            else:
+                return
+            driver.reschedule(Timestamp.from_nanoseconds(next_ns))
+
+        driver = self.sched.submit(self.sched.now, step, 0, 0)
+        return self.sched.run_until_idle()
+
+
+def _recorder(circuit: _Circuit, path: str) -> WaveformRecorder:
+    """
+    Record every RAM signal of a circuit.
+
+    :param circuit: The circuit.
+    :param path: The VCD file.
+    :returns: The recorder.
+    """
+    recorder = WaveformRecorder(circuit.sched, path)
+    recorder.add_bus(circuit.addr, "addr")
+    recorder.add_bus(circuit.data, "data")
+    recorder.add_net(circuit.cs, "cs_n")
+    recorder.add_net(circuit.oe, "oe_n")
+    recorder.add_net(circuit.we, "we_n")
+    return recorder
+
+
+def bench_cycle(
+    kind: str,
+    fast: bool = False,
+    record: bool = False,
+    chips: int = 1,
+    cycles: int = CYCLES,
+) -> dict[str, Any]:
+    """
+    Time RAM bus cycles.
+
+    :param kind: "read" or "write".
+    :param fast: If True, run the RAM in fast mode.
+    :param record: If True, record a VCD waveform of every RAM signal.
+    :param chips: The number of RAM chips in the memory map.
+    :param cycles: The number of cycles to time.
+    :returns: The result record.
+    """
+    directory = tempfile.TemporaryDirectory()
+
+    def setup():
+        circuit = _Circuit(fast, chips)
+        steps = circuit.read_steps() if kind == "read" else circuit.write_steps()
+        if not record:
+            return circuit, steps, contextlib.nullcontext()
+        path = os.path.join(directory.name, "ram.vcd")
+        return circuit, steps, _recorder(circuit, path)
+
+    def run(state):
+        circuit, steps, recorder = state
+        with recorder:
+            return circuit.run(steps, cycles)
+
+    with directory:
+        wall_s, stats = best_of(REPEAT, setup, run)
+    return result(
+        f"ram.{kind}_cycle",
+        {"cycles": cycles, "fast": fast, "record": record, "chips": chips},
+        cycles,
+        wall_s,
+        events=stats.events,
+        simulated_ns=stats.elapsed.total_nanoseconds,
+    )
+
+
+def bench_direct(kind: str, cycles: int = CYCLES) -> dict[str, Any]:
+    """
+    Time whole RAM cycles applied in fast mode without the nets.
+
+    :param kind: "read" or "write".
+    :param cycles: The number of cycles to time.
+    :returns: The result record.
+    """
+
+    def setup():
+        circuit = _Circuit(fast=True)
+        return circuit.ram
+
+    def run(ram: RAM62256LP12):
+        if kind == "read":
+            for i in range(cycles):
+                ram.read_cycle(i)
+        else:
+            for i in range(cycles):
+                ram.write_cycle(i, i & 255)
+
+    wall_s, _ = best_of(REPEAT, setup, run)
+    return result(
+        f"ram.{kind}_direct",
+        {"cycles": cycles, "fast": True, "record": False, "chips": 1},
+        cycles,
+        wall_s,
+    )
+
+
+def benchmarks() -> Iterator[dict[str, Any]]:
+    """Run the RAM benchmarks."""
+    for fast in (False, True):
+        yield bench_cycle("write", fast)
+        yield bench_cycle("read", fast)
+    yield bench_cycle("write", record=True)
+    yield bench_cycle("read", record=True)
+    yield bench_cycle("write", chips=8)
+    yield bench_cycle("read", chips=8)
+    yield bench_direct("write")
+    yield bench_direct("read")
+
+
+def main():
+    """Print the RAM cycle throughput."""
+    for record in benchmarks():
+        print(
+            f"{record['name']:<16} {'fast' if record['params']['fast'] else 'timed':<5}"
+            + f" {'vcd' if record['params']['record'] else '':<3}"
+            + f" {record['params']['chips']:>2} chips"
+            + f" {record['ns_per_op']:>10.0f} ns/cycle"
+            + (
+                f" {record['events_per_s']:>10.0f} events/s"
+                + f" {record['simulated_ns_per_wall_s']:>12.0f} sim ns/s"
+                if "events" in record
+                else ""
+            )
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,120 @@
+"""
+Measure how EventScheduler submit/tick cost scales with queue depth.
+
+The queue is filled to a fixed depth, then each iteration submits one
+event and ticks one event (the classic "hold" model) so the depth stays
+constant while the cost per operation is timed.
+
+Run with ``python benchmarks/bench_scheduler.py``.
+"""
+import random
+from typing import Any, Callable, Iterator
+
+from _harness import best_of, result
+from sim8bit.events import EventQueue, EventScheduler, HeapQueue, Timestamp
+from sim8bit.events import TimingWheelQueue
+
+DEPTHS = [10, 100, 1000, 10000, 100000]
+OPERATIONS = 20000
+REPEAT = 3
+QUEUES: dict[str, Callable[[], EventQueue]] = {
+    "heap": HeapQueue,
+    "wheel": TimingWheelQueue,
+}
+
+
+def _handler(_):
+    pass
+
+
+def bench_hold(
+    depth: int, queue: str = "heap", operations: int = OPERATIONS
+) -> dict[str, Any]:
+    """
+    Time submit + tick pairs at a constant queue depth.
+
+    :param depth: The number of pending events.
+    :param queue: The queue implementation, a key of QUEUES.
+    :param operations: The number of submit/tick pairs to time.
+    :returns: The result record.
+    """
+
+    def setup():
+        rng = random.Random(depth)
+        sched = EventScheduler(QUEUES[queue]())
+        for _ in range(depth):
+            sched.submit(Timestamp(0, rng.randrange(1000)), _handler)
+        delays = [Timestamp(0, rng.randrange(1, 1000)) for _ in range(operations)]
+        return sched, delays
+
+    def run(state):
+        sched, delays = state
+        start = sched.now
+        for delay in delays:
+            sched.submit(sched.now + delay, _handler)
+            sched.tick()
+        return (sched.now - start).total_nanoseconds
+
+    wall_s, simulated_ns = best_of(REPEAT, setup, run)
+    return result(
+        "scheduler.hold",
+        {"depth": depth, "queue": queue},
+        operations,
+        wall_s,
+        events=operations,
+        simulated_ns=simulated_ns,
+    )
+
+
+def bench_run_until_idle(depth: int, queue: str = "heap") -> dict[str, Any]:
+    """
+    Time draining a queue of a given depth with run_until_idle.
+
+    :param depth: The number of pending events.
+    :param queue: The queue implementation, a key of QUEUES.
+    :returns: The result record.
+    """
+
+    def setup():
+        rng = random.Random(depth)
+        sched = EventScheduler(QUEUES[queue]())
+        for _ in range(depth):
+            sched.submit(Timestamp(0, rng.randrange(1000000)), _handler)
+        return sched
+
+    def run(sched):
+        return sched.run_until_idle()
+
+    wall_s, stats = best_of(REPEAT, setup, run)
+    return result(
+        "scheduler.drain",
+        {"depth": depth, "queue": queue},
+        depth,
+        wall_s,
+        events=stats.events,
+        simulated_ns=stats.elapsed.total_nanoseconds,
+    )
+
+
+def benchmarks() -> Iterator[dict[str, Any]]:
+    """Run the scheduler benchmarks."""
+    for queue in QUEUES:
+        for depth in DEPTHS:
+            yield bench_hold(depth, queue)
+        for depth in DEPTHS:
+            yield bench_run_until_idle(depth, queue)
+
+
+def main():
+    """Print the submit/tick cost for each queue depth."""
+    print(f"{'benchmark':<18} {'queue':<6} {'depth':>8}  {'ns/op':>10}")
+    for record in benchmarks():
+        params = record["params"]
+        print(
+            f"{record['name']:<18} {params['queue']:<6} {params['depth']:>8}"
+            + f"  {record['ns_per_op']:>10.0f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
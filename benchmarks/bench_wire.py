@@ -0,0 +1,127 @@
+"""
+Measure Net fan-out and BusMember write/read cost.
+
+Run with ``python benchmarks/bench_wire.py``.
+"""
+from typing import Any, Iterator
+
+from _harness import best_of, result
+from sim8bit.wire import BusMember, BusValueCallback, Net, NetChangeCallback, Netlist
+
+LISTENER_COUNTS = [1, 2, 4, 8, 16, 32, 64]
+BUS_WIDTHS = [8, 15, 16]
+OPERATIONS = 20000
+REPEAT = 3
+
+
+def _listener(_):
+    pass
+
+
+def bench_net_fanout(
+    listeners: int, frozen: bool = False, operations: int = OPERATIONS
+) -> dict[str, Any]:
+    """
+    Time toggling a net with a number of listeners.
+
+    :param listeners: The number of listeners on the net.
+    :param frozen: If True, freeze the net in a Netlist.
+    :param operations: The number of toggles to time.
+    :returns: The result record.
+    """
+
+    def setup():
+        net = Net()
+        for _ in range(listeners):
+            net.add_listener(NetChangeCallback(_listener))
+        if frozen:
+            Netlist([net])
+        return net, net.take_low()
+
+    def run(state):
+        net, handle = state
+        take_high = net.take_high
+        take_low = net.take_low
+        for _ in range(operations // 2):
+            take_high(handle)
+            take_low(handle)
+
+    wall_s, _ = best_of(REPEAT, setup, run)
+    return result(
+        "net.fanout", {"listeners": listeners, "frozen": frozen}, operations, wall_s
+    )
+
+
+def bench_bus_write(
+    width: int, frozen: bool = False, operations: int = OPERATIONS
+) -> dict[str, Any]:
+    """
+    Time writing changing values to a bus watched by a second member.
+
+    :param width: The bus width in nets.
+    :param frozen: If True, freeze the nets in a Netlist.
+    :param operations: The number of writes to time.
+    :returns: The result record.
+    """
+    mask = (1 << width) - 1
+    values = [(i * 40503) & mask for i in range(operations)]
+
+    def setup():
+        nets = [Net() for _ in range(width)]
+        BusMember(nets).add_listener(BusValueCallback(_listener))
+        bus = BusMember(nets)
+        if frozen:
+            Netlist(nets)
+        return bus
+
+    def run(bus):
+        write = bus.write
+        for value in values:
+            write(value)
+
+    wall_s, _ = best_of(REPEAT, setup, run)
+    return result("bus.write", {"width": width, "frozen": frozen}, operations, wall_s)
+
+
+def bench_bus_value(width: int, operations: int = OPERATIONS) -> dict[str, Any]:
+    """
+    Time reading the value of a driven bus.
+
+    :param width: The bus width in nets.
+    :param operations: The number of reads to time.
+    :returns: The result record.
+    """
+
+    def setup():
+        bus = BusMember([Net() for _ in range(width)])
+        bus.write((1 << width) - 1)
+        return bus
+
+    def run(bus):
+        for _ in range(operations):
+            bus.value
+
+    wall_s, _ = best_of(REPEAT, setup, run)
+    return result("bus.value", {"width": width}, operations, wall_s)
+
+
+def benchmarks() -> Iterator[dict[str, Any]]:
+    """Run the wire benchmarks."""
+    for frozen in (False, True):
+        for listeners in LISTENER_COUNTS:
+            yield bench_net_fanout(listeners, frozen)
+        for width in BUS_WIDTHS:
+            yield bench_bus_write(width, frozen)
+    for width in BUS_WIDTHS:
+        yield bench_bus_value(width)
+
+
+def main():
+    """Print the cost of each wire operation."""
+    for record in benchmarks():
+        params = ", ".join(f"{k}={v}" for k, v in record["params"].items())
+        print(f"{record['name']:<12} {params:<28} {record['ns_per_op']:>10.0f} ns/op")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,70 @@
+"""
+Run the whole benchmark suite and emit the results as JSON.
+
+Run with ``python benchmarks/run.py [--output results.json] [--only NAME]``.
+Each record has the benchmark name, its parameters, the wall time,
+the cost per operation and, where relevant, events per second and
+simulated nanoseconds per wall second.
+"""
+import argparse
+import json
+import platform
+import subprocess
+import sys
+import time
+from typing import Any, Optional
+
+import bench_ram
+import bench_scheduler
+import bench_wire
+
+SUITES = {
+    "scheduler": bench_scheduler,
+    "wire": bench_wire,
+    "ram": bench_ram,
+}
+
+
+def _commit() -> Optional[str]:
+    """Get the current git commit, if available."""
+    try:
+        out = subprocess.run(
+            ["git", "rev-parse", "HEAD"], capture_output=True, text=True, check=True
+        )
+    except (OSError, subprocess.CalledProcessError):
+        return None
+    return out.stdout.strip()
+
+
+def main(argv: Optional[list[str]] = None):
+    """Run the selected suites and write the JSON report."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--output", help="Write JSON here instead of stdout.")
+    parser.add_argument(
+        "--only", choices=sorted(SUITES), action="append", help="Suites to run."
+    )
+    args = parser.parse_args(argv)
+
+    results: list[dict[str, Any]] = []
+    for name in args.only or SUITES:
+        for record in SUITES[name].benchmarks():
+            print(f"{record['name']} {record['params']}", file=sys.stderr)
+            results.append(record)
+
+    report = {
+        "commit": _commit(),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "time": time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+        "results": results,
+    }
+    text = json.dumps(report, indent=2)
+    if args.output:
+        with open(args.output, "w") as f:
+            f.write(text + "\n")
+    else:
+        print(text)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,6 +1 @@
-import logging
-
-logging.basicConfig()
-logging.getLogger(__name__).setLevel(logging.DEBUG)
-
 __version__ = "0.0.1"
@@ -0,0 +1,172 @@
+"""
+Run batches of independent simulations across processes.
+
+Each job builds its own circuit with a factory, loads a memory image,
+runs to a stop condition and reports the final memory. Images and
+final memory travel through one shared memory block with a slot per
+job, so only the small job descriptions and run statistics are pickled.
+"""
+from __future__ import annotations
+
+import concurrent.futures
+import dataclasses
+import os
+from multiprocessing import shared_memory
+from typing import Any, Callable, Optional, Sequence
+
+from typing_extensions import Buffer
+
+from .events import EventScheduler, RunStats, Timestamp
+from .memory import ArrayMemory
+
+CircuitFactory = Callable[[memoryview, Any], tuple[EventScheduler, ArrayMemory]]
+"""
+A function that builds a circuit from a memory image and job parameters.
+
+It returns the scheduler to run and the memory to report. The image
+is a read-only view that is only valid during the call, so the memory
+must copy it (as ArrayMemory does for plain buffers).
+The factory must be picklable, such as a module-level function.
+"""
+
+
+@dataclasses.dataclass
+class BatchJob:
+    """One simulation in a batch."""
+
+    image: Optional[Buffer] = None
+    """The starting memory image, loaded at address zero."""
+    until: Optional[Timestamp] = None
+    """Stop after this time. If None, run until idle."""
+    max_events: Optional[int] = None
+    """An optional limit on the number of events when running until idle."""
+    params: Any = None
+    """Parameters passed to the circuit factory. Must be picklable."""
+
+
+@dataclasses.dataclass
+class BatchResult:
+    """The outcome of one simulation in a batch."""
+
+    memory: bytes
+    """The final memory contents, or the starting image if the job failed."""
+    stats: Optional[RunStats]
+    """The run statistics, or None if the job failed."""
+    error: Optional[Exception] = None
+    """The exception that stopped the job, such as UndefinedBehavior."""
+
+    @property
+    def ok(self) -> bool:
+        """True if the job ran to its stop condition."""
+        return self.error is None
+
+
+_block: Optional[shared_memory.SharedMemory] = None
+"""The batch memory block attached in a worker process."""
+_factory: Optional[CircuitFactory] = None
+"""The circuit factory in a worker process."""
+_size = 0
+"""The slot size in bytes in a worker process."""
+
+
+def _attach(name: str, size: int, factory: CircuitFactory):
+    """
+    Initialize a worker process for a batch.
+
+    :param name: The shared memory block name.
+    :param size: The slot size in bytes.
+    :param factory: The circuit factory.
+    """
+    global _block, _factory, _size
+    _block = shared_memory.SharedMemory(name)
+    _factory = factory
+    _size = size
+
+
+def _run_job(
+    index: int, job: BatchJob
+) -> tuple[Optional[RunStats], Optional[Exception]]:
+    """
+    Run one job in a worker process.
+
+    The job image is read from its slot, and the final memory is
+    written back to the same slot.
+
+    :param index: The job index.
+    :param job: The job, with its image already in the slot.
+    :returns: The run statistics and the error, if any.
+    """
+    assert _block is not None and _factory is not None
+    buf = _block.buf
+    assert buf is not None
+    slot = buf[index * _size : (index + 1) * _size]
+    try:
+        image = slot.toreadonly()
+        try:
+            sched, memory = _factory(image, job.params)
+        finally:
+            image.release()
+        if job.until is not None:
+            stats = sched.run_until(job.until)
+        else:
+            stats = sched.run_until_idle(job.max_events)
+        slot[:] = memory.dump(0, _size)
+        return stats, None
+    except Exception as error:
+        return None, error
+    finally:
+        slot.release()
+
+
+def run_batch(
+    factory: CircuitFactory,
+    jobs: Sequence[BatchJob],
+    size: int,
+    workers: Optional[int] = None,
+) -> list[BatchResult]:
+    """
+    Run independent simulations across a pool of processes.
+
+    :param factory: The circuit factory.
+    :param jobs: The jobs to run.
+    :param size: The number of bytes of memory in each circuit.
+    :param workers: The number of processes. Defaults to the number of CPUs.
+    :returns: The results in job order.
+    :raises ValueError: If an image is larger than the memory.
+    """
+    if not jobs:
+        return []
+
+    block = shared_memory.SharedMemory(create=True, size=size * len(jobs))
+    buf = block.buf
+    try:
+        assert buf is not None
+        for i, job in enumerate(jobs):
+            if job.image is not None:
+                image = memoryview(job.image).cast("B")
+                if len(image) > size:
+                    raise ValueError(f"Image for job {i} is larger than memory.")
+                buf[i * size : i * size + len(image)] = image
+            # The rest of the slot keeps the zero fill of a new block.
+
+        workers = workers or os.cpu_count() or 1
+        with concurrent.futures.ProcessPoolExecutor(
+            workers, initializer=_attach, initargs=(block.name, size, factory)
+        ) as pool:
+            outcomes = list(
+                pool.map(
+                    _run_job,
+                    range(len(jobs)),
+                    [dataclasses.replace(job, image=None) for job in jobs],
+                    chunksize=max(1, len(jobs) // (4 * workers)),
+                )
+            )
+
+        return [
+            BatchResult(bytes(buf[i * size : (i + 1) * size]), stats, error)
+            for i, (stats, error) in enumerate(outcomes)
+        ]
+    finally:
+        del buf
+        block.close()
+        block.unlink()
@@ -0,0 +1,172 @@
+from __future__ import annotations
+
+from typing import Optional
+
+from ..events import Event, EventScheduler, Timestamp
+from ..wire import Net
+
+
+class Clock:
+    """
+    A periodic clock source driving a net.
+
+    Each cycle starts with a rising edge and is high for the duty
+    cycle fraction of the period. All edges come from one event that
+    is re-armed in place, so a running clock keeps exactly one event
+    pending and allocates no events.
+    """
+
+    def __init__(
+        self,
+        sched: EventScheduler,
+        net: Net,
+        period: Timestamp,
+        duty: float = 0.5,
+        start: Optional[Timestamp] = None,
+    ):
+        """
+        Create the clock and drive the net low.
+
+        :param sched: The event scheduler.
+        :param net: The clock net, owned by the clock.
+        :param period: The clock period.
+        :param duty: The fraction of each period the clock is high.
+        :param start: The time of the first rising edge,
+            or None to leave the clock stopped.
+        :raises ValueError: If the period or duty cycle leaves
+            either half of the cycle empty.
+        """
+        self._period_ns = period.total_nanoseconds
+        self._high_ns = round(self._period_ns * duty)
+        if not 0 < self._high_ns < self._period_ns:
+            raise ValueError("Clock must spend time both high and low.")
+
+        self._sched = sched
+        self._net = net
+        self._handle = net.take_low()
+        self._high = False
+        self._cycles = 0
+        # The time of the last rising edge, or one period before the next.
+        self._rise_ns = 0
+        self._event: Optional[Event] = None
+        if start is not None:
+            self.start(start)
+
+    @classmethod
+    def from_frequency(
+        cls,
+        sched: EventScheduler,
+        net: Net,
+        hertz: float,
+        duty: float = 0.5,
+        start: Optional[Timestamp] = None,
+    ) -> Clock:
+        """
+        Create a clock from a frequency.
+
+        :param sched: The event scheduler.
+        :param net: The clock net, owned by the clock.
+        :param hertz: The frequency, rounded to a whole nanosecond period.
+        :param duty: The fraction of each period the clock is high.
+        :param start: The time of the first rising edge,
+            or None to leave the clock stopped.
+        :returns: The clock.
+        """
+        period = Timestamp.from_nanoseconds(round(1e9 / hertz))
+        return cls(sched, net, period, duty, start)
+
+    @property
+    def period(self) -> Timestamp:
+        """The clock period."""
+        return Timestamp.from_nanoseconds(self._period_ns)
+
+    @property
+    def running(self) -> bool:
+        """True if the clock is running."""
+        return self._event is not None and self._event.pending
+
+    @property
+    def cycles(self) -> int:
+        """The number of rising edges so far."""
+        return self._cycles
+
+    def start(self, stamp: Optional[Timestamp] = None):
+        """
+        Start or restart the clock with a rising edge.
+
+        :param stamp: The time of the rising edge. Defaults to now.
+        """
+        if stamp is None:
+            stamp = self._sched.now
+        if self._high:
+            self._high = False
+            self._net.take_low(self._handle)
+        self._rise_ns = stamp.total_nanoseconds - self._period_ns
+        if self._event is None:
+            self._event = self._sched.submit(stamp, self._edge)
+        else:
+            self._event.reschedule(stamp)
+
+    def stop(self):
+        """Stop the clock, driving the net low (gating it)."""
+        if self._event is not None:
+            self._event.cancel()
+        if self._high:
+            self._high = False
+            self._net.take_low(self._handle)
+
+    def skip_to(self, stamp: Timestamp):
+        """
+        Advance the clock to a time without simulating the edges between.
+
+        The clock keeps its phase, so the next edge is the first edge
+        at or after the time. The net is set to the level the clock
+        has at that time, and the skipped cycles are counted.
+
+        :param stamp: The time to skip to.
+        :raises RuntimeError: If anything listens to the clock net,
+            other than listeners in disabled sensitivity groups.
+        """
+        if self._net._has_enabled_listeners():
+            raise RuntimeError("Cannot skip a clock with listeners.")
+        event = self._event
+        if event is None or not event.pending:
+            return
+        ns = stamp.total_nanoseconds
+        if ns < event.stamp.total_nanoseconds:
+            return
+
+        skipped = (ns - self._rise_ns) // self._period_ns
+        self._cycles += skipped
+        self._rise_ns += skipped * self._period_ns
+        if ns - self._rise_ns < self._high_ns:
+            self._high = True
+            self._net.take_high(self._handle)
+            next_ns = self._rise_ns + self._high_ns
+        else:
+            self._high = False
+            self._net.take_low(self._handle)
+            next_ns = self._rise_ns + self._period_ns
+        event.reschedule(Timestamp.from_nanoseconds(next_ns))
+
+    def _edge(self, stamp: Timestamp):
+        """
+        Toggle the clock.
+
+        The event is re-armed before the net changes,
+        so a listener can stop the clock on the edge.
+        """
+        event = self._event
+        assert event is not None
+        if self._high:
+            self._high = False
+            event.reschedule(
+                Timestamp.from_nanoseconds(self._rise_ns + self._period_ns)
+            )
+            self._net.take_low(self._handle)
+        else:
+            self._high = True
+            self._rise_ns = ns = stamp.total_nanoseconds
+            self._cycles += 1
+            event.reschedule(Timestamp.from_nanoseconds(ns + self._high_ns))
+            self._net.take_high(self._handle)
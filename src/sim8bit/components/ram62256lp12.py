@@ -1,7 +1,7 @@
 from typing import Optional
 
-from ..events import EventScheduler, Timestamp
-from ..memory import ReadWriteMemory
+from ..events import Event, EventScheduler, Timestamp
+from ..memory import ArrayMemory, MemoryImage
 from ..error import UndefinedBehavior, FloatingNetError
 from ..wire import (
     BusMember,
@@ -9,11 +9,26 @@ from ..wire import (
     Net,
     NetChangeCallback,
     NetState,
+    Sensitivity,
+    SensitivityGroup,
 )
+from .timing import TimedComponent
 
 
-class RAM62256LP12(ReadWriteMemory):
-    """A 62256LP12 SRAM chip."""
+class RAM62256LP12(ArrayMemory, TimedComponent):
+    """
+    A 62256LP12 SRAM chip.
+
+    The timing constants are compiled into ``timing``;
+    input change times are kept in integer nanoseconds.
+
+    The chip can switch at any time between timed mode, which models
+    the read delays and checks every write cycle, and a fast mode;
+    see ``fast``.
+    """
+
+    SIZE = 32768
+    """Number of bytes of storage."""
 
     MAX_TIME_ADDR_SET_TO_DATA_OUT_NS = 120
     """Max time for address change to propagate to output."""
@@ -43,7 +58,9 @@ class RAM62256LP12(ReadWriteMemory):
         chip_select_inv: Net,
         output_enable_inv: Net,
         write_enable_inv: Net,
-        image: Optional[dict[int, int]] = None,
+        image: Optional[MemoryImage] = None,
+        fast: bool = False,
+        check_interval: int = 0,
     ):
         """
         Initialize the chip.
@@ -54,8 +71,15 @@ class RAM62256LP12(ReadWriteMemory):
         :param chip_select_inv: The active low chip select net.
         :param output_enable_inv: The active low output enable net.
         :param write_enable_inv: The active low write enable net.
-        :param image: An optional starting memory image.
+        :param image: An optional starting memory image,
+            either a mapping of addresses to values,
+            a bytes-like object loaded at address zero,
+            or a memory such as a MappedMemory (see ArrayMemory).
+        :param fast: If True, start in fast mode.
+        :param check_interval: In fast mode, check the timing of
+            every this many writes, or never if zero.
         """
+        super().__init__(self.SIZE, image)
         self._sched = sched
 
         self._addr = addr
@@ -64,46 +88,203 @@ class RAM62256LP12(ReadWriteMemory):
         self._oe_inv = output_enable_inv
         self._we_inv = write_enable_inv
 
-        self._cs_stamp = Timestamp()
-        self._oe_stamp = Timestamp()
-        self._we_stamp = Timestamp()
-        self._addr_stamp = Timestamp()
-        self._data_stamp = Timestamp()
+        self._cs_ns = 0
+        self._oe_ns = 0
+        self._we_ns = 0
+        self._addr_ns = 0
+        self._data_ns = 0
+
+        self._output_event: Optional[Event] = None
+        self._float_event: Optional[Event] = None
+
+        self._fast = False
+        self.check_interval = check_interval
+        """In fast mode, check the timing of every this many writes (0 = never)."""
+        self._writes_until_check = check_interval
 
         self._cs_inv.add_listener(NetChangeCallback(self._cs_inv_did_change))
         self._oe_inv.add_listener(NetChangeCallback(self._oe_inv_did_change))
         self._we_inv.add_listener(NetChangeCallback(self._we_inv_did_change))
-        self._data.add_listener(BusValueCallback(self._data_did_change))
-        self._addr.add_listener(BusValueCallback(self._addr_did_change))
+        # Address and data changes only matter while the chip is selected.
+        self._selected = SensitivityGroup(self._cs_inv.state == NetState.LOW)
+        selected = Sensitivity(group=self._selected)
+        self._data.add_listener(BusValueCallback(self._data_did_change), selected)
+        self._addr.add_listener(BusValueCallback(self._addr_did_change), selected)
+        self.fast = fast
+
+    @property
+    def fast(self) -> bool:
+        """
+        True if the chip is in fast mode.
 
-        self._memory = image or {}
+        In fast mode a read puts data on the bus as soon as the chip
+        is selected with outputs enabled, outputs float as soon as they
+        are disabled, and writes skip the timing checks except every
+        ``check_interval`` writes. Input change times are still kept,
+        so switching back to timed mode in mid-cycle is safe.
 
-    def peek(self, addr: int) -> int:  # noqa:D102
-        return self._memory.get(addr, 0)
+        Cycles driven through the nets still pay for every net and bus
+        callback. A testbench or processor model that does not need
+        the nets can apply whole cycles with ``read_cycle`` and
+        ``write_cycle`` instead.
+        """
+        return self._fast
 
-    def poke(self, addr: int, value: int):  # noqa:D102
-        self._memory[addr] = value
+    @fast.setter
+    def fast(self, fast: bool):
+        if fast == self._fast:
+            return
+        self._fast = fast
+        self._writes_until_check = self.check_interval
+        if fast:
+            # Apply any pending output change now.
+            float_event = self._float_event
+            if float_event is not None and float_event.pending:
+                float_event.cancel()
+                self._data.float_()
+            self._schedule_output_update()
+
+    def read_cycle(self, addr: int) -> int:
+        """
+        Apply a whole read cycle in fast mode, without the nets.
+
+        :param addr: The address.
+        :returns: The byte a read cycle would put on the data bus.
+        :raises RuntimeError: If the chip is not in fast mode,
+            or is selected through its nets.
+        :raises IndexError: If the address is out of range.
+        """
+        self._check_direct_cycle(addr)
+        return self._memory[addr]
+
+    def write_cycle(self, addr: int, value: int):
+        """
+        Apply a whole write cycle in fast mode, without the nets.
+
+        :param addr: The address.
+        :param value: The byte to write.
+        :raises RuntimeError: If the chip is not in fast mode,
+            or is selected through its nets.
+        :raises IndexError: If the address is out of range.
+        """
+        self._check_direct_cycle(addr)
+        self._writable()[addr] = value
+
+    def _check_direct_cycle(self, addr: int):
+        """
+        Check that a cycle can be applied without the nets.
+
+        :param addr: The address of the cycle.
+        :raises RuntimeError: If the chip is not in fast mode,
+            or a cycle through the nets is in progress.
+        :raises IndexError: If the address is out of range.
+        """
+        if not self._fast:
+            raise RuntimeError("Direct bus cycles need fast mode.")
+        if self._cs_inv.state == NetState.LOW:
+            raise RuntimeError("Chip is selected through its nets.")
+        if not 0 <= addr < self.SIZE:
+            raise IndexError(f"Address {addr} is out of range.")
+
+    def snapshot(self) -> tuple[memoryview, int, int, int, int, int, bool]:
+        """
+        Capture the memory contents and input change times.
+
+        The memory is shared copy-on-write (see ``snapshot_memory``).
+        Pending events and net states are captured by the scheduler
+        and nets.
+
+        :returns: The snapshot.
+        """
+        return (
+            self.snapshot_memory(),
+            self._cs_ns,
+            self._oe_ns,
+            self._we_ns,
+            self._addr_ns,
+            self._data_ns,
+            self._selected.enabled,
+        )
+
+    def restore(self, snapshot: tuple[memoryview, int, int, int, int, int, bool]):
+        """
+        Return to a captured state.
+
+        :param snapshot: The snapshot.
+        """
+        (
+            memory,
+            self._cs_ns,
+            self._oe_ns,
+            self._we_ns,
+            self._addr_ns,
+            self._data_ns,
+            self._selected.enabled,
+        ) = snapshot
+        self.restore_memory(memory)
+
+    def _schedule_output_update(self):
+        """
+        Schedule a possible data output.
+
+        At most one output update is pending per chip. It is placed
+        at the earliest time all read delays since the last address,
+        chip select and output enable changes have elapsed.
+        Nothing is scheduled unless the chip is selected and
+        outputs are enabled.
+        """
+        if self._oe_inv.state != NetState.LOW or self._cs_inv.state != NetState.LOW:
+            self._cancel_output_update()
+            return
+        if self._fast:
+            self._cancel_output_update()
+            # A floating address drives nothing yet; its change will.
+            if self._addr.value != NetState.FLOATING:
+                self._data.write(self._memory[self._addr.value])
+            return
+        timing = self.timing
+        ready_ns = max(
+            self._addr_ns + timing.max_addr_set_to_data_out,
+            self._cs_ns + timing.max_selected_to_data_out,
+            self._oe_ns + timing.max_out_enabled_to_data_out,
+        )
+        event = self._output_event
+        if event is None:
+            self._output_event = self._sched.submit(
+                Timestamp.from_nanoseconds(ready_ns), self._output_is_due
+            )
+        elif not event.pending or event.stamp.total_nanoseconds != ready_ns:
+            event.reschedule(Timestamp.from_nanoseconds(ready_ns))
+
+    def _cancel_output_update(self):
+        """Cancel any pending data output."""
+        if self._output_event is not None:
+            self._output_event.cancel()
+
+    def _output_is_due(self, _: Timestamp):
+        """Handle the pending output update event."""
+        self._put_output_data_if_ready()
+
+    def _float_is_due(self, _: Timestamp):
+        """Handle the pending data float event."""
+        self._data.float_()
 
     def _put_output_data_if_ready(self):
         """Put memory data on the bus if ready."""
         if self._oe_inv.state == NetState.LOW and self._cs_inv.state == NetState.LOW:
+            now = self._sched.now_ns
+            timing = self.timing
             output_ready = True
-            if (self._sched.now - self._addr_stamp) < Timestamp(
-                nanoseconds=self.MAX_TIME_ADDR_SET_TO_DATA_OUT_NS
-            ):
+            if now - self._addr_ns < timing.max_addr_set_to_data_out:
                 output_ready = False
-            elif (self._sched.now - self._oe_stamp) < Timestamp(
-                nanoseconds=self.MAX_TIME_OUT_ENABLED_TO_DATA_OUT_NS
-            ):
+            elif now - self._oe_ns < timing.max_out_enabled_to_data_out:
                 output_ready = False
-            elif (self._sched.now - self._cs_stamp) < Timestamp(
-                nanoseconds=self.MAX_TIME_SELECTED_TO_DATA_OUT_NS
-            ):
+            elif now - self._cs_ns < timing.max_selected_to_data_out:
                 output_ready = False
             if output_ready:
                 if self._addr.value == NetState.FLOATING:
                     raise FloatingNetError
-                self._data.write(self._memory.get(self._addr.value, 0))
+                self._data.write(self._memory[self._addr.value])
 
     def _cs_inv_did_change(self, value: NetState):
         """
@@ -112,16 +293,24 @@ class RAM62256LP12(ReadWriteMemory):
         If chip select goes low, submit an event to possibly
         put data on the bus after the worst case delay.
 
+        Address and data changes are not seen while the chip is
+        deselected (see SensitivityGroup), so they are taken to change
+        when it is selected.
+        This is exact while the address and data times do not exceed
+        the chip select times, as in the datasheet; otherwise it is
+        pessimistic.
+
         :param value: The new chip select value.
         """
-        self._cs_stamp = self._sched.now
+        self._cs_ns = self._sched.now_ns
         # Schedule a possible data output
         if value == NetState.LOW:
-            self._sched.submit(
-                self._sched.now
-                + Timestamp(nanoseconds=self.MAX_TIME_SELECTED_TO_DATA_OUT_NS),
-                lambda _: self._put_output_data_if_ready(),
-            )
+            self._selected.enabled = True
+            self._addr_ns = self._data_ns = self._cs_ns
+            self._schedule_output_update()
+        else:
+            self._selected.enabled = False
+            self._cancel_output_update()
 
     def _oe_inv_did_change(self, value: NetState):
         """
@@ -135,22 +324,27 @@ class RAM62256LP12(ReadWriteMemory):
 
         :param value: The new output enable value.
         """
-        self._oe_stamp = self._sched.now
+        self._oe_ns = self._sched.now_ns
         if value == NetState.HIGH:
             # Output disabled. Float the data in the future.
-            self._sched.submit(
-                self._sched.now
-                + Timestamp(nanoseconds=self.MAX_TIME_OUT_DISABLED_TO_DATA_HIGHZ_NS),
-                lambda _: self._data.float_(),
+            self._cancel_output_update()
+            if not self._data.driving:
+                return
+            if self._fast:
+                self._data.float_()
+                return
+            stamp = Timestamp.from_nanoseconds(
+                self._oe_ns + self.timing.max_out_disabled_to_data_highz
             )
+            # A pending float is already due sooner, so keep it.
+            if self._float_event is None:
+                self._float_event = self._sched.submit(stamp, self._float_is_due)
+            elif not self._float_event.pending:
+                self._float_event.reschedule(stamp)
         else:
             # Output enabled. Update the output in the future.
             # TODO: What if /WE is low? Raise error?
-            self._sched.submit(
-                self._sched.now
-                + Timestamp(nanoseconds=self.MAX_TIME_OUT_ENABLED_TO_DATA_OUT_NS),
-                lambda _: self._put_output_data_if_ready(),
-            )
+            self._schedule_output_update()
 
     def _we_inv_did_change(self, value: NetState):
         """
@@ -170,34 +364,13 @@ class RAM62256LP12(ReadWriteMemory):
         ):
             # CS = L, OE = H, WE = H
             # Finished possible write pulse, so check the timings
-            chip_select_low_time = self._sched.now - self._cs_stamp
-            write_enable_low_time = self._sched.now - self._we_stamp
-            addr_stable_time = self._sched.now - self._addr_stamp
-            data_overlap_time = self._sched.now - self._data_stamp
-            if chip_select_low_time < Timestamp(
-                nanoseconds=self.MIN_TIME_SELECTED_TO_END_WRITE_NS
-            ):
-                raise UndefinedBehavior(
-                    "Attempted write with insufficient /CS low time"
-                )
-            if write_enable_low_time < Timestamp(
-                nanoseconds=self.MIN_TIME_WRITE_PULSE_NS
-            ):
-                raise UndefinedBehavior(
-                    "Attempted write with insufficient /WE low time"
-                )
-            if addr_stable_time < Timestamp(
-                nanoseconds=self.MIN_TIME_ADDR_SET_TO_END_WRITE_NS
-            ):
-                raise UndefinedBehavior(
-                    "Attempted write with insufficient addr stable time"
-                )
-            if data_overlap_time < Timestamp(
-                nanoseconds=self.MIN_TIME_DATA_TO_END_WRITE_NS
-            ):
-                raise UndefinedBehavior(
-                    "Attempted write with insufficient data stable time"
-                )
+            if not self._fast:
+                self._check_write_timing()
+            elif self.check_interval:
+                self._writes_until_check -= 1
+                if self._writes_until_check <= 0:
+                    self._writes_until_check = self.check_interval
+                    self._check_write_timing()
 
             # Valid write, but check for valid data.
             if (
@@ -205,7 +378,7 @@ class RAM62256LP12(ReadWriteMemory):
                 or self._addr.value == NetState.FLOATING
             ):
                 raise FloatingNetError
-            self._memory[self._addr.value] = self._data.value
+            self._writable()[self._addr.value] = self._data.value
         elif self._cs_inv.state == NetState.HIGH:
             # CS = H, OE = X, WE = X
             # Do nothing if chip select is high
@@ -220,7 +393,28 @@ class RAM62256LP12(ReadWriteMemory):
             # Start of legal write
             pass
 
-        self._we_stamp = self._sched.now
+        self._we_ns = self._sched.now_ns
+
+    def _check_write_timing(self):
+        """
+        Check the timing of a write cycle ending now.
+
+        :raises UndefinedBehavior: If a minimum time was not met.
+        """
+        now = self._sched.now_ns
+        timing = self.timing
+        if now - self._cs_ns < timing.min_selected_to_end_write:
+            raise UndefinedBehavior("Attempted write with insufficient /CS low time")
+        if now - self._we_ns < timing.min_write_pulse:
+            raise UndefinedBehavior("Attempted write with insufficient /WE low time")
+        if now - self._addr_ns < timing.min_addr_set_to_end_write:
+            raise UndefinedBehavior(
+                "Attempted write with insufficient addr stable time"
+            )
+        if now - self._data_ns < timing.min_data_to_end_write:
+            raise UndefinedBehavior(
+                "Attempted write with insufficient data stable time"
+            )
 
     def _addr_did_change(self, _):
         """
@@ -229,13 +423,10 @@ class RAM62256LP12(ReadWriteMemory):
         Submit an event to possibly put data on the bus
         after the worst case delay.
         """
-        self._addr_stamp = self._sched.now
+        self._addr_ns = self._sched.now_ns
         # Schedule a possible data output
-        self._sched.submit(
-            self._sched.now + Timestamp(0, self.MAX_TIME_ADDR_SET_TO_DATA_OUT_NS),
-            lambda _: self._put_output_data_if_ready(),
-        )
+        self._schedule_output_update()
 
     def _data_did_change(self, _):
         """Handle changes to the data inputs."""
-        self._data_stamp = self._sched.now
+        self._data_ns = self._sched.now_ns
@@ -0,0 +1,82 @@
+from __future__ import annotations
+
+import re
+from typing import ClassVar, Iterator, Mapping
+
+_PARAMETER = re.compile(r"^(MAX|MIN)_TIME_(\w+)_NS$")
+
+
+class TimingTable(Mapping[str, int]):
+    """
+    The timing parameters of a component in integer nanoseconds.
+
+    Parameters are available both by name and as attributes,
+    so hot paths can compare elapsed nanoseconds directly
+    against them without building timestamps.
+    """
+
+    def __init__(self, parameters: Mapping[str, int]):
+        """
+        Create the table.
+
+        :param parameters: The parameters by name.
+        """
+        self._parameters = dict(parameters)
+        for name, value in self._parameters.items():
+            setattr(self, name, value)
+
+    @classmethod
+    def from_class(cls, component: type) -> TimingTable:
+        """
+        Compile the timing constants of a component class.
+
+        Every ``MAX_TIME_<NAME>_NS`` or ``MIN_TIME_<NAME>_NS`` class
+        constant, including inherited ones, becomes a parameter named
+        ``max_<name>`` or ``min_<name>`` in lower case.
+
+        :param component: The component class.
+        :returns: The table.
+        """
+        parameters = {}
+        for attr in dir(component):
+            match = _PARAMETER.match(attr)
+            if match is not None:
+                name = f"{match[1]}_{match[2]}".lower()
+                parameters[name] = int(getattr(component, attr))
+        return cls(parameters)
+
+    def __getitem__(self, name: str) -> int:  # noqa:D105
+        return self._parameters[name]
+
+    def __iter__(self) -> Iterator[str]:  # noqa:D105
+        return iter(self._parameters)
+
+    def __len__(self) -> int:  # noqa:D105
+        return len(self._parameters)
+
+    def __getattr__(self, name: str) -> int:  # noqa:D105
+        # Only reached for names that are not parameters.
+        raise AttributeError(f"No timing parameter {name!r}.")
+
+    def __repr__(self) -> str:  # noqa:D105
+        return f"TimingTable({self._parameters!r})"
+
+
+class TimedComponent:
+    """
+    A component with a per-class timing table.
+
+    Subclasses declare their timing as ``MAX_TIME_<NAME>_NS`` and
+    ``MIN_TIME_<NAME>_NS`` class constants. The constants are compiled
+    into ``timing`` once when the class is created, so a variant that
+    overrides some constants (for example a different speed grade)
+    gets its own table.
+    """
+
+    timing: ClassVar[TimingTable] = TimingTable({})
+    """The compiled timing parameters of the class."""
+
+    def __init_subclass__(cls, **kwargs):
+        """Compile the timing table of a new subclass."""
+        super().__init_subclass__(**kwargs)
+        cls.timing = TimingTable.from_class(cls)
@@ -1,5 +1,17 @@
 # flake8: noqa: F401
 from ._event import Event
 from ._event_handler import EventHandler
-from ._event_scheduler import EventScheduler
+from ._event_scheduler import EventScheduler, SchedulerSnapshot
+from ._process import (
+    Condition,
+    Process,
+    ProcessGenerator,
+    change,
+    falling,
+    rising,
+)
+from ._profiler import EventProfiler
+from ._queue import EventQueue, HeapQueue, TimingWheelQueue
+from ._run_stats import RunStats
 from ._timestamp import Timestamp
+from ._trace import EventTrace, TraceRecord
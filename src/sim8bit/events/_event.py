@@ -1,12 +1,71 @@
-import dataclasses
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any, Optional
 
 from ._event_handler import EventHandler
 from ._timestamp import Timestamp
 
+if TYPE_CHECKING:  # pragma: nocover
+    from ._event_scheduler import EventScheduler
+
 
-@dataclasses.dataclass
 class Event:
-    """An event with timestamp and handler."""
+    """
+    An event with timestamp, handler and handler arguments.
+
+    Events returned by ``EventScheduler.submit`` act as handles
+    that can cancel or reschedule the event. Rescheduling an event
+    that already ran re-arms the same object, so components can
+    keep one event per recurring action.
+    """
+
+    __slots__ = ("stamp", "handler", "args", "_scheduler", "_sequence")
+
+    def __init__(
+        self,
+        stamp: Timestamp,
+        handler: EventHandler,
+        args: tuple[Any, ...] = (),
+        scheduler: Optional[EventScheduler] = None,
+        sequence: int = -1,
+    ):
+        """
+        Create the event.
+
+        :param stamp: The timestamp when the event should occur.
+        :param handler: The handler to be called to process the event.
+        :param args: Extra arguments passed to the handler after the timestamp.
+        :param scheduler: The scheduler the event was submitted to.
+        :param sequence: The queue sequence while pending, otherwise -1.
+        """
+        self.stamp = stamp
+        self.handler = handler
+        self.args = args
+        self._scheduler = scheduler
+        self._sequence = sequence
+
+    def __repr__(self) -> str:  # noqa:D105
+        return f"Event(stamp={self.stamp!r}, handler={self.handler!r})"
+
+    @property
+    def pending(self) -> bool:
+        """True if the event is waiting in a scheduler queue."""
+        return self._sequence >= 0
+
+    def cancel(self):
+        """Cancel the event if it is pending."""
+        if self._scheduler is not None:
+            self._scheduler.cancel(self)
+
+    def reschedule(self, stamp: Timestamp):
+        """
+        Move the event to a new timestamp.
+
+        Events that already ran or were cancelled are re-armed.
 
-    stamp: Timestamp
-    handler: EventHandler
+        :param stamp: The new event timestamp.
+        :raises RuntimeError: If the event was never submitted.
+        """
+        if self._scheduler is None:
+            raise RuntimeError("Event was not submitted to a scheduler.")
+        self._scheduler.reschedule(self, stamp)
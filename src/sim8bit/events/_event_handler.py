@@ -1,3 +1,5 @@
+from typing import Any
+
 from typing_extensions import Protocol
 
 from ._timestamp import Timestamp
@@ -6,10 +8,11 @@ from ._timestamp import Timestamp
 class EventHandler(Protocol):  # pragma: nocover
     """A generic event handler."""
 
-    def __call__(self, __stamp: Timestamp):
+    def __call__(self, __stamp: Timestamp, *args: Any):
         """
         Handle an event.
 
         :param __stamp: The timestamp of the event.
+        :param args: The extra arguments the event was submitted with.
         """
         ...
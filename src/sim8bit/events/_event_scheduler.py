@@ -1,26 +1,136 @@
-import logging
+import itertools
+import math
+from typing import Any, Callable, NamedTuple, Optional
 
+from ..wire import Net, _delta
 from ._event import Event
 from ._event_handler import EventHandler
+from ._profiler import EventProfiler
+from ._queue import EventQueue, HeapQueue
+from ._run_stats import RunStats
 from ._timestamp import Timestamp
+from ._trace import EventTrace
 
-_logger = logging.getLogger(__name__)
+
+_claimed_suppressed = 0
+"""The suppressed notifications already reported by finished runs."""
+
+
+class SchedulerSnapshot(NamedTuple):
+    """The captured state of an event scheduler."""
+
+    now: Timestamp
+    """The scheduler time."""
+    sequence: int
+    """The next insertion sequence number."""
+    entries: tuple[tuple[int, int, Event, Timestamp, EventHandler, tuple], ...]
+    """The pending queue entries with each event's timestamp, handler and args."""
 
 
 class EventScheduler:
     """An event scheduler and loop."""
 
-    def __init__(self):
-        """Create the scheduler."""
-        self._events: list[Event] = []
+    MAX_DELTA_CYCLES = 10000
+    """The most delta cycles at one timestamp before the circuit is unstable."""
+
+    def __init__(
+        self, queue: Optional[EventQueue] = None, delta_cycles: bool = False
+    ):
+        """
+        Create the scheduler.
+
+        :param queue: The event queue to use. Defaults to a heap queue.
+        :param delta_cycles: If True, process events in delta cycles;
+            see ``delta_cycles``.
+        """
+        self.delta_cycles = delta_cycles
+        """
+        True to process all events at a timestamp as one step.
+
+        Net notifications are deferred while the events run. Then each
+        changed net notifies its listeners once with its final state,
+        and bus members once per step, so nets that change back within
+        the step do not glitch. Events and net changes caused by the
+        listeners at the same timestamp run as further delta cycles
+        until the circuit settles. ``tick`` then processes one timestamp.
+        If False, each event notifies as it runs, in FIFO order.
+        Deferral applies to every net in the process while this
+        scheduler steps, except during runs of other schedulers
+        nested in its handlers; see ``wire/_delta.py``.
+        """
+        self._events = queue if queue is not None else HeapQueue()
+        self._sequence = itertools.count()
+        self._pending = 0
         self._now = Timestamp()
+        self._trace: Optional[EventTrace] = None
+        self._profiler: Optional[EventProfiler] = None
+        self._hook: Optional[Callable[[int, Event], None]] = None
+
+    @property
+    def trace(self) -> Optional[EventTrace]:
+        """
+        The event trace, or None if tracing is disabled.
+
+        Set to an EventTrace to record every dispatched event.
+        """
+        return self._trace
+
+    @trace.setter
+    def trace(self, trace: Optional[EventTrace]):
+        self._trace = trace
+        self._update_hook()
+
+    @property
+    def profiler(self) -> Optional[EventProfiler]:
+        """
+        The event profiler, or None if profiling is disabled.
+
+        Set to a profiler to have it dispatch every event.
+        """
+        return self._profiler
+
+    @profiler.setter
+    def profiler(self, profiler: Optional[EventProfiler]):
+        self._profiler = profiler
+        self._update_hook()
+
+    def _update_hook(self):
+        """Select how events are dispatched for the current observers."""
+        if self._trace is None and self._profiler is None:
+            self._hook = None
+        else:
+            self._hook = self._dispatch_observed
+
+    def _dispatch_observed(self, ns: int, event: Event):
+        """
+        Dispatch an event through the trace and profiler.
+
+        :param ns: The event timestamp in nanoseconds.
+        :param event: The event.
+        """
+        if self._trace is not None:
+            self._trace.record((ns, event.handler))
+        if self._profiler is not None:
+            self._profiler.dispatch(event)
+        else:
+            event.handler(event.stamp, *event.args)
 
     @property
     def now(self) -> Timestamp:
         """The current scheduler timestamp."""
         return self._now
 
-    def submit(self, stamp: Timestamp, handler: EventHandler):
+    @property
+    def pending(self) -> int:
+        """The number of pending events."""
+        return self._pending
+
+    @property
+    def now_ns(self) -> int:
+        """The current scheduler timestamp in nanoseconds."""
+        return self._now._ns
+
+    def submit(self, stamp: Timestamp, handler: EventHandler, *args: Any) -> Event:
         """
         Submit a new event.
 
@@ -32,31 +142,333 @@ class EventScheduler:
 
         :param stamp: The timestamp when the event should occur.
         :param handler: The handler to be called to process the event.
+        :param args: Extra arguments to pass to the handler after the timestamp,
+            so a preallocated handler such as a bound method can be reused
+            instead of wrapping each call in a new closure.
+        :returns: The event, which can be used to cancel or reschedule it.
         """
-        insert_at = -1
-        for i, e in enumerate(self._events):
-            if stamp < e.stamp:
-                insert_at = i
-                break
+        sequence = next(self._sequence)
+        event = Event(stamp, handler, args, self, sequence)
+        self._events.push((stamp._ns, sequence, event))
+        self._pending += 1
+        self._compact_if_sparse()
+        return event
 
-        if insert_at < 0:
-            self._events.append(Event(stamp, handler))
-        else:
-            self._events.insert(insert_at, Event(stamp, handler))
+    def cancel(self, event: Event):
+        """
+        Cancel a pending event.
+
+        Cancellation is lazy: the queue entry stays in place
+        and is discarded when it reaches the front.
+
+        :param event: The event to cancel.
+        """
+        if event._sequence >= 0:
+            event._sequence = -1
+            self._pending -= 1
+
+    def reschedule(self, event: Event, stamp: Timestamp):
+        """
+        Move an event to a new timestamp.
+
+        A pending event is moved; an event that already ran or was
+        cancelled is submitted again. Either way the event is ordered
+        after events already submitted for the same timestamp.
+
+        :param event: The event to reschedule.
+        :param stamp: The new event timestamp.
+        """
+        if event._sequence < 0:
+            self._pending += 1
+        sequence = next(self._sequence)
+        event._sequence = sequence
+        event.stamp = stamp
+        self._events.push((stamp._ns, sequence, event))
+        self._compact_if_sparse()
+
+    def _compact_if_sparse(self):
+        """Drop stale queue entries once they outnumber pending events."""
+        if len(self._events) > 2 * self._pending + 1024:
+            self._events.compact()
 
     def tick(self):
-        """Process one event."""
-        event = self._events.pop(0)
-        _logger.debug(
-            f"{event.stamp.seconds} sec {event.stamp.nanoseconds}"
-            + f" ns -- {event.handler}"
-        )
+        """
+        Process one event, or one timestamp in delta cycle mode.
+
+        :raises IndexError: If no events are pending.
+        """
+        if self.delta_cycles:
+            if self._step_deltas(math.inf, -1) < 0:
+                raise IndexError("No events are pending.")
+            return
+        ns, sequence, event = self._events.pop()
+        while event._sequence != sequence:
+            ns, sequence, event = self._events.pop()
+        event._sequence = -1
+        self._pending -= 1
         self._now = event.stamp
-        event.handler(event.stamp)
+        enclosing = _delta.suspend()
+        try:
+            if self._hook is None:
+                event.handler(event.stamp, *event.args)
+            else:
+                self._hook(ns, event)
+        finally:
+            _delta.end(enclosing)
+
+    def run_until(self, stamp: Timestamp) -> RunStats:
+        """
+        Process all events up to and including a timestamp.
+
+        Afterwards the scheduler time is advanced to the timestamp,
+        even if the queue ran dry before it.
+
+        :param stamp: The timestamp to run until.
+        :returns: The run statistics.
+        """
+        start = self._now
+        suppressed = _suppressed_mark()
+        events = self._run(stamp._ns, -1)
+        if self._now < stamp:
+            self._now = stamp
+        return self._run_stats(events, start, suppressed)
+
+    def run_for(self, duration: Timestamp) -> RunStats:
+        """
+        Process all events for a duration from the current time.
+
+        :param duration: The simulated time to run for.
+        :returns: The run statistics.
+        """
+        return self.run_until(self._now + duration)
+
+    def run_until_idle(self, max_events: Optional[int] = None) -> RunStats:
+        """
+        Process events until the queue is empty.
+
+        :param max_events: An optional limit on the number of events.
+        :returns: The run statistics.
+        """
+        start = self._now
+        suppressed = _suppressed_mark()
+        events = self._run(math.inf, -1 if max_events is None else max_events)
+        return self._run_stats(events, start, suppressed)
+
+    def run_while(
+        self, predicate: Callable[[], bool], max_events: Optional[int] = None
+    ) -> RunStats:
+        """
+        Process events while a predicate holds.
+
+        The predicate is checked before each event, or in delta cycle
+        mode before each timestamp, since the events at a timestamp
+        are processed as one step.
+
+        :param predicate: The condition to keep running.
+        :param max_events: An optional limit on the number of events.
+        :returns: The run statistics.
+        """
+        start = self._now
+        suppressed = _suppressed_mark()
+        pop_until = self._events.pop_until
+        hook = self._hook
+        remaining = -1 if max_events is None else max_events
+        events = 0
+        if self.delta_cycles:
+            while events != remaining and predicate():
+                step = self._step_deltas(math.inf, remaining - events)
+                if step < 0:
+                    break
+                events += step
+            return self._run_stats(events, start, suppressed)
+        enclosing = _delta.suspend()
+        try:
+            while events != remaining and predicate():
+                entry = pop_until(math.inf)
+                if entry is None:
+                    break
+                event = entry[2]
+                if event._sequence != entry[1]:
+                    continue
+                event._sequence = -1
+                self._pending -= 1
+                self._now = stamp = event.stamp
+                if hook is None:
+                    event.handler(stamp, *event.args)
+                else:
+                    hook(entry[0], event)
+                events += 1
+        finally:
+            _delta.end(enclosing)
+        return self._run_stats(events, start, suppressed)
+
+    def _run_stats(
+        self, events: int, start: Timestamp, suppressed: tuple[int, int]
+    ) -> RunStats:
+        """
+        Collect the statistics for a finished run.
+
+        The suppressed notifications counted by runs of other schedulers
+        nested in this one are left out, so each run reports only the
+        circuit it drove.
+
+        :param events: The number of events processed.
+        :param start: The scheduler time when the run started.
+        :param suppressed: The suppression mark from when the run started.
+        :returns: The run statistics.
+        """
+        global _claimed_suppressed
+        total, claimed = suppressed
+        own = Net.suppressed_notifications - total - (_claimed_suppressed - claimed)
+        _claimed_suppressed += own
+        return RunStats(events, start, self._now, own)
+
+    def _run(self, limit: float, max_events: int) -> int:
+        """
+        Process events in a tight loop.
+
+        :param limit: The latest event timestamp in nanoseconds to process.
+        :param max_events: The maximum number of events, or -1 for no limit.
+        :returns: The number of events processed.
+        """
+        if self.delta_cycles:
+            events = 0
+            while events != max_events:
+                step = self._step_deltas(limit, max_events - events)
+                if step < 0:
+                    break
+                events += step
+            return events
+
+        pop_until = self._events.pop_until
+        hook = self._hook
+        events = 0
+        # A run nested in a delta-mode handler notifies as it goes.
+        enclosing = _delta.suspend()
+        try:
+            while events != max_events:
+                entry = pop_until(limit)
+                if entry is None:
+                    break
+                event = entry[2]
+                if event._sequence != entry[1]:
+                    continue
+                event._sequence = -1
+                self._pending -= 1
+                self._now = stamp = event.stamp
+                if hook is None:
+                    event.handler(stamp, *event.args)
+                else:
+                    hook(entry[0], event)
+                events += 1
+        finally:
+            _delta.end(enclosing)
+        return events
+
+    def _step_deltas(self, limit: float, max_events: int) -> int:
+        """
+        Process all events at the next timestamp as delta cycles.
+
+        :param limit: The latest event timestamp in nanoseconds to process.
+        :param max_events: The maximum number of events, or a negative
+            number for no limit. Net changes still settle at the limit.
+        :returns: The number of events processed, or -1 if none were due.
+        :raises RuntimeError: If the circuit does not settle
+            within MAX_DELTA_CYCLES.
+        """
+        pop_until = self._events.pop_until
+        hook = self._hook
+        entry = pop_until(limit)
+        while entry is not None and entry[2]._sequence != entry[1]:
+            entry = pop_until(limit)
+        if entry is None:
+            return -1
+
+        ns = entry[0]
+        events = 0
+        deltas = 0
+        enclosing = _delta.begin()
+        try:
+            while True:
+                while entry is not None:
+                    event = entry[2]
+                    if event._sequence == entry[1]:
+                        event._sequence = -1
+                        self._pending -= 1
+                        self._now = stamp = event.stamp
+                        if hook is None:
+                            event.handler(stamp, *event.args)
+                        else:
+                            hook(ns, event)
+                        events += 1
+                        if events == max_events:
+                            break
+                    entry = pop_until(ns)
+                if not _delta.flush():
+                    break
+                deltas += 1
+                if deltas >= self.MAX_DELTA_CYCLES:
+                    raise RuntimeError(
+                        f"Circuit did not settle after {deltas} delta cycles"
+                        + f" at {self._now}."
+                    )
+                entry = pop_until(ns) if events != max_events else None
+        finally:
+            _delta.end(enclosing)
+        return events
+
+    def snapshot(self) -> SchedulerSnapshot:
+        """
+        Capture the scheduler time and pending events.
+
+        The events themselves are referenced, not copied, so the
+        snapshot can only be restored into the same simulation objects.
+
+        :returns: The snapshot.
+        """
+        sequence = next(self._sequence)
+        self._sequence = itertools.count(sequence)
+        entries = tuple(
+            (ns, seq, event, event.stamp, event.handler, event.args)
+            for ns, seq, event in self._events
+            if event._sequence == seq
+        )
+        return SchedulerSnapshot(self._now, sequence, entries)
+
+    def restore(self, snapshot: SchedulerSnapshot):
+        """
+        Return to a captured state.
+
+        Events pending now but not in the snapshot are cancelled,
+        and events in the snapshot are re-armed as they were.
+
+        :param snapshot: The snapshot.
+        """
+        for _, _, event in self._events:
+            event._sequence = -1
+        self._events.clear()
+        for ns, seq, event, stamp, handler, args in snapshot.entries:
+            event.stamp = stamp
+            event.handler = handler
+            event.args = args
+            event._sequence = seq
+            self._events.push((ns, seq, event))
+        self._pending = len(snapshot.entries)
+        self._now = snapshot.now
+        self._sequence = itertools.count(snapshot.sequence)
 
     @property
     def empty(self) -> bool:
         """
         True if the event queue is empty.
         """
-        return len(self._events) == 0
+        return self._pending == 0
+
+
+def _suppressed_mark() -> tuple[int, int]:
+    """
+    Mark the suppressed notification counts at the start of a run.
+
+    :returns: The process-wide total and the part of it already reported.
+    """
+    return Net.suppressed_notifications, _claimed_suppressed
@@ -0,0 +1,247 @@
+from __future__ import annotations
+
+import weakref
+from typing import Any, Generator, Optional, Union
+
+from ..wire import (
+    BusMember,
+    BusValueListener,
+    Net,
+    NetChangeListener,
+    NetState,
+    Sensitivity,
+    SensitivityGroup,
+)
+from ._event_scheduler import EventScheduler
+from ._timestamp import Timestamp
+
+
+class _Waiters(NetChangeListener, BusValueListener):
+    """
+    The processes waiting on one net or bus member.
+
+    One waiter list is attached as a listener the first time anything
+    waits on the signal, and reused by every later wait. It is in
+    a sensitivity group that is only enabled while a process waits,
+    so a bus member nothing else listens to stops tracking its nets,
+    and a clock nothing else listens to can be skipped.
+    """
+
+    def __init__(self, source: Union[Net, BusMember]):
+        """
+        Create the empty waiter list and attach it to a signal.
+
+        :param source: The net or bus member to watch.
+        :raises RuntimeError: If the signal is frozen in a Netlist.
+        """
+        self._waiting: list[tuple[Process, Optional[NetState]]] = []
+        self._group = SensitivityGroup(enabled=False)
+        source.add_listener(self, Sensitivity(group=self._group))
+
+    def on_change(self, value: Any):
+        """
+        Wake the processes waiting for the new value.
+
+        :param value: The new net state or bus value.
+        """
+        waiting, self._waiting = self._waiting, []
+        for process, state in waiting:
+            if state is None or state is value:
+                process._wake(value)
+            else:
+                self._waiting.append((process, state))
+        if not self._waiting:
+            self._group.enabled = False
+
+
+_waiters: weakref.WeakKeyDictionary[
+    Union[Net, BusMember], weakref.ReferenceType[_Waiters]
+] = weakref.WeakKeyDictionary()
+"""
+The waiter list of each net and bus member that was waited on.
+
+The signal's listener list keeps the waiter list alive. Holding it
+weakly here keeps its group from holding the signal alive.
+"""
+
+
+class Condition:
+    """
+    A signal change a process can wait for.
+
+    Conditions hold no per-wait state, so one condition can be
+    created up front and yielded on every iteration of a loop.
+    """
+
+    __slots__ = ("_source", "_state")
+
+    def __init__(self, source: Union[Net, BusMember], state: Optional[NetState]):
+        """
+        Create the condition.
+
+        :param source: The net or bus member to watch.
+        :param state: The net state to wait for, or None for any change.
+        """
+        self._source = source
+        self._state = state
+
+    def __repr__(self) -> str:  # noqa:D105
+        return f"Condition({self._source!r}, {self._state!r})"
+
+    def _arm(self, process: Process):
+        """
+        Wake a process on the next matching change.
+
+        :param process: The waiting process.
+        :raises RuntimeError: If the signal is frozen in a Netlist
+            and was not waited on before freezing.
+        """
+        ref = _waiters.get(self._source)
+        waiters = None if ref is None else ref()
+        if waiters is None:
+            waiters = _Waiters(self._source)
+            _waiters[self._source] = weakref.ref(waiters)
+        waiters._waiting.append((process, self._state))
+        waiters._group.enabled = True
+
+    def _disarm(self, process: Process):
+        """
+        Stop a process from waiting.
+
+        :param process: The waiting process.
+        """
+        waiters = _waiters[self._source]()
+        assert waiters is not None
+        waiters._waiting = [
+            entry for entry in waiters._waiting if entry[0] is not process
+        ]
+        if not waiters._waiting:
+            waiters._group.enabled = False
+
+
+def rising(net: Net) -> Condition:
+    """
+    Wait for a net to go high.
+
+    :param net: The net.
+    :returns: The condition.
+    """
+    return Condition(net, NetState.HIGH)
+
+
+def falling(net: Net) -> Condition:
+    """
+    Wait for a net to go low.
+
+    :param net: The net.
+    :returns: The condition.
+    """
+    return Condition(net, NetState.LOW)
+
+
+def change(source: Union[Net, BusMember]) -> Condition:
+    """
+    Wait for any change of a net or bus member.
+
+    :param source: The net or bus member.
+    :returns: The condition.
+    """
+    return Condition(source, None)
+
+
+ProcessGenerator = Generator[Union[Timestamp, Condition], Any, None]
+"""
+A process body.
+
+It yields a Timestamp to sleep for that duration, or a Condition
+to sleep until a signal changes. Waking on a condition sends the new
+net state or bus value into the generator; waking from a sleep sends None.
+"""
+
+
+class Process:
+    """
+    A generator run by the scheduler as a sequential process.
+
+    The process owns one event that is re-armed for each resumption,
+    so a process never has more than one pending event and stimulus
+    is generated as the simulation reaches it rather than up front.
+    Wakeups from conditions are scheduled at the current time, after
+    the events already due, so every listener sees a change before
+    the process reacts to it.
+    """
+
+    def __init__(
+        self,
+        sched: EventScheduler,
+        generator: ProcessGenerator,
+        start: Optional[Timestamp] = None,
+    ):
+        """
+        Create the process.
+
+        :param sched: The event scheduler.
+        :param generator: The process body.
+        :param start: The time of the first resumption. Defaults to now.
+        """
+        self._sched = sched
+        self._generator = generator
+        self._value: Any = None
+        self._waiting: Optional[Condition] = None
+        self._alive = True
+        self._event = sched.submit(
+            sched.now if start is None else start, self._resume
+        )
+
+    @property
+    def alive(self) -> bool:
+        """True until the process body returns or the process is stopped."""
+        return self._alive
+
+    def stop(self):
+        """Stop the process, closing its generator."""
+        if not self._alive:
+            return
+        self._alive = False
+        self._event.cancel()
+        if self._waiting is not None:
+            self._waiting._disarm(self)
+            self._waiting = None
+        self._generator.close()
+
+    def _wake(self, value: Any):
+        """
+        Resume the process at the current time.
+
+        :param value: The value to send into the generator.
+        """
+        self._waiting = None
+        self._value = value
+        self._event.reschedule(self._sched.now)
+
+    def _resume(self, stamp: Timestamp):
+        """
+        Run the process body to its next yield.
+
+        :param stamp: The current time.
+        :raises TypeError: If the body yields anything but
+            a Timestamp or a Condition.
+        """
+        value, self._value = self._value, None
+        try:
+            target = self._generator.send(value)
+        except StopIteration:
+            self._alive = False
+            return
+        except BaseException:
+            self._alive = False
+            raise
+        if isinstance(target, Timestamp):
+            self._event.reschedule(stamp + target)
+        elif isinstance(target, Condition):
+            self._waiting = target
+            target._arm(self)
+        else:
+            self._alive = False
+            self._generator.close()
+            raise TypeError(f"Process yielded {target!r}, not a delay or condition.")
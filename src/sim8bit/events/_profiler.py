@@ -0,0 +1,15 @@
+from typing_extensions import Protocol
+
+from ._event import Event
+
+
+class EventProfiler(Protocol):  # pragma: nocover
+    """A profiler that dispatches events on behalf of a scheduler."""
+
+    def dispatch(self, __event: Event):
+        """
+        Call the event handler, measuring it.
+
+        :param __event: The event to dispatch.
+        """
+        ...
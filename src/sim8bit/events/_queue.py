@@ -0,0 +1,226 @@
+import abc
+import bisect
+import collections
+import heapq
+import itertools
+from typing import Iterator, Optional
+
+from ._event import Event
+
+QueueEntry = tuple[int, int, Event]
+"""
+A queue entry of (timestamp in nanoseconds, insertion sequence, event).
+
+An entry is stale once its event has been cancelled or rescheduled,
+which leaves the event sequence different from the entry sequence.
+"""
+
+
+class EventQueue(metaclass=abc.ABCMeta):  # pragma: nocover
+    """A priority queue of pending events."""
+
+    def push(self, entry: QueueEntry):
+        """
+        Add an entry to the queue.
+
+        :param entry: The entry to add.
+        """
+        ...
+
+    def pop(self) -> QueueEntry:
+        """
+        Remove and return the entry with the smallest key.
+
+        Entries are ordered by timestamp, then by insertion sequence.
+
+        :returns: The next entry.
+        :raises IndexError: If the queue is empty.
+        """
+        ...
+
+    def pop_until(self, limit: float) -> Optional[QueueEntry]:
+        """
+        Remove and return the next entry if it is due by a limit.
+
+        :param limit: The latest timestamp in nanoseconds to return.
+        :returns: The next entry, or None if the queue is empty
+            or the next entry is later than the limit.
+        """
+        ...
+
+    def compact(self):
+        """Remove all stale entries."""
+        ...
+
+    def clear(self):
+        """Remove all entries."""
+        ...
+
+    def __iter__(self) -> Iterator[QueueEntry]:
+        """Iterate over all entries, including stale entries, in no order."""
+        ...
+
+    def __len__(self) -> int:
+        """Get the number of entries in the queue, including stale entries."""
+        ...
+
+
+class HeapQueue(EventQueue):
+    """An event queue backed by a binary heap with O(log n) push and pop."""
+
+    def __init__(self):
+        """Create the queue."""
+        self._heap: list[QueueEntry] = []
+
+    def push(self, entry: QueueEntry):  # noqa:D102
+        heapq.heappush(self._heap, entry)
+
+    def pop(self) -> QueueEntry:  # noqa:D102
+        return heapq.heappop(self._heap)
+
+    def pop_until(self, limit: float) -> Optional[QueueEntry]:  # noqa:D102
+        heap = self._heap
+        if heap and heap[0][0] <= limit:
+            return heapq.heappop(heap)
+        return None
+
+    def compact(self):  # noqa:D102
+        self._heap[:] = [e for e in self._heap if e[2]._sequence == e[1]]
+        heapq.heapify(self._heap)
+
+    def clear(self):  # noqa:D102
+        self._heap.clear()
+
+    def __iter__(self) -> Iterator[QueueEntry]:  # noqa:D105
+        return iter(self._heap)
+
+    def __len__(self) -> int:  # noqa:D105
+        return len(self._heap)
+
+
+class TimingWheelQueue(EventQueue):
+    """
+    An event queue backed by a timing wheel with O(1) push and pop.
+
+    The wheel has one slot per nanosecond over a window starting at the
+    last popped timestamp, so events a short delay ahead go straight
+    into their slot. A two-level bitmap of occupied slots, 64-bit words
+    and a summary of non-empty words, finds the next event.
+    Events beyond the window, or before it, go to an overflow heap.
+    Choose a window longer than the usual propagation delays.
+    """
+
+    def __init__(self, slots: int = 4096):
+        """
+        Create the queue.
+
+        :param slots: The window length in nanoseconds,
+            a power of two from 64 to 4096.
+        :raises ValueError: If slots is not a valid window length.
+        """
+        if not 64 <= slots <= 4096 or slots & (slots - 1):
+            raise ValueError("Slots must be a power of two from 64 to 4096.")
+        self._size = slots
+        self._mask = slots - 1
+        self._slots: list[collections.deque[QueueEntry]] = [
+            collections.deque() for _ in range(slots)
+        ]
+        self._words = [0] * (slots >> 6)
+        self._summary = 0
+        self._base = 0
+        self._overflow: list[QueueEntry] = []
+        self._count = 0
+
+    def push(self, entry: QueueEntry):  # noqa:D102
+        ns = entry[0]
+        self._count += 1
+        if not self._base <= ns < self._base + self._size:
+            heapq.heappush(self._overflow, entry)
+            return
+        i = ns & self._mask
+        slot = self._slots[i]
+        if not slot:
+            self._words[i >> 6] |= 1 << (i & 63)
+            self._summary |= 1 << (i >> 6)
+            slot.append(entry)
+        elif slot[-1][1] < entry[1]:
+            slot.append(entry)
+        else:
+            # Only restored entries arrive out of sequence order.
+            bisect.insort(slot, entry)
+
+    def pop(self) -> QueueEntry:  # noqa:D102
+        entry = self.pop_until(float("inf"))
+        if entry is None:
+            raise IndexError("pop from an empty queue")
+        return entry
+
+    def pop_until(self, limit: float) -> Optional[QueueEntry]:  # noqa:D102
+        summary = self._summary
+        overflow = self._overflow
+        if summary:
+            words = self._words
+            start = self._base & self._mask
+            w = start >> 6
+            ahead = words[w] >> (start & 63)
+            if ahead:
+                i = start + (ahead & -ahead).bit_length() - 1
+            else:
+                later = summary >> (w + 1)
+                if later:
+                    w += (later & -later).bit_length()
+                else:
+                    w = (summary & -summary).bit_length() - 1
+                word = words[w]
+                i = (w << 6) + (word & -word).bit_length() - 1
+            slot = self._slots[i]
+            entry = slot[0]
+            if not overflow or entry < overflow[0]:
+                if entry[0] > limit:
+                    return None
+                slot.popleft()
+                if not slot:
+                    w = i >> 6
+                    words[w] &= ~(1 << (i & 63))
+                    if not words[w]:
+                        self._summary = summary & ~(1 << w)
+                self._base = entry[0]
+                self._count -= 1
+                return entry
+        if overflow and overflow[0][0] <= limit:
+            entry = heapq.heappop(overflow)
+            if entry[0] > self._base:
+                self._base = entry[0]
+            self._count -= 1
+            return entry
+        return None
+
+    def compact(self):  # noqa:D102
+        self._words = [0] * len(self._words)
+        self._summary = 0
+        for i, slot in enumerate(self._slots):
+            if slot:
+                live = [e for e in slot if e[2]._sequence == e[1]]
+                slot.clear()
+                slot.extend(live)
+                if slot:
+                    self._words[i >> 6] |= 1 << (i & 63)
+                    self._summary |= 1 << (i >> 6)
+        self._overflow[:] = [e for e in self._overflow if e[2]._sequence == e[1]]
+        heapq.heapify(self._overflow)
+        self._count = len(self._overflow) + sum(map(len, self._slots))
+
+    def clear(self):  # noqa:D102
+        for slot in self._slots:
+            slot.clear()
+        self._words = [0] * len(self._words)
+        self._summary = 0
+        self._overflow.clear()
+        self._count = 0
+
+    def __iter__(self) -> Iterator[QueueEntry]:  # noqa:D105
+        slots = itertools.chain.from_iterable(self._slots)
+        return itertools.chain(slots, self._overflow)
+
+    def __len__(self) -> int:  # noqa:D105
+        return self._count
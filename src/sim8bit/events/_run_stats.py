@@ -0,0 +1,27 @@
+import dataclasses
+
+from ._timestamp import Timestamp
+
+
+@dataclasses.dataclass
+class RunStats:
+    """Statistics from one run of the event loop."""
+
+    events: int
+    """The number of events processed."""
+    start: Timestamp
+    """The scheduler time when the run started."""
+    end: Timestamp
+    """The scheduler time when the run stopped."""
+    suppressed_notifications: int = 0
+    """
+    The number of no-op net transitions that did not notify listeners.
+
+    Transitions inside runs of other schedulers nested in this run
+    are reported by those runs and not counted here.
+    """
+
+    @property
+    def elapsed(self) -> Timestamp:
+        """The simulated time advanced by the run."""
+        return self.end - self.start
@@ -1,53 +1,112 @@
 from __future__ import annotations
 
-import dataclasses
-import math
 from typing import Any
 
+NANOSECONDS_PER_SECOND = 1000000000
+
 
-@dataclasses.dataclass
 class Timestamp:
-    """A timestamp with nanosecond precision."""
+    """
+    A timestamp with nanosecond precision.
+
+    Timestamps are immutable and hashable. Internally a timestamp
+    is a single integer count of nanoseconds, so arithmetic and
+    comparisons are exact at any magnitude.
+    """
+
+    __slots__ = ("_ns",)
+
+    def __init__(self, seconds: int = 0, nanoseconds: int = 0):
+        """
+        Create the timestamp.
+
+        :param seconds: The whole seconds.
+        :param nanoseconds: The additional nanoseconds.
+            Values outside of one second carry into the seconds.
+        """
+        self._ns = seconds * NANOSECONDS_PER_SECOND + nanoseconds
+
+    @classmethod
+    def from_nanoseconds(cls, nanoseconds: int) -> Timestamp:
+        """
+        Create a timestamp from a total count of nanoseconds.
+
+        :param nanoseconds: The total nanoseconds.
+        :returns: The timestamp.
+        """
+        stamp = _new(cls)
+        stamp._ns = nanoseconds
+        return stamp
+
+    @property
+    def seconds(self) -> int:
+        """The whole seconds."""
+        return self._ns // NANOSECONDS_PER_SECOND
+
+    @property
+    def nanoseconds(self) -> int:
+        """The nanoseconds past the whole seconds, in [0, 1e9)."""
+        return self._ns % NANOSECONDS_PER_SECOND
+
+    @property
+    def total_nanoseconds(self) -> int:
+        """The total number of nanoseconds."""
+        return self._ns
+
+    def __repr__(self) -> str:  # noqa:D105
+        return f"Timestamp(seconds={self.seconds}, nanoseconds={self.nanoseconds})"
+
+    def __reduce__(self):  # noqa:D105
+        return (Timestamp, (0, self._ns))
 
-    seconds: int = 0
-    nanoseconds: int = 0
+    def __hash__(self) -> int:  # noqa:D105
+        return hash(self._ns)
 
     def __add__(self, other: Any) -> Timestamp:  # noqa:D105
         if not isinstance(other, Timestamp):
             return NotImplemented
 
-        nanosec = self.nanoseconds + other.nanoseconds
-        carry_seconds = math.floor(nanosec / 1000000000)
-        nanosec = nanosec % 1000000000
-        return Timestamp(self.seconds + other.seconds + carry_seconds, nanosec)
+        stamp = _new(Timestamp)
+        stamp._ns = self._ns + other._ns
+        return stamp
 
     def __sub__(self, other: Any) -> Timestamp:  # noqa:D105
         if not isinstance(other, Timestamp):
             return NotImplemented
 
-        nanosec = self.nanoseconds - other.nanoseconds
-        carry_seconds = math.floor(nanosec / 1000000000)
-        nanosec = nanosec % 1000000000
-        return Timestamp(self.seconds - other.seconds + carry_seconds, nanosec)
+        stamp = _new(Timestamp)
+        stamp._ns = self._ns - other._ns
+        return stamp
+
+    def __eq__(self, other: Any) -> bool:  # noqa:D105
+        if not isinstance(other, Timestamp):
+            return NotImplemented
+
+        return self._ns == other._ns
 
     def __gt__(self, other: Any) -> bool:  # noqa:D105
         if not isinstance(other, Timestamp):
             return NotImplemented
 
-        return self.seconds > other.seconds or (
-            self.seconds == other.seconds and self.nanoseconds > other.nanoseconds
-        )
+        return self._ns > other._ns
 
     def __lt__(self, other: Any) -> bool:  # noqa:D105
         if not isinstance(other, Timestamp):
             return NotImplemented
 
-        return self.seconds < other.seconds or (
-            self.seconds == other.seconds and self.nanoseconds < other.nanoseconds
-        )
+        return self._ns < other._ns
 
     def __ge__(self, other: Any) -> bool:  # noqa:D105
-        return self > other or self == other
+        if not isinstance(other, Timestamp):
+            return NotImplemented
+
+        return self._ns >= other._ns
 
     def __le__(self, other: Any) -> bool:  # noqa:D105
-        return self < other or self == other
+        if not isinstance(other, Timestamp):
+            return NotImplemented
+
+        return self._ns <= other._ns
+
+
+_new = object.__new__
@@ -0,0 +1,63 @@
+import collections
+from typing import Iterator, NamedTuple, TextIO
+
+from ._event_handler import EventHandler
+from ._timestamp import Timestamp
+
+
+class TraceRecord(NamedTuple):
+    """A dispatched event."""
+
+    stamp: Timestamp
+    """The event timestamp."""
+    handler: EventHandler
+    """The handler that processed the event."""
+
+
+class EventTrace:
+    """
+    A ring buffer of dispatched events.
+
+    Attach to a scheduler with ``EventScheduler.trace``.
+    Recording only stores the raw timestamp and handler;
+    formatting is deferred until the trace is read.
+    """
+
+    def __init__(self, capacity: int = 4096):
+        """
+        Create the trace.
+
+        :param capacity: The number of most recent events to keep.
+        """
+        self._records: collections.deque[tuple[int, EventHandler]] = (
+            collections.deque(maxlen=capacity)
+        )
+        self.record = self._records.append
+        """Record a (timestamp in nanoseconds, handler) pair."""
+
+    @property
+    def capacity(self) -> int:
+        """The number of most recent events kept."""
+        return self._records.maxlen or 0
+
+    def __len__(self) -> int:
+        """Get the number of recorded events."""
+        return len(self._records)
+
+    def __iter__(self) -> Iterator[TraceRecord]:
+        """Iterate over the recorded events, oldest first."""
+        for ns, handler in self._records:
+            yield TraceRecord(Timestamp.from_nanoseconds(ns), handler)
+
+    def clear(self):
+        """Discard all recorded events."""
+        self._records.clear()
+
+    def dump(self, stream: TextIO):
+        """
+        Write the recorded events as text, one per line.
+
+        :param stream: The stream to write to.
+        """
+        for stamp, handler in self:
+            stream.write(f"{stamp.seconds} sec {stamp.nanoseconds} ns -- {handler}\n")
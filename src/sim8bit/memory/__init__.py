@@ -1,2 +1,4 @@
 # flake8: noqa: F401
+from ._array import ArrayMemory, MemoryImage
 from ._interface import ReadableMemory, ReadWriteMemory
+from ._mapped import MappedMemory
@@ -0,0 +1,117 @@
+from typing import Optional, Union
+
+from typing_extensions import Buffer
+
+from ._interface import ReadableMemory, ReadWriteMemory
+
+MemoryImage = Union[dict[int, int], Buffer, ReadableMemory]
+"""A memory image as an address-to-value mapping, bytes-like object or memory."""
+
+
+class ArrayMemory(ReadWriteMemory):
+    """
+    Byte-addressed memory backed by a contiguous buffer.
+
+    The buffer is a private bytearray unless the memory is
+    created over a shared image; see ``__init__``.
+
+    Snapshots share the buffer copy-on-write: the first write after
+    ``snapshot_memory`` or ``restore_memory`` copies the buffer once,
+    so taking a snapshot does not copy the memory. Views obtained with
+    ``view`` or ``dump`` before a snapshot must not be used after it.
+    """
+
+    def __init__(self, size: int, image: Optional[MemoryImage] = None):
+        """
+        Create the memory.
+
+        :param size: The number of bytes.
+        :param image: An optional starting memory image,
+            either a mapping of addresses to values,
+            a bytes-like object loaded at address zero,
+            or a memory. A memory with a writable view of the same size
+            (such as a copy-on-write MappedMemory) is used in place
+            without copying; any other memory is copied.
+        """
+        self._shared = False
+        if isinstance(image, ReadableMemory):
+            source = image.view()
+            if not source.readonly and len(source) == size:
+                self._memory: Union[bytearray, memoryview] = source
+                self._view = source
+                return
+            image = source
+
+        self._memory = bytearray(size)
+        self._view = memoryview(self._memory)
+        if isinstance(image, dict):
+            for addr, value in image.items():
+                self._memory[addr] = value
+        elif image is not None:
+            self.load(0, image)
+
+    def __len__(self) -> int:
+        """Get the number of bytes."""
+        return len(self._memory)
+
+    def peek(self, addr: int) -> int:  # noqa:D102
+        return self._memory[addr]
+
+    def poke(self, addr: int, value: int):  # noqa:D102
+        self._writable()[addr] = value
+
+    def _writable(self) -> Union[bytearray, memoryview]:
+        """
+        Get the buffer for writing, copying it if a snapshot shares it.
+
+        :returns: The buffer.
+        """
+        if self._shared:
+            self._memory = bytearray(self._memory)
+            self._view = memoryview(self._memory)
+            self._shared = False
+        return self._memory
+
+    def snapshot_memory(self) -> memoryview:
+        """
+        Capture the memory contents without copying.
+
+        :returns: A read-only view of the contents,
+            which later writes to this memory do not change.
+        """
+        self._shared = True
+        return self._view.toreadonly()
+
+    def restore_memory(self, snapshot: memoryview):
+        """
+        Return to captured contents without copying.
+
+        :param snapshot: The snapshot.
+        :raises ValueError: If the snapshot is a different size.
+        """
+        if len(snapshot) != len(self._memory):
+            raise ValueError("Snapshot size does not match memory size.")
+        self._memory = snapshot
+        self._view = snapshot
+        self._shared = True
+
+    def load(self, offset: int, buffer: Buffer):
+        """
+        Copy a buffer into memory.
+
+        :param offset: The address of the first byte.
+        :param buffer: The bytes to load.
+        :raises IndexError: If the buffer does not fit.
+        """
+        source = memoryview(buffer).cast("B")
+        if offset < 0 or offset + len(source) > len(self._memory):
+            raise IndexError("Buffer does not fit in memory.")
+        self._writable()
+        self._view[offset : offset + len(source)] = source
+
+    def dump(self, start: int, end: int) -> memoryview:  # noqa:D102
+        return self._view[start:end].toreadonly()
+
+    def view(self) -> memoryview:  # noqa:D102
+        self._writable()
+        return self._view
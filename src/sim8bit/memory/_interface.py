@@ -1,5 +1,7 @@
 import abc
 
+from typing_extensions import Buffer
+
 
 class ReadableMemory(metaclass=abc.ABCMeta):  # pragma: nocover
     """Readable memory."""
@@ -12,6 +14,24 @@ class ReadableMemory(metaclass=abc.ABCMeta):  # pragma: nocover
         """
         ...
 
+    def dump(self, start: int, end: int) -> memoryview:
+        """
+        Get a read-only view of a range of memory without copying.
+
+        :param start: The first address.
+        :param end: The address after the last.
+        :returns: The memory contents.
+        """
+        ...
+
+    def view(self) -> memoryview:
+        """
+        Get a view of the whole memory without copying.
+
+        :returns: The memory contents.
+        """
+        ...
+
 
 class ReadWriteMemory(ReadableMemory):  # pragma: nocover
     """Read/writeable memory."""
@@ -24,3 +44,12 @@ class ReadWriteMemory(ReadableMemory):  # pragma: nocover
         :param value: The value.
         """
         ...
+
+    def load(self, offset: int, buffer: Buffer):
+        """
+        Copy a buffer into memory.
+
+        :param offset: The address of the first byte.
+        :param buffer: The bytes to load.
+        """
+        ...
@@ -0,0 +1,104 @@
+from __future__ import annotations
+
+import mmap
+import os
+from typing import Optional, Union
+
+from typing_extensions import Buffer
+
+from ._interface import ReadWriteMemory
+
+
+class MappedMemory(ReadWriteMemory):
+    """
+    Byte-addressed memory backed by a memory-mapped file.
+
+    Pages are only read from the file when they are first touched,
+    so opening a large image is cheap. A writable mapping is
+    copy-on-write: writes go to private pages and never reach the
+    file, so one pristine image can back many simulations that each
+    only materialize the pages they write.
+    """
+
+    def __init__(
+        self,
+        path: Union[str, os.PathLike],
+        writable: bool = True,
+        size: Optional[int] = None,
+    ):
+        """
+        Map a file.
+
+        :param path: The image file.
+        :param writable: If True, allow copy-on-write writes.
+            If False, the memory is read-only.
+        :param size: The number of bytes to map. Defaults to the file size.
+        """
+        with open(path, "rb") as f:
+            self._map = mmap.mmap(
+                f.fileno(),
+                size or 0,
+                access=mmap.ACCESS_COPY if writable else mmap.ACCESS_READ,
+            )
+        self._view = memoryview(self._map)
+
+    def __len__(self) -> int:
+        """Get the number of bytes."""
+        return len(self._map)
+
+    def __enter__(self) -> MappedMemory:
+        """Use the memory as a context manager that closes it on exit."""
+        return self
+
+    def __exit__(self, *_):
+        """Close the memory."""
+        self.close()
+
+    @property
+    def writable(self) -> bool:
+        """True if the memory can be written."""
+        return not self._view.readonly
+
+    def close(self):
+        """
+        Unmap the file.
+
+        :raises BufferError: If views of the memory are still in use.
+        """
+        self._view.release()
+        self._map.close()
+
+    def peek(self, addr: int) -> int:  # noqa:D102
+        return self._map[addr]
+
+    def poke(self, addr: int, value: int):
+        """
+        Set a value at a memory location.
+
+        :param addr: The address.
+        :param value: The value.
+        :raises TypeError: If the memory is read-only.
+        """
+        self._map[addr] = value
+
+    def load(self, offset: int, buffer: Buffer):
+        """
+        Copy a buffer into memory.
+
+        :param offset: The address of the first byte.
+        :param buffer: The bytes to load.
+        :raises IndexError: If the buffer does not fit.
+        :raises TypeError: If the memory is read-only.
+        """
+        source = memoryview(buffer).cast("B")
+        if offset < 0 or offset + len(source) > len(self._map):
+            raise IndexError("Buffer does not fit in memory.")
+        if self._view.readonly:
+            raise TypeError("Memory is read-only.")
+        self._view[offset : offset + len(source)] = source
+
+    def dump(self, start: int, end: int) -> memoryview:  # noqa:D102
+        return self._view[start:end].toreadonly()
+
+    def view(self) -> memoryview:  # noqa:D102
+        return self._view
@@ -0,0 +1,174 @@
+from __future__ import annotations
+
+import collections
+import dataclasses
+import time
+from typing import Any, Callable, Optional
+
+from .events import Event, EventHandler, EventScheduler, Timestamp
+from .wire import BusMember, Net
+
+
+def handler_owner(handler: EventHandler) -> Any:
+    """
+    Get the object responsible for an event handler.
+
+    :param handler: The handler.
+    :returns: The instance of a bound method, otherwise the handler itself.
+    """
+    return getattr(handler, "__self__", handler)
+
+
+def handler_name(handler: EventHandler) -> str:
+    """
+    Get a name for an event handler shared by all its instances.
+
+    :param handler: The handler.
+    :returns: The qualified name of the function, otherwise its repr.
+    """
+    return getattr(handler, "__qualname__", None) or repr(handler)
+
+
+@dataclasses.dataclass
+class ProfileStats:
+    """A snapshot of profiling counters."""
+
+    events_by_owner: dict[Any, int]
+    """Events dispatched per handler owner (see handler_owner)."""
+    events_by_handler: dict[str, int]
+    """Events dispatched per handler name (see handler_name)."""
+    seconds_by_handler: dict[str, float]
+    """Wall time spent in each handler, including nested callbacks."""
+    net_callbacks: dict[Net, int]
+    """Listener callbacks fired per net."""
+    bus_callbacks: dict[BusMember, int]
+    """Listener callbacks fired per bus member."""
+    queue_depth: list[tuple[Timestamp, int]]
+    """Samples of (scheduler time, pending events)."""
+
+
+class Profiler:
+    """
+    Opt-in per-component profiling for a scheduler.
+
+    While enabled, the profiler dispatches the scheduler's events
+    to count and time them, and counts net and bus listener callbacks.
+    While disabled nothing is hooked, so dispatch and net notification
+    run their normal code paths.
+
+    Net and bus counting hooks the wire classes, so it is process-wide
+    and only one profiler may be enabled at a time.
+    """
+
+    _active: Optional[Profiler] = None
+
+    def __init__(self, sched: EventScheduler, depth_interval: int = 100):
+        """
+        Create the profiler.
+
+        :param sched: The scheduler to profile.
+        :param depth_interval: Sample the queue depth every this many events.
+        """
+        self._sched = sched
+        self._depth_interval = depth_interval
+        self._net_notify: Optional[Callable[[Net], None]] = None
+        self._bus_notify: Optional[Callable[[BusMember], None]] = None
+        self.reset()
+
+    def __enter__(self) -> Profiler:
+        """Enable the profiler for a block."""
+        self.enable()
+        return self
+
+    def __exit__(self, *_):
+        """Disable the profiler."""
+        self.disable()
+
+    @property
+    def enabled(self) -> bool:
+        """True if the profiler is enabled."""
+        return Profiler._active is self
+
+    def reset(self):
+        """Clear all counters."""
+        self._events_by_owner: collections.Counter[Any] = collections.Counter()
+        self._events_by_handler: collections.Counter[str] = collections.Counter()
+        self._seconds_by_handler: collections.defaultdict[str, float] = (
+            collections.defaultdict(float)
+        )
+        self._net_callbacks: collections.Counter[Net] = collections.Counter()
+        self._bus_callbacks: collections.Counter[BusMember] = collections.Counter()
+        self._queue_depth: list[tuple[Timestamp, int]] = []
+        self._until_sample = 0
+
+    def enable(self):
+        """
+        Start profiling.
+
+        :raises RuntimeError: If another profiler is enabled.
+        """
+        if Profiler._active is self:
+            return
+        if Profiler._active is not None:
+            raise RuntimeError("Another profiler is already enabled.")
+        Profiler._active = self
+
+        net_notify = self._net_notify = Net._notify_listeners
+        bus_notify = self._bus_notify = BusMember._notify_listeners
+
+        def count_net(net: Net):
+            self._net_callbacks[net] += len(net._listeners) + len(net._bus_bits)
+            net_notify(net)
+
+        def count_bus(bus: BusMember):
+            self._bus_callbacks[bus] += len(bus._listeners)
+            bus_notify(bus)
+
+        Net._notify_listeners = count_net  # type: ignore[method-assign]
+        BusMember._notify_listeners = count_bus  # type: ignore[method-assign]
+        self._sched.profiler = self
+
+    def disable(self):
+        """Stop profiling and remove all hooks. Counters are kept."""
+        if Profiler._active is not self:
+            return
+        self._sched.profiler = None
+        Net._notify_listeners = self._net_notify  # type: ignore[method-assign]
+        BusMember._notify_listeners = self._bus_notify  # type: ignore[method-assign]
+        Profiler._active = None
+
+    def dispatch(self, event: Event):
+        """
+        Call an event handler, counting and timing it.
+
+        :param event: The event to dispatch.
+        """
+        handler = event.handler
+        name = handler_name(handler)
+        self._events_by_owner[handler_owner(handler)] += 1
+        self._events_by_handler[name] += 1
+        if self._until_sample <= 0:
+            self._until_sample = self._depth_interval
+            self._queue_depth.append((event.stamp, self._sched.pending))
+        self._until_sample -= 1
+
+        start = time.perf_counter()
+        try:
+            handler(event.stamp, *event.args)
+        finally:
+            self._seconds_by_handler[name] += time.perf_counter() - start
+
+    def snapshot(self) -> ProfileStats:
+        """
+        Copy the current counters.
+
+        :returns: The counters.
+        """
+        return ProfileStats(
+            dict(self._events_by_owner),
+            dict(self._events_by_handler),
+            dict(self._seconds_by_handler),
+            dict(self._net_callbacks),
+            dict(self._bus_callbacks),
+            list(self._queue_depth),
+        )
@@ -0,0 +1,61 @@
+from __future__ import annotations
+
+from typing import Any, Iterable
+
+from typing_extensions import Protocol
+
+
+class Snapshotable(Protocol):  # pragma: nocover
+    """An object whose state can be captured and restored."""
+
+    def snapshot(self) -> Any:
+        """
+        Capture the current state.
+
+        :returns: An opaque snapshot, only valid for this object.
+        """
+        ...
+
+    def restore(self, __snapshot: Any):
+        """
+        Return to a captured state without side effects.
+
+        :param __snapshot: A snapshot taken from this object.
+        """
+        ...
+
+
+class Snapshot:
+    """
+    The captured state of a whole simulation.
+
+    Include the scheduler and every net, bus member and component
+    in the simulation. A common prefix can then run once and be
+    forked many times by restoring the snapshot before each run::
+
+        boot.run_until(stamp)
+        snapshot = Snapshot([sched, *nets, *buses, ram])
+        for program in programs:
+            snapshot.restore()
+            ...
+
+    Restoring never notifies listeners, since every listener
+    is restored to the matching state along with its source.
+    """
+
+    def __init__(self, objects: Iterable[Snapshotable]):
+        """
+        Capture the state of some objects.
+
+        :param objects: The objects to capture.
+        """
+        self._states = [(obj, obj.snapshot()) for obj in objects]
+
+    def __len__(self) -> int:
+        """Get the number of captured objects."""
+        return len(self._states)
+
+    def restore(self):
+        """Return all the objects to their captured states."""
+        for obj, state in self._states:
+            obj.restore(state)
@@ -0,0 +1,279 @@
+"""
+Record net and bus activity as VCD waveforms.
+
+The recorder listens to selected nets and bus members and appends
+raw (time, signal, value) records to a chunk in the event loop.
+Full chunks are handed to a background thread, which formats the
+changes as VCD text and writes them through a large buffer,
+optionally gzip-compressed, so the event loop never formats or
+waits on the file.
+"""
+from __future__ import annotations
+
+import gzip
+import io
+import os
+import queue
+import threading
+from typing import IO, Any, Optional, Union
+
+from .events import EventScheduler
+from .wire import BusMember, BusValueCallback, Net, NetChangeCallback, NetState
+
+_NET_CHARS = {NetState.LOW: "0", NetState.HIGH: "1", NetState.FLOATING: "z"}
+_FIRST_CODE = 33
+_CODES = 94
+
+
+def _code(index: int) -> str:
+    """
+    Get the VCD identifier code of a signal.
+
+    :param index: The signal index.
+    :returns: A short code of printable characters.
+    """
+    code = ""
+    index += 1
+    while index:
+        index, digit = divmod(index - 1, _CODES)
+        code += chr(_FIRST_CODE + digit)
+    return code
+
+
+def _bus_text(width: int, high: int, floating: int) -> str:
+    """
+    Format a bus value as VCD binary digits.
+
+    :param width: The bus width.
+    :param high: The bit mask of high nets.
+    :param floating: The bit mask of floating nets.
+    :returns: The digits, most significant first.
+    """
+    digits = format(high, f"0{width}b")
+    if floating:
+        digits = "".join(
+            "z" if floating >> (width - 1 - i) & 1 else digit
+            for i, digit in enumerate(digits)
+        )
+    return digits
+
+
+class WaveformRecorder:
+    """
+    A streaming VCD writer for nets and bus members.
+
+    Add signals, then open the recorder (or use it as a context
+    manager) before running the simulation. Each bus member is
+    recorded as one vector signal. Only changes are written.
+    """
+
+    def __init__(
+        self,
+        sched: EventScheduler,
+        path: Union[str, os.PathLike],
+        compress: bool = False,
+        chunk_size: int = 4096,
+        buffer_size: int = 1 << 20,
+        scope: str = "sim8bit",
+    ):
+        """
+        Create the recorder.
+
+        :param sched: The scheduler whose time stamps the changes.
+        :param path: The output file.
+        :param compress: If True, gzip the VCD output.
+        :param chunk_size: The number of changes handed to the writer at once.
+        :param buffer_size: The size of the file write buffer in bytes.
+        :param scope: The VCD module scope name for the signals.
+        """
+        self._sched = sched
+        self._path = path
+        self._compress = compress
+        self._chunk_size = chunk_size
+        self._buffer_size = buffer_size
+        self._scope = scope
+        self._signals: list[tuple[str, int, Union[Net, BusMember]]] = []
+        self._probes: list[tuple[Union[Net, BusMember], Any]] = []
+        self._chunk: list[tuple[Any, ...]] = []
+        self._queue: queue.Queue[Optional[list[tuple[Any, ...]]]] = queue.Queue()
+        self._thread: Optional[threading.Thread] = None
+        self._error: Optional[BaseException] = None
+        self._open = False
+        self._closed = False
+
+    def __enter__(self) -> WaveformRecorder:
+        """Open the recorder for a block."""
+        self.open()
+        return self
+
+    def __exit__(self, *_):
+        """Close the recorder."""
+        self.close()
+
+    def add_net(self, net: Net, name: str):
+        """
+        Record a net as a scalar signal.
+
+        :param net: The net.
+        :param name: The signal name.
+        :raises RuntimeError: If the recorder is already open.
+        """
+        code = self._add_signal(name, 1, net)
+        chunk = self._chunk
+        sched = self._sched
+        limit = self._chunk_size
+
+        def probe(state: NetState):
+            chunk.append((sched.now_ns, code, state))
+            if len(chunk) >= limit:
+                self._hand_off()
+
+        listener = NetChangeCallback(probe)
+        net.add_listener(listener)
+        self._probes.append((net, listener))
+
+    def add_bus(self, bus: BusMember, name: str):
+        """
+        Record a bus member as one vector signal.
+
+        :param bus: The bus member.
+        :param name: The signal name.
+        :raises RuntimeError: If the recorder is already open.
+        """
+        code = self._add_signal(name, len(bus), bus)
+        chunk = self._chunk
+        sched = self._sched
+        limit = self._chunk_size
+
+        def probe(_):
+            chunk.append((sched.now_ns, code, bus._high, bus._floating))
+            if len(chunk) >= limit:
+                self._hand_off()
+
+        listener = BusValueCallback(probe)
+        bus.add_listener(listener)
+        self._probes.append((bus, listener))
+
+    def _add_signal(
+        self, name: str, width: int, source: Union[Net, BusMember]
+    ) -> str:
+        """
+        Declare a signal.
+
+        :param name: The signal name.
+        :param width: The number of bits.
+        :param source: The net or bus member.
+        :returns: The VCD identifier code.
+        :raises RuntimeError: If the recorder is already open.
+        """
+        if self._open or self._closed:
+            raise RuntimeError("Signals must be added before opening the recorder.")
+        self._signals.append((name, width, source))
+        return _code(len(self._signals) - 1)
+
+    def open(self):
+        """Write the VCD header and initial values, and start the writer thread."""
+        if self._open:
+            return
+        self._open = True
+        stream: IO[bytes]
+        if self._compress:
+            stream = gzip.open(self._path, "wb")
+        else:
+            stream = open(self._path, "wb", buffering=0)
+        writer = io.TextIOWrapper(
+            io.BufferedWriter(stream, self._buffer_size), encoding="ascii"
+        )
+
+        writer.write(f"$timescale 1ns $end\n$scope module {self._scope} $end\n")
+        for i, (name, width, _) in enumerate(self._signals):
+            writer.write(f"$var wire {width} {_code(i)} {name} $end\n")
+        writer.write("$upscope $end\n$enddefinitions $end\n")
+        writer.write(f"#{self._sched.now_ns}\n$dumpvars\n")
+        last: dict[str, str] = {}
+        for i, (_, width, source) in enumerate(self._signals):
+            code = _code(i)
+            if isinstance(source, Net):
+                last[code] = f"{_NET_CHARS[source.state]}{code}\n"
+            else:
+                text = _bus_text(width, source._high, source._floating)
+                last[code] = f"b{text} {code}\n"
+            writer.write(last[code])
+        writer.write("$end\n")
+
+        widths = {_code(i): width for i, (_, width, _) in enumerate(self._signals)}
+        # Changes before opening are covered by the initial values.
+        self._chunk.clear()
+        self._thread = threading.Thread(
+            target=self._write, args=(writer, widths, last), daemon=True
+        )
+        self._thread.start()
+
+    def _hand_off(self):
+        """Pass the current chunk to the writer thread."""
+        if self._open:
+            self._queue.put(self._chunk[:])
+        self._chunk.clear()
+
+    def _write(
+        self, writer: io.TextIOWrapper, widths: dict[str, int], last: dict[str, str]
+    ):
+        """
+        Format and write chunks until closed.
+
+        :param writer: The output.
+        :param widths: The width of each signal by code.
+        :param last: The last written value line of each signal by code.
+        """
+        time_ns = self._sched.now_ns
+        try:
+            while True:
+                chunk = self._queue.get()
+                if chunk is None:
+                    break
+                lines = []
+                for record in chunk:
+                    code = record[1]
+                    if len(record) == 3:
+                        line = f"{_NET_CHARS[record[2]]}{code}\n"
+                    else:
+                        text = _bus_text(widths[code], record[2], record[3])
+                        line = f"b{text} {code}\n"
+                    if last[code] == line:
+                        continue
+                    last[code] = line
+                    if record[0] != time_ns:
+                        time_ns = record[0]
+                        lines.append(f"#{time_ns}\n")
+                    lines.append(line)
+                writer.write("".join(lines))
+        except BaseException as error:
+            self._error = error
+        finally:
+            writer.close()
+
+    def close(self):
+        """
+        Stop recording, and wait for all changes to be written.
+
+        The signal listeners are removed, except from nets and bus
+        members frozen in a Netlist, where they stay but no longer
+        write.
+
+        :raises Exception: Any error from writing the file.
+        """
+        for source, listener in self._probes:
+            if not source._frozen:
+                source.remove_listener(listener)
+        self._probes.clear()
+        if not self._open:
+            self._closed = True
+            return
+        self._hand_off()
+        self._open = False
+        self._closed = True
+        self._queue.put(None)
+        assert self._thread is not None
+        self._thread.join()
+        if self._error is not None:
+            raise self._error
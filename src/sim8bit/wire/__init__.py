@@ -1,9 +1,13 @@
 # flake8: noqa: F401
 from ._bus import BusMember, BusValueCallback, BusValueListener
+from ._netlist import Netlist
 from ._net import (
+    Edge,
     HandleNotOwner,
     Net,
     NetChangeCallback,
     NetChangeListener,
     NetState,
+    Sensitivity,
+    SensitivityGroup,
 )
@@ -1,8 +1,19 @@
 from __future__ import annotations
 
-from typing import Callable, Sequence, Union, Literal
+from typing import Callable, Optional, Sequence, Union, Literal
 
-from ._net import Net, NetChangeCallback, NetState
+from . import _net
+from ._net import (
+    Edge,
+    Net,
+    NetChangeListener,
+    NetState,
+    Sensitivity,
+    SensitivityGroup,
+    _FilteredListener,
+    _listener_index,
+    _notify_nets,
+)
 
 BusValue = Union[int, Literal[NetState.FLOATING]]
 
@@ -44,6 +55,30 @@ Bus = Sequence[Net]
 """A type alias for a sequence of nets."""
 
 
+class _BusNetListener(NetChangeListener):
+    """A listener that updates one bit of a bus member."""
+
+    def __init__(self, bus: BusMember, mask: int):
+        """
+        Create the listener.
+
+        :param bus: The bus member.
+        :param mask: The bit mask of the net in the bus value.
+        """
+        self._bus = bus
+        self._mask = mask
+
+    def on_change(self, state: NetState):
+        """
+        Update the bus member.
+
+        :param state: The new net state.
+        """
+        bus = self._bus
+        if not bus._idle:
+            bus._net_did_change(self._mask, state)
+
+
 class BusMember:
     """A bus member that can read/write the bus."""
 
@@ -54,11 +89,26 @@ class BusMember:
         :param nets: The nets that form the bus.
         """
         self._nets = nets
-        for x in self._nets:
-            x.add_listener(NetChangeCallback(self._net_did_change))
+        self._resync()
+        for i, x in enumerate(self._nets):
+            x._add_bus_bit(_BusNetListener(self, 1 << i))
         self._listeners: list[BusValueListener] = []
+        self._groups: list[Optional[SensitivityGroup]] = []
+        self._idle = False
+        self._frozen = False
         self._handles = [0 for _ in self._nets]
 
+    def _resync(self):
+        """Rebuild the cached value from the net states."""
+        self._high = 0
+        self._floating = 0
+        for i, x in enumerate(self._nets):
+            if x._state is NetState.HIGH:
+                self._high |= 1 << i
+            elif x._state is NetState.FLOATING:
+                self._floating |= 1 << i
+        self._value: BusValue = NetState.FLOATING if self._floating else self._high
+
     def __len__(self) -> int:
         """Get the number of nets in the bus."""
         return len(self._nets)
@@ -67,49 +117,185 @@ class BusMember:
         """Get a net from the bus."""
         return self._nets[idx]
 
-    def add_listener(self, listener: BusValueListener):
-        """Add a bus value listener."""
+    def add_listener(
+        self, listener: BusValueListener, sensitivity: Optional[Sensitivity] = None
+    ):
+        """
+        Add a bus value listener.
+
+        :param listener: The listener.
+        :param sensitivity: If given, only notify the listener
+            of the changes it is sensitive to.
+        :raises RuntimeError: If the bus member is frozen in a Netlist.
+        :raises ValueError: If the sensitivity has an edge other than Edge.ANY.
+        """
+        if self._frozen:
+            raise RuntimeError("Cannot add a listener to a frozen bus member.")
+        group = None
+        if sensitivity is not None:
+            if sensitivity.edge is not Edge.ANY:
+                raise ValueError("Bus listeners cannot be sensitive to an edge.")
+            listener = _FilteredListener(listener, sensitivity)
+            group = sensitivity.group
+            if group is not None and self not in group._buses:
+                group._buses.append(self)
         self._listeners.append(listener)
+        self._groups.append(group)
+        self._update_idle()
 
-    def _net_did_change(self, _):
-        """Handle a change in one of the bus nets."""
+    def remove_listener(self, listener: BusValueListener):
+        """
+        Remove a bus value listener.
+
+        A listener may remove itself while it is being notified.
+
+        :param listener: The listener, as it was added.
+        :raises RuntimeError: If the bus member is frozen in a Netlist.
+        :raises ValueError: If the listener was not added.
+        """
+        if self._frozen:
+            raise RuntimeError("Cannot remove a listener from a frozen bus member.")
+        i = _listener_index(self._listeners, listener)
+        # Replace the lists, so a notification in progress is not disturbed.
+        self._listeners = self._listeners[:i] + self._listeners[i + 1 :]
+        self._groups = self._groups[:i] + self._groups[i + 1 :]
+        self._update_idle()
+
+    def _update_idle(self):
+        """
+        Stop tracking the nets if every listener is in a disabled group.
+
+        The cached value is rebuilt when tracking resumes.
+        """
+        idle = bool(self._groups) and all(
+            group is not None and not group._enabled for group in self._groups
+        )
+        if self._idle and not idle:
+            self._resync()
+        self._idle = idle
+
+    def _net_did_change(self, mask: int, state: NetState):
+        """
+        Handle a change in one of the bus nets.
+
+        The cached value is updated for the changed bit only.
+        The notification is deferred until every bus member
+        in the transaction has been updated; see ``_notify_nets``.
+
+        :param mask: The bit mask of the changed net.
+        :param state: The new net state.
+        """
+        if state == NetState.HIGH:
+            self._high |= mask
+            self._floating &= ~mask
+        elif state == NetState.LOW:
+            self._high &= ~mask
+            self._floating &= ~mask
+        else:
+            self._floating |= mask
+        self._value = NetState.FLOATING if self._floating else self._high
+        _net._deferred[self] = None  # type: ignore[index]
+
+    def _notify_listeners(self):
+        """Notify all the listeners of the bus value."""
+        value = self._value
         for listener in self._listeners:
-            listener.on_change(self.value)
+            listener.on_change(value)
 
     @property
     def value(self) -> BusValue:
         """
-        Calculate the value on the bus from the net states.
+        Get the value on the bus from the net states.
+
+        The value is maintained as the nets change,
+        so reading it does not depend on the bus width.
 
         :returns: The unsigned integer value on the bus or FLOATING.
         """
-        out = 0
-        for i, x in enumerate(self._nets):
-            if x.state == NetState.FLOATING:
-                out = NetState.FLOATING
-                break
-            elif x.state == NetState.HIGH:
-                out += 1 << i
-        return out
+        if self._idle:
+            self._resync()
+        return self._value
+
+    @property
+    def floating_mask(self) -> int:
+        """
+        Get the bits of the bus whose nets are floating.
+
+        :returns: A bit mask with a set bit for each floating net.
+        """
+        if self._idle:
+            self._resync()
+        return self._floating
+
+    @property
+    def driving(self) -> bool:
+        """True if this bus member drives any of the nets."""
+        return any(self._handles)
+
+    def snapshot(self) -> tuple[tuple[int, ...], int, int]:
+        """
+        Capture the owner handles and cached net states.
+
+        The nets themselves are captured separately.
+
+        :returns: The snapshot.
+        """
+        if self._idle:
+            self._resync()
+        return (tuple(self._handles), self._high, self._floating)
+
+    def restore(self, snapshot: tuple[tuple[int, ...], int, int]):
+        """
+        Return to a captured state without notifying listeners.
+
+        :param snapshot: The snapshot.
+        """
+        handles, self._high, self._floating = snapshot
+        self._handles = list(handles)
+        self._value = NetState.FLOATING if self._floating else self._high
 
     def write(self, value: int):
         """
         Write an unsigned integer value to the bus.
 
+        All nets are updated before any listener is notified,
+        and each bus member on the nets is notified once.
+        Nets that keep their state do not notify.
+
         :raises ValueError: If value is negative.
         """
         if value < 0:
             raise ValueError
 
-        for i, x in enumerate(self._nets):
-            bit = (value & (1 << i)) >> i
-            if bit == 1:
-                self._handles[i] = x.take_high(self._handles[i])
-            else:
-                self._handles[i] = x.take_low(self._handles[i])
+        changed: list[Net] = []
+        try:
+            for i, x in enumerate(self._nets):
+                bit = (value & (1 << i)) >> i
+                state = NetState.HIGH if bit == 1 else NetState.LOW
+                previous = x._state
+                self._handles[i] = x._drive(state, self._handles[i])
+                if _net._delta is not None:
+                    _net._delta.setdefault(x, previous)
+                elif previous != state or x._strict:
+                    changed.append(x)
+                else:
+                    Net.suppressed_notifications += 1
+        finally:
+            _notify_nets(changed)
 
     def float_(self):
         """Put the bus in a floating state."""
-        for i, x in enumerate(self._nets):
-            x.release_floating(self._handles[i])
-            self._handles[i] = 0
+        changed: list[Net] = []
+        try:
+            for i, x in enumerate(self._nets):
+                previous = x._state
+                x._release(self._handles[i])
+                self._handles[i] = 0
+                if _net._delta is not None:
+                    _net._delta.setdefault(x, previous)
+                elif previous != NetState.FLOATING or x._strict:
+                    changed.append(x)
+                else:
+                    Net.suppressed_notifications += 1
+        finally:
+            _notify_nets(changed)
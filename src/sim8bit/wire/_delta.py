@@ -0,0 +1,77 @@
+"""
+Delta cycles: defer net notifications to notify once per change set.
+
+While a delta cycle is open, nets that change record their state from
+before the delta instead of notifying. Flushing ends the delta and
+notifies every net whose final state differs, as one bus transaction,
+so each listener sees only final values. A net that changed and
+changed back within the delta is a glitch and does not notify.
+Changes made by the notified listeners are collected into the next delta.
+
+Flushing is one transaction (see ``_net._notify_nets``): every bus
+member updates its cached value before any listener runs, and bus
+listeners run before net listeners, so a component sees all the
+bus changes of a delta before reacting to a control net.
+
+The delta is process-wide: while one scheduler steps a delta, every
+net change in the process joins it, including nets of another
+circuit driven from its handlers or from another thread. A scheduler
+run nested in a handler suspends the enclosing delta, so the nested
+run notifies its own changes, and the enclosing delta is reopened
+unchanged when it returns. Step delta-mode schedulers from one thread.
+"""
+from typing import Optional
+
+from . import _net
+from ._net import Net, NetState
+
+Delta = Optional[dict[Net, NetState]]
+"""A delta cycle's changed nets with their previous states, or None."""
+
+
+def begin() -> Delta:
+    """
+    Open a delta cycle, suspending any enclosing one.
+
+    :returns: The enclosing delta, to pass to ``end``.
+    """
+    enclosing = _net._delta
+    _net._delta = {}
+    return enclosing
+
+
+def suspend() -> Delta:
+    """
+    Notify net changes immediately, suspending any enclosing delta.
+
+    :returns: The enclosing delta, to pass to ``end``.
+    """
+    enclosing = _net._delta
+    _net._delta = None
+    return enclosing
+
+
+def flush() -> bool:
+    """
+    Notify the listeners of the nets changed in the delta, and open the next.
+
+    :returns: True if any net changed state during the delta,
+        even if it changed back.
+    """
+    changed = _net._delta
+    if not changed:
+        return False
+    _net._delta = {}
+    nets = [x for x, previous in changed.items() if x._state != previous or x._strict]
+    Net.suppressed_notifications += len(changed) - len(nets)
+    _net._notify_nets(nets)
+    return True
+
+
+def end(enclosing: Delta):
+    """
+    Close the delta cycle without notifying, and reopen the enclosing one.
+
+    :param enclosing: The delta returned by ``begin`` or ``suspend``.
+    """
+    _net._delta = enclosing
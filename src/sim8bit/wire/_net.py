@@ -1,7 +1,9 @@
+from __future__ import annotations
+
 import abc
 import enum
 import itertools
-from typing import Callable
+from typing import Any, Callable, NamedTuple, Optional, Sequence
 
 
 class HandleNotOwner(RuntimeError):
@@ -16,6 +18,44 @@ class NetState(enum.Enum):
     FLOATING = 3
 
 
+_delta: Optional[dict[Net, NetState]] = None
+"""
+Nets changed in the current delta cycle, with their states before it.
+
+While a delta cycle is open, changed nets are collected here instead
+of notifying their listeners; see ``_delta.py``.
+"""
+
+_deferred: Optional[dict[Any, None]] = None
+"""Bus members awaiting notification in the current transaction."""
+
+
+def _notify_nets(nets: Sequence[Net]):
+    """
+    Notify the listeners of nets that changed together, as one transaction.
+
+    First every bus member on the nets updates its cached value,
+    so every listener reads the final values. Then each bus member
+    is notified once, however many of its nets changed, so bus
+    listeners never see intermediate values. Then the listeners
+    of each net are notified.
+
+    :param nets: The nets that changed.
+    """
+    global _deferred
+    _deferred = {}
+    try:
+        for net in nets:
+            net._update_buses()
+    finally:
+        buses = _deferred
+        _deferred = None
+    for bus in buses:
+        bus._notify_listeners()
+    for net in nets:
+        net._notify_listeners()
+
+
 class NetChangeListener(metaclass=abc.ABCMeta):  # pragma: nocover
     """A net state change listener."""
 
@@ -49,21 +89,214 @@ class NetChangeCallback(NetChangeListener):
         self._callback(state)
 
 
+class Edge(enum.Enum):
+    """The net changes a listener is sensitive to."""
+
+    ANY = None
+    """Every change."""
+    RISING = NetState.HIGH
+    """Changes to high."""
+    FALLING = NetState.LOW
+    """Changes to low."""
+
+
+class SensitivityGroup:
+    """
+    A switch that enables or disables many listeners at once.
+
+    A bus member whose listeners are all in disabled groups stops
+    tracking its nets, so changes on a bus that nothing is listening
+    to cost almost nothing. It catches up when a group is enabled.
+    """
+
+    __slots__ = ("_enabled", "_buses")
+
+    def __init__(self, enabled: bool = True):
+        """
+        Create the group.
+
+        :param enabled: If False, start with the listeners disabled.
+        """
+        self._enabled = enabled
+        self._buses: list[Any] = []
+
+    @property
+    def enabled(self) -> bool:
+        """True if the listeners in the group are notified."""
+        return self._enabled
+
+    @enabled.setter
+    def enabled(self, enabled: bool):
+        if enabled == self._enabled:
+            return
+        self._enabled = enabled
+        for bus in self._buses:
+            bus._update_idle()
+
+
+class Sensitivity(NamedTuple):
+    """
+    When a listener wants to be notified.
+
+    A listener is only notified of changes that match every field.
+    """
+
+    edge: Edge = Edge.ANY
+    """The net changes to notify. Bus listeners must use Edge.ANY."""
+    guard: Optional[Net] = None
+    """A net that must be in guard_state for the listener to be notified."""
+    guard_state: NetState = NetState.LOW
+    """The state the guard net must be in."""
+    group: Optional[SensitivityGroup] = None
+    """A group that must be enabled for the listener to be notified."""
+
+
+class _FilteredListener(NetChangeListener):
+    """
+    A net or bus listener that only forwards changes matching a sensitivity.
+
+    Filtered-out changes cost one call and a few comparisons,
+    instead of running the listener.
+    """
+
+    def __init__(self, listener: Any, sensitivity: Sensitivity):
+        """
+        Create the filter.
+
+        :param listener: The net or bus listener to forward to.
+        :param sensitivity: The sensitivity.
+        """
+        super().__init__()
+        self._listener = listener
+        self._state = sensitivity.edge.value
+        self._guard = sensitivity.guard
+        self._guard_state = sensitivity.guard_state
+        self._group = sensitivity.group
+
+    def on_change(self, value: Any):
+        """
+        Forward the change if it matches.
+
+        :param value: The new net state or bus value.
+        """
+        if self._state is not None and value is not self._state:
+            return
+        guard = self._guard
+        if guard is not None and guard._state is not self._guard_state:
+            return
+        group = self._group
+        if group is not None and not group._enabled:
+            return
+        self._listener.on_change(value)
+
+
+def _listener_index(listeners: Sequence[Any], listener: Any) -> int:
+    """
+    Find a listener, which may be wrapped in a sensitivity filter.
+
+    :param listeners: The listeners of a net or bus member.
+    :param listener: The listener, as it was added.
+    :returns: The index of the listener.
+    :raises ValueError: If the listener is not in the list.
+    """
+    for i, entry in enumerate(listeners):
+        if entry is listener or (
+            isinstance(entry, _FilteredListener) and entry._listener is listener
+        ):
+            return i
+    raise ValueError("Listener was not added.")
+
+
 class Net:
-    """A net that allows a single active participant."""
+    """
+    A net that allows a single active participant.
 
-    def __init__(self):
-        """Create the net."""
+    Listeners are only notified when the net state actually changes,
+    unless the net is strict.
+    """
+
+    suppressed_notifications = 0
+    """The total number of no-op transitions suppressed across all nets."""
+
+    def __init__(self, strict: bool = False):
+        """
+        Create the net.
+
+        :param strict: If True, notify listeners on every transition,
+            even if the state did not change.
+        """
+        self._strict = strict
         self._owner = 0
         self._state = NetState.FLOATING
         self._listeners: list[NetChangeListener] = []
+        self._bus_bits: list[NetChangeListener] = []
+        self._frozen = False
         self._handles = itertools.count()
         _ = next(self._handles)
 
-    def add_listener(self, listener: NetChangeListener):
-        """Add a net state change listener."""
+    def add_listener(
+        self, listener: NetChangeListener, sensitivity: Optional[Sensitivity] = None
+    ):
+        """
+        Add a net state change listener.
+
+        :param listener: The listener.
+        :param sensitivity: If given, only notify the listener
+            of the changes it is sensitive to.
+        :raises RuntimeError: If the net is frozen in a Netlist.
+        """
+        if self._frozen:
+            raise RuntimeError("Cannot add a listener to a frozen net.")
+        if sensitivity is not None:
+            listener = _FilteredListener(listener, sensitivity)
         self._listeners.append(listener)
 
+    def remove_listener(self, listener: NetChangeListener):
+        """
+        Remove a net state change listener.
+
+        A listener may remove itself while it is being notified.
+
+        :param listener: The listener, as it was added.
+        :raises RuntimeError: If the net is frozen in a Netlist.
+        :raises ValueError: If the listener was not added.
+        """
+        if self._frozen:
+            raise RuntimeError("Cannot remove a listener from a frozen net.")
+        i = _listener_index(self._listeners, listener)
+        # Replace the list, so a notification in progress is not disturbed.
+        self._listeners = self._listeners[:i] + self._listeners[i + 1 :]
+
+    def _has_enabled_listeners(self) -> bool:
+        """
+        Check whether a change would run anything.
+
+        :returns: True if any bus member or any listener outside
+            a disabled group watches the net.
+        """
+        if self._bus_bits:
+            return True
+        for listener in self._listeners:
+            group = (
+                listener._group if isinstance(listener, _FilteredListener) else None
+            )
+            if group is None or group._enabled:
+                return True
+        return False
+
+    def _add_bus_bit(self, listener: NetChangeListener):
+        """
+        Add the listener that keeps one bit of a bus member's value.
+
+        Bus bits are updated before any listener is notified.
+
+        :param listener: The bus bit listener.
+        :raises RuntimeError: If the net is frozen in a Netlist.
+        """
+        if self._frozen:
+            raise RuntimeError("Cannot add a bus member to a frozen net.")
+        self._bus_bits.append(listener)
+
     @property
     def state(self) -> NetState:
         """
@@ -94,12 +327,10 @@ class Net:
         :returns: The handle to use for future access by this owner.
         :raises HandleNotOwner: if handle is not the owner.
         """
-        self._verify_allowed(handle)
-        if handle == 0:
-            self._owner = next(self._handles)
-        self._state = NetState.HIGH
-        self._notify_listeners()
-        return self._owner
+        previous = self._state
+        handle = self._drive(NetState.HIGH, handle)
+        self._notify_change(previous)
+        return handle
 
     def take_low(self, handle: int = 0) -> int:
         """
@@ -109,12 +340,10 @@ class Net:
         :returns: The handle to use for future access by this owner.
         :raises HandleNotOwner: if handle is not the owner.
         """
-        self._verify_allowed(handle)
-        if handle == 0:
-            self._owner = next(self._handles)
-        self._state = NetState.LOW
-        self._notify_listeners()
-        return self._owner
+        previous = self._state
+        handle = self._drive(NetState.LOW, handle)
+        self._notify_change(previous)
+        return handle
 
     def release_floating(self, handle: int):
         """
@@ -122,13 +351,88 @@ class Net:
         This only makes sense after the net has
         been taken high or low, so a handle is required.
 
+        :param handle: The access handle.
+        :raises HandleNotOwner: if handle is not the owner.
+        """
+        previous = self._state
+        self._release(handle)
+        self._notify_change(previous)
+
+    def _drive(self, state: NetState, handle: int) -> int:
+        """
+        Drive the net high or low without notifying listeners.
+
+        :param state: The new net state.
+        :param handle: The access handle.
+        :returns: The handle to use for future access by this owner.
+        :raises HandleNotOwner: if handle is not the owner.
+        """
+        self._verify_allowed(handle)
+        if handle == 0:
+            self._owner = next(self._handles)
+        self._state = state
+        return self._owner
+
+    def _release(self, handle: int):
+        """
+        Float the net without notifying listeners.
+
         :param handle: The access handle.
         :raises HandleNotOwner: if handle is not the owner.
         """
         self._verify_allowed(handle)
         self._owner = 0
         self._state = NetState.FLOATING
-        self._notify_listeners()
+
+    def snapshot(self) -> tuple[int, NetState, int]:
+        """
+        Capture the net state and owner handle.
+
+        :returns: The snapshot.
+        """
+        handle = next(self._handles)
+        self._handles = itertools.count(handle)
+        return (self._owner, self._state, handle)
+
+    def restore(self, snapshot: tuple[int, NetState, int]):
+        """
+        Return to a captured state without notifying listeners.
+
+        Listeners are expected to be restored to the matching state.
+
+        :param snapshot: The snapshot.
+        """
+        self._owner, self._state, handle = snapshot
+        self._handles = itertools.count(handle)
+
+    @property
+    def strict(self) -> bool:
+        """True if listeners are notified on every transition."""
+        return self._strict
+
+    def _notify_change(self, previous: NetState):
+        """
+        Notify the listeners unless the transition was a no-op.
+
+        In a delta cycle the net is collected instead, to notify
+        once with its final state when the delta ends.
+
+        :param previous: The net state before the transition.
+        """
+        if _delta is not None:
+            _delta.setdefault(self, previous)
+        elif previous != self._state or self._strict:
+            if self._bus_bits:
+                _notify_nets((self,))
+            else:
+                self._notify_listeners()
+        else:
+            Net.suppressed_notifications += 1
+
+    def _update_buses(self):
+        """Update the cached values of the bus members on the net."""
+        for bit in self._bus_bits:
+            bit.on_change(self._state)
 
     def _notify_listeners(self):
         """Notify all the listeners of the net state."""
@@ -0,0 +1,219 @@
+from __future__ import annotations
+
+import array
+from typing import Any, Callable, Iterable
+
+from . import _net
+from ._bus import BusMember, BusValueCallback, _BusNetListener
+from ._net import Net, NetChangeCallback, NetState
+
+
+class Netlist:
+    """
+    A built circuit compiled into flat index-based arrays.
+
+    Circuits are built with the object API, then frozen. Freezing
+    numbers the nets and bus members, and replaces their listener
+    objects with compressed sparse row (CSR) fan-out arrays:
+    the fan-out of net ``i`` is ``targets[offsets[i]:offsets[i + 1]]``.
+    A negative target ``~k`` is bit ``k``, one net of a bus member,
+    whose cached value is updated in place, and a non-negative target
+    is a callback ID. Bus bits come first in each fan-out, as they
+    are updated before any listener runs. Bus listeners are
+    dispatched the same way.
+    Propagation is then one loop per net with no listener objects.
+
+    Driving and reading nets and buses is unchanged. Listeners
+    cannot be added while frozen; ``thaw`` restores the object
+    dispatch. Notification counting by Profiler does not see
+    frozen nets.
+    """
+
+    def __init__(self, nets: Iterable[Net]):
+        """
+        Freeze nets, and every bus member that listens to them.
+
+        :param nets: The nets to freeze.
+        :raises RuntimeError: If a net is already frozen.
+        """
+        self._nets = list(nets)
+        for net in self._nets:
+            if net._frozen:
+                raise RuntimeError("Net is already frozen.")
+        self._index = {net: i for i, net in enumerate(self._nets)}
+
+        self._callbacks: list[Callable[[Any], None]] = []
+        self._bit_buses: list[BusMember] = []
+        self._bit_masks = array.array("q")
+        self._buses: dict[BusMember, int] = {}
+        self.offsets = array.array("q", [0])
+        """The start of each net fan-out in targets, plus the end."""
+        self.targets = array.array("q")
+        """The fan-out targets of all nets."""
+        self._bit_ends = array.array("q")
+        for net in self._nets:
+            for bit in net._bus_bits:
+                assert isinstance(bit, _BusNetListener)
+                self._buses.setdefault(bit._bus, len(self._buses))
+                self.targets.append(~len(self._bit_buses))
+                self._bit_buses.append(bit._bus)
+                self._bit_masks.append(bit._mask)
+            self._bit_ends.append(len(self.targets))
+            for listener in net._listeners:
+                self.targets.append(self._callback_id(listener))
+            self.offsets.append(len(self.targets))
+
+        self.bus_offsets = array.array("q", [0])
+        """The start of each bus member fan-out in bus_targets, plus the end."""
+        self.bus_targets = array.array("q")
+        """The callback IDs of all bus member listeners."""
+        for bus in self._buses:
+            for listener in bus._listeners:
+                self.bus_targets.append(self._callback_id(listener))
+            self.bus_offsets.append(len(self.bus_targets))
+
+        self.states = bytearray(net._state.value for net in self._nets)
+        """The state value of each net, as of its last notification."""
+
+        for i, net in enumerate(self._nets):
+            net._frozen = True
+            net._update_buses = self._bit_updater(i)  # type: ignore[method-assign]
+            net._notify_listeners = self._net_notifier(i)  # type: ignore[method-assign]
+        for bus, b in self._buses.items():
+            bus._frozen = True
+            notify = self._bus_notifier(bus, b)
+            bus._notify_listeners = notify  # type: ignore[method-assign]
+
+    def _callback_id(self, listener: Any) -> int:
+        """
+        Register the function a listener calls.
+
+        :param listener: A net or bus listener.
+        :returns: The callback ID.
+        """
+        if isinstance(listener, (NetChangeCallback, BusValueCallback)):
+            callback = listener._callback
+        else:
+            callback = listener.on_change
+        self._callbacks.append(callback)
+        return len(self._callbacks) - 1
+
+    @property
+    def nets(self) -> list[Net]:
+        """The frozen nets, in index order."""
+        return list(self._nets)
+
+    @property
+    def buses(self) -> list[BusMember]:
+        """The frozen bus members, in index order."""
+        return list(self._buses)
+
+    def index(self, net: Net) -> int:
+        """
+        Get the index of a net.
+
+        :param net: The net.
+        :returns: The index into ``states`` and ``offsets``.
+        :raises KeyError: If the net is not in the netlist.
+        """
+        return self._index[net]
+
+    def _bit_updater(self, i: int) -> Callable[[], None]:
+        """
+        Build the compiled bus bit update of one net.
+
+        :param i: The net index.
+        :returns: The update function.
+        """
+        net = self._nets[i]
+        bit_buses = self._bit_buses
+        bit_masks = self._bit_masks
+        start, end = self.offsets[i], self._bit_ends[i]
+        bits = [~target for target in self.targets[start:end]]
+        HIGH, LOW, FLOATING = NetState.HIGH, NetState.LOW, NetState.FLOATING
+
+        def update():
+            state = net._state
+            deferred = _net._deferred
+            for k in bits:
+                bus = bit_buses[k]
+                if bus._idle:
+                    continue
+                mask = bit_masks[k]
+                if state is HIGH:
+                    bus._high |= mask
+                    bus._floating &= ~mask
+                elif state is LOW:
+                    bus._high &= ~mask
+                    bus._floating &= ~mask
+                else:
+                    bus._floating |= mask
+                bus._value = FLOATING if bus._floating else bus._high
+                deferred[bus] = None
+
+        return update
+
+    def _net_notifier(self, i: int) -> Callable[[], None]:
+        """
+        Build the compiled notification of one net.
+
+        :param i: The net index.
+        :returns: The notification function.
+        """
+        net = self._nets[i]
+        states = self.states
+        callbacks = self._callbacks
+        ids = self.targets[self._bit_ends[i] : self.offsets[i + 1]].tolist()
+
+        def notify():
+            state = net._state
+            states[i] = state.value
+            for target in ids:
+                callbacks[target](state)
+
+        return notify
+
+    def _bus_notifier(self, bus: BusMember, b: int) -> Callable[[], None]:
+        """
+        Build the compiled notification of one bus member.
+
+        :param bus: The bus member.
+        :param b: The bus member index.
+        :returns: The notification function.
+        """
+        callbacks = self._callbacks
+        start, end = self.bus_offsets[b], self.bus_offsets[b + 1]
+        ids = self.bus_targets[start:end].tolist()
+
+        def notify():
+            value = bus._value
+            for target in ids:
+                callbacks[target](value)
+
+        return notify
+
+    def snapshot(self) -> bytes:
+        """
+        Capture the net state mirror.
+
+        :returns: The snapshot.
+        """
+        return bytes(self.states)
+
+    def restore(self, snapshot: bytes):
+        """
+        Return the net state mirror to a captured state.
+
+        :param snapshot: The snapshot.
+        """
+        self.states[:] = snapshot
+
+    def thaw(self):
+        """Restore the object dispatch of all nets and bus members."""
+        for net in self._nets:
+            del net._update_buses
+            del net._notify_listeners
+            net._frozen = False
+        for bus in self._buses:
+            del bus._notify_listeners
+            bus._frozen = False
@@ -0,0 +1,455 @@
+"""
+Nets and buses for many instances of one circuit, stored as NumPy arrays.
+
+A VectorNet holds the state of the same net in K circuit instances,
+and a VectorBusMember packs its bus value for all K instances at once.
+Every operation applies to all instances, or to the instances selected
+by a boolean ``where`` mask, so one event advances every instance that
+shares it, while instances whose delays differ are driven by separate
+events that select them.
+
+This module requires NumPy, which is installed with the ``numpy`` extra.
+"""
+from __future__ import annotations
+
+import abc
+import itertools
+from typing import Callable, Optional, Sequence, Union
+
+try:
+    import numpy as np
+    import numpy.typing as npt
+except ImportError as error:  # pragma: nocover
+    raise ImportError(
+        "sim8bit.wire.vector requires NumPy; install sim8bit[numpy]."
+    ) from error
+
+from ._net import HandleNotOwner, NetState
+
+FLOATING_VALUE = -1
+"""The bus value of an instance with any floating net."""
+
+Where = Optional[npt.ArrayLike]
+"""A boolean mask of the instances to change, or None for all."""
+
+_HIGH = NetState.HIGH.value
+_LOW = NetState.LOW.value
+_FLOATING = NetState.FLOATING.value
+
+_deferred: Optional[dict[VectorBusMember, np.ndarray]] = None
+"""Bus members and their changed instances in the current bus transaction."""
+
+
+def _select(where: Where, instances: int) -> np.ndarray:
+    """
+    Get a boolean mask of selected instances.
+
+    :param where: The instances to select, or None for all.
+    :param instances: The number of instances.
+    :returns: The mask.
+    """
+    if where is None:
+        return np.ones(instances, dtype=bool)
+    return np.asarray(where, dtype=bool)
+
+
+def _notify_nets(nets: Sequence[tuple[VectorNet, np.ndarray]]):
+    """
+    Notify the listeners of several nets as one bus transaction.
+
+    Bus members are notified once after all nets, with the instances
+    changed by any of their nets. See ``_net._notify_nets``.
+
+    :param nets: The nets and the instances that changed.
+    """
+    global _deferred
+    if _deferred is not None:
+        for net, changed in nets:
+            net._notify_listeners(changed)
+        return
+
+    _deferred = {}
+    try:
+        for net, changed in nets:
+            net._notify_listeners(changed)
+    finally:
+        buses = _deferred
+        _deferred = None
+    for bus, changed in buses.items():
+        bus._notify_listeners(changed)
+
+
+class VectorNetListener(metaclass=abc.ABCMeta):  # pragma: nocover
+    """A listener for net state changes across instances."""
+
+    def on_change(self, states: np.ndarray, changed: np.ndarray):
+        """
+        Handle a change in net state.
+
+        :param states: The NetState values of every instance.
+        :param changed: A boolean mask of the instances that changed.
+        """
+        ...
+
+
+class VectorNetCallback(VectorNetListener):
+    """A vector net listener using a callback."""
+
+    def __init__(self, callback: Callable[[np.ndarray, np.ndarray], None]):
+        """
+        Create the callback listener.
+
+        :param callback: The callback.
+        """
+        super().__init__()
+        self._callback = callback
+
+    def on_change(self, states: np.ndarray, changed: np.ndarray):
+        """
+        Trigger the callback.
+
+        :param states: The NetState values of every instance.
+        :param changed: A boolean mask of the instances that changed.
+        """
+        self._callback(states, changed)
+
+
+class VectorNet:
+    """
+    A net in K circuit instances, allowing a single active participant.
+
+    Ownership is shared by all instances, since they are the same
+    circuit. Listeners are only notified of instances whose state
+    actually changed, unless the net is strict.
+    """
+
+    def __init__(self, instances: int, strict: bool = False):
+        """
+        Create the net.
+
+        :param instances: The number of circuit instances.
+        :param strict: If True, notify listeners of every driven instance,
+            even if its state did not change.
+        """
+        self._strict = strict
+        self._owner = 0
+        self._states = np.full(instances, _FLOATING, dtype=np.uint8)
+        self._listeners: list[VectorNetListener] = []
+        self._handles = itertools.count(1)
+
+    def __len__(self) -> int:
+        """Get the number of instances."""
+        return len(self._states)
+
+    def add_listener(self, listener: VectorNetListener):
+        """Add a net state change listener."""
+        self._listeners.append(listener)
+
+    @property
+    def states(self) -> np.ndarray:
+        """
+        Get the net state of every instance.
+
+        :returns: A read-only array of NetState values.
+        """
+        view = self._states.view()
+        view.flags.writeable = False
+        return view
+
+    def take_high(self, handle: int = 0, where: Where = None) -> int:
+        """
+        Try to put the net in a high state.
+
+        :param handle: The access handle.
+        :param where: The instances to change, or None for all.
+        :returns: The handle to use for future access by this owner.
+        :raises HandleNotOwner: if handle is not the owner.
+        """
+        handle, changed = self._drive(_HIGH, handle, where)
+        self._notify_listeners(changed)
+        return handle
+
+    def take_low(self, handle: int = 0, where: Where = None) -> int:
+        """
+        Try to put the net in a low state.
+
+        :param handle: The access handle.
+        :param where: The instances to change, or None for all.
+        :returns: The handle to use for future access by this owner.
+        :raises HandleNotOwner: if handle is not the owner.
+        """
+        handle, changed = self._drive(_LOW, handle, where)
+        self._notify_listeners(changed)
+        return handle
+
+    def release_floating(self, handle: int, where: Where = None):
+        """
+        Try to put the net in a floating state.
+
+        The owner keeps the net until every instance is floating.
+
+        :param handle: The access handle.
+        :param where: The instances to change, or None for all.
+        :raises HandleNotOwner: if handle is not the owner.
+        """
+        self._notify_listeners(self._release(handle, where))
+
+    def _drive(
+        self, state: int, handle: int, where: Where
+    ) -> tuple[int, np.ndarray]:
+        """
+        Change the state of some instances without notifying listeners.
+
+        :param state: The new NetState value.
+        :param handle: The access handle.
+        :param where: The instances to change, or None for all.
+        :returns: The owner handle and a mask of the instances to notify.
+        :raises HandleNotOwner: if handle is not the owner.
+        """
+        if handle != self._owner:
+            raise HandleNotOwner(
+                f"Handle {handle} not allowed to mutate net"
+                + f" owned by {self._owner}."
+            )
+        if handle == 0 and state != _FLOATING:
+            self._owner = next(self._handles)
+
+        selected = _select(where, len(self._states))
+        if self._strict:
+            changed = selected
+        else:
+            changed = selected & (self._states != state)
+        self._states[selected] = state
+        return self._owner, changed
+
+    def _release(self, handle: int, where: Where) -> np.ndarray:
+        """
+        Float some instances without notifying listeners.
+
+        :param handle: The access handle.
+        :param where: The instances to change, or None for all.
+        :returns: A mask of the instances to notify.
+        :raises HandleNotOwner: if handle is not the owner.
+        """
+        _, changed = self._drive(_FLOATING, handle, where)
+        if (self._states == _FLOATING).all():
+            self._owner = 0
+        return changed
+
+    def _notify_listeners(self, changed: np.ndarray):
+        """
+        Notify the listeners of the instances that changed.
+
+        :param changed: A boolean mask of the instances that changed.
+        """
+        if not changed.any():
+            return
+        states = self.states
+        for listener in self._listeners:
+            listener.on_change(states, changed)
+
+
+class VectorBusValueListener(metaclass=abc.ABCMeta):  # pragma: nocover
+    """A listener for bus value changes across instances."""
+
+    def on_change(self, values: np.ndarray, changed: np.ndarray):
+        """
+        Handle a value change.
+
+        :param values: The bus value of every instance (see VectorBusMember.value).
+        :param changed: A boolean mask of the instances that changed.
+        """
+        ...
+
+
+class VectorBusValueCallback(VectorBusValueListener):
+    """A vector bus value listener that triggers a callback."""
+
+    def __init__(self, callback: Callable[[np.ndarray, np.ndarray], None]):
+        """
+        Create the callback listener.
+
+        :param callback: The callback.
+        """
+        super().__init__()
+        self._callback = callback
+
+    def on_change(self, values: np.ndarray, changed: np.ndarray):
+        """
+        Trigger the callback.
+
+        :param values: The bus value of every instance.
+        :param changed: A boolean mask of the instances that changed.
+        """
+        self._callback(values, changed)
+
+
+class _VectorBusNetListener(VectorNetListener):
+    """A listener that notifies a bus member of one of its nets."""
+
+    def __init__(self, bus: VectorBusMember):
+        """
+        Create the listener.
+
+        :param bus: The bus member.
+        """
+        self._bus = bus
+
+    def on_change(self, states: np.ndarray, changed: np.ndarray):
+        """
+        Notify the bus member.
+
+        :param states: The NetState values of every instance.
+        :param changed: A boolean mask of the instances that changed.
+        """
+        self._bus._net_did_change(changed)
+
+
+class VectorBusMember:
+    """A bus member that can read/write the bus of K circuit instances."""
+
+    def __init__(self, nets: Sequence[VectorNet]):
+        """
+        Create the bus interface.
+
+        :param nets: The nets that form the bus, least significant first.
+            All nets must have the same number of instances.
+        :raises ValueError: If the nets differ in number of instances.
+        """
+        if len({len(x) for x in nets}) > 1:
+            raise ValueError("Bus nets differ in number of instances.")
+        self._nets = nets
+        self._listeners: list[VectorBusValueListener] = []
+        self._handles = [0 for _ in self._nets]
+        self._shifts = np.arange(len(nets), dtype=np.uint64)
+        for x in self._nets:
+            x.add_listener(_VectorBusNetListener(self))
+
+    def __len__(self) -> int:
+        """Get the number of nets in the bus."""
+        return len(self._nets)
+
+    def __getitem__(self, idx: int) -> VectorNet:
+        """Get a net from the bus."""
+        return self._nets[idx]
+
+    def add_listener(self, listener: VectorBusValueListener):
+        """Add a bus value listener."""
+        self._listeners.append(listener)
+
+    def _bits(self) -> np.ndarray:
+        """
+        Get the net states of every instance.
+
+        :returns: An array of NetState values, shaped (instances, nets).
+        """
+        return np.stack([x._states for x in self._nets], axis=1)
+
+    @property
+    def floating_mask(self) -> np.ndarray:
+        """
+        Get the bits of the bus whose nets are floating.
+
+        :returns: An array of bit masks, one per instance.
+        """
+        return self._pack(self._bits() == _FLOATING)
+
+    @property
+    def value(self) -> np.ndarray:
+        """
+        Get the value on the bus of every instance.
+
+        The nets are bit-packed for all instances at once.
+
+        :returns: An int64 array of unsigned values,
+            with FLOATING_VALUE for instances with any floating net.
+        """
+        bits = self._bits()
+        values = self._pack(bits == _HIGH).astype(np.int64)
+        values[(bits == _FLOATING).any(axis=1)] = FLOATING_VALUE
+        return values
+
+    def _pack(self, bits: np.ndarray) -> np.ndarray:
+        """
+        Pack boolean bits into integers.
+
+        :param bits: An array of bits, shaped (instances, nets),
+            least significant first.
+        :returns: A uint64 array of packed values.
+        """
+        packed = np.packbits(bits, axis=1, bitorder="little")
+        padded = np.zeros((len(bits), 8), dtype=np.uint8)
+        padded[:, : packed.shape[1]] = packed
+        return padded.view("<u8")[:, 0]
+
+    @property
+    def _instances(self) -> int:
+        """The number of instances."""
+        return len(self._nets[0]) if self._nets else 0
+
+    def write(self, values: Union[int, npt.ArrayLike], where: Where = None):
+        """
+        Write unsigned integer values to the bus.
+
+        All nets are updated before any listener is notified,
+        and each bus member on the nets is notified once.
+
+        :param values: One value for all instances, or one per instance.
+        :param where: The instances to change, or None for all.
+        :raises ValueError: If any value is negative.
+        """
+        selected = _select(where, self._instances)
+        values = np.broadcast_to(np.asarray(values, dtype=np.int64), selected.shape)
+        if (values < 0).any():
+            raise ValueError
+        high = ((values.astype(np.uint64)[:, None] >> self._shifts) & 1).astype(bool)
+
+        changed: list[tuple[VectorNet, np.ndarray]] = []
+        try:
+            for i, x in enumerate(self._nets):
+                bit = high[:, i]
+                handle, rising = x._drive(_HIGH, self._handles[i], selected & bit)
+                handle, falling = x._drive(_LOW, handle, selected & ~bit)
+                self._handles[i] = handle
+                changed.append((x, rising | falling))
+        finally:
+            _notify_nets(changed)
+
+    def float_(self, where: Where = None):
+        """
+        Put the bus in a floating state.
+
+        :param where: The instances to change, or None for all.
+        """
+        changed: list[tuple[VectorNet, np.ndarray]] = []
+        try:
+            for i, x in enumerate(self._nets):
+                changed.append((x, x._release(self._handles[i], where)))
+                self._handles[i] = x._owner
+        finally:
+            _notify_nets(changed)
+
+    def _net_did_change(self, changed: np.ndarray):
+        """
+        Handle a change in one of the bus nets.
+
+        Inside a bus transaction the notification is deferred
+        until all nets have been updated.
+
+        :param changed: A boolean mask of the instances that changed.
+        """
+        if _deferred is not None:
+            previous = _deferred.get(self)
+            _deferred[self] = changed if previous is None else previous | changed
+        else:
+            self._notify_listeners(changed)
+
+    def _notify_listeners(self, changed: np.ndarray):
+        """
+        Notify the listeners of the instances whose value changed.
+
+        :param changed: A boolean mask of the instances that changed.
+        """
+        values = self.value
+        for listener in self._listeners:
+            listener.on_change(values, changed)
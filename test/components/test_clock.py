@@ -0,0 +1,123 @@
+import unittest.mock as mock
+
+import pytest
+from sim8bit.components.clock import Clock
+from sim8bit.events import EventScheduler, Timestamp
+from sim8bit.wire import Net, NetChangeCallback, NetState
+
+
+def ns(value: int) -> Timestamp:
+    return Timestamp.from_nanoseconds(value)
+
+
+@pytest.fixture
+def sched() -> EventScheduler:
+    return EventScheduler()
+
+
+def record_edges(sched: EventScheduler, net: Net) -> list[tuple[int, NetState]]:
+    edges = []
+    net.add_listener(
+        NetChangeCallback(lambda state: edges.append((sched.now_ns, state)))
+    )
+    return edges
+
+
+def test_edges_follow_period_and_duty(sched: EventScheduler):
+    net = Net()
+    edges = record_edges(sched, net)
+    uut = Clock(sched, net, ns(100), duty=0.25, start=ns(10))
+
+    sched.run_until(ns(250))
+
+    assert edges == [
+        (0, NetState.LOW),
+        (10, NetState.HIGH),
+        (35, NetState.LOW),
+        (110, NetState.HIGH),
+        (135, NetState.LOW),
+        (210, NetState.HIGH),
+        (235, NetState.LOW),
+    ]
+    assert uut.cycles == 3
+    assert sched.pending == 1
+
+
+def test_reuses_one_event(sched: EventScheduler):
+    submit = mock.Mock(wraps=sched.submit)
+    sched.submit = submit
+    uut = Clock.from_frequency(sched, Net(), 1e6, start=ns(0))
+
+    stats = sched.run_until(ns(10000))
+
+    assert submit.call_count == 1
+    assert stats.events == 21
+    assert uut.period == ns(1000)
+
+
+def test_stop_gates_low_and_start_restarts(sched: EventScheduler):
+    net = Net()
+    uut = Clock(sched, net, ns(100), start=ns(0))
+    sched.run_until(ns(20))
+    assert net.state == NetState.HIGH
+
+    uut.stop()
+    sched.run_until(ns(500))
+
+    assert net.state == NetState.LOW
+    assert not uut.running
+    assert uut.cycles == 1
+
+    uut.start()
+    sched.run_until(ns(520))
+    assert net.state == NetState.HIGH
+    assert uut.cycles == 2
+
+
+def test_listener_can_stop_clock_on_edge(sched: EventScheduler):
+    net = Net()
+    uut = Clock(sched, net, ns(100), start=ns(0))
+    net.add_listener(
+        NetChangeCallback(lambda state: uut.cycles == 3 and uut.stop())
+    )
+
+    sched.run_until_idle()
+
+    assert uut.cycles == 3
+    assert net.state == NetState.LOW
+
+
+def test_skip_to_keeps_phase(sched: EventScheduler):
+    net = Net()
+    uut = Clock(sched, net, ns(100), duty=0.3, start=ns(0))
+    sched.run_until(ns(10))
+
+    uut.skip_to(ns(1015))
+    assert net.state == NetState.HIGH
+    assert uut.cycles == 11
+
+    sched.run_until(ns(1020))
+    assert net.state == NetState.HIGH
+    sched.run_until(ns(1030))
+    assert net.state == NetState.LOW
+
+    uut.skip_to(ns(1050))
+    assert net.state == NetState.LOW
+    assert uut.cycles == 11
+    sched.run_until(ns(1100))
+    assert net.state == NetState.HIGH
+    assert uut.cycles == 12
+
+
+def test_skip_to_refuses_observed_clock(sched: EventScheduler):
+    net = Net()
+    uut = Clock(sched, net, ns(100), start=ns(0))
+    record_edges(sched, net)
+
+    with pytest.raises(RuntimeError):
+        uut.skip_to(ns(1000))
+
+
+def test_invalid_duty_raises_value_error(sched: EventScheduler):
+    with pytest.raises(ValueError):
+        Clock(sched, Net(), ns(10), duty=0.01)
@@ -1,8 +1,12 @@
+import collections
+import tracemalloc
+import unittest.mock as mock
+
 import pytest
 from sim8bit.components.ram62256lp12 import RAM62256LP12
 from sim8bit.events import EventScheduler, Timestamp
-from sim8bit.error import UndefinedBehavior
-from sim8bit.wire import BusMember, Net
+from sim8bit.error import FloatingNetError, UndefinedBehavior
+from sim8bit.wire import BusMember, Net, NetState
 
 
 @pytest.fixture
@@ -167,3 +171,380 @@ def test_read(
         sched.tick()
 
     assert out == 42
+
+
+def test_read_keeps_one_pending_output_update(
+    sched: EventScheduler,
+    addr_bus: list[Net],
+    data_bus: list[Net],
+    chip_select: Net,
+    output_enable: Net,
+    write_enable: Net,
+    ram_chip: RAM62256LP12,
+):
+    ram_chip.poke(312, 42)
+
+    addr = BusMember(addr_bus)
+    data = BusMember(data_bus)
+    _ = write_enable.take_high()
+    chip_select.take_low()
+    output_enable.take_low()
+
+    for i in range(10):
+        addr.write(i)
+    addr.write(312)
+
+    stats = sched.run_until_idle()
+
+    assert stats.events == 1
+    assert sched.now == Timestamp(0, 120)
+    assert data.value == 42
+
+
+def test_image_accepts_dict_and_bytes(
+    sched: EventScheduler,
+    addr_bus: list[Net],
+    data_bus: list[Net],
+    chip_select: Net,
+    output_enable: Net,
+    write_enable: Net,
+):
+    def make(image) -> RAM62256LP12:
+        return RAM62256LP12(
+            sched,
+            BusMember(addr_bus),
+            BusMember(data_bus),
+            chip_select,
+            output_enable,
+            write_enable,
+            image,
+        )
+
+    assert make({312: 42}).peek(312) == 42
+    assert make(b"\x00\x2a").peek(1) == 42
+    assert len(make(None).view()) == RAM62256LP12.SIZE
+
+
+def test_read_write_cycles_do_not_accumulate_allocations(
+    sched: EventScheduler,
+    addr_bus: list[Net],
+    data_bus: list[Net],
+    chip_select: Net,
+    output_enable: Net,
+    write_enable: Net,
+    ram_chip: RAM62256LP12,
+):
+    addr = BusMember(addr_bus)
+    data = BusMember(data_bus)
+    cs_hdl = chip_select.take_high()
+    oe_hdl = output_enable.take_high()
+    we_hdl = write_enable.take_high()
+    reads: collections.Counter[bool] = collections.Counter()
+
+    # One (offset ns, action) list per cycle, built once and replayed.
+    steps = [
+        (0, lambda i: (addr.write(i), chip_select.take_low(cs_hdl))),
+        (80, lambda i: (write_enable.take_low(we_hdl), data.write(i & 0xFF))),
+        (160, lambda i: write_enable.take_high(we_hdl)),
+        (170, lambda i: (data.float_(), chip_select.take_high(cs_hdl))),
+        (200, lambda i: chip_select.take_low(cs_hdl)),
+        (280, lambda i: output_enable.take_low(oe_hdl)),
+        (420, lambda i: reads.update((data.value == i & 0xFF,))),
+        (420, lambda i: output_enable.take_high(oe_hdl)),
+        (440, lambda i: chip_select.take_high(cs_hdl)),
+    ]
+    cycle_ns = 500
+
+    def step(stamp: Timestamp, cycle: int, index: int):
+        steps[index][1](cycle)
+        if index + 1 < len(steps):
+            cycle_start = stamp.total_nanoseconds - steps[index][0]
+            offset = steps[index + 1][0]
+            driver.args = (cycle, index + 1)
+        else:
+            cycle_start = stamp.total_nanoseconds - steps[index][0] + cycle_ns
+            offset = 0
+            driver.args = (cycle + 1, 0)
+        if driver.args[0] < cycles:
+            driver.reschedule(Timestamp.from_nanoseconds(cycle_start + offset))
+
+    cycles = 20
+    driver = sched.submit(Timestamp(), step, 0, 0)
+    sched.run_until_idle()
+
+    cycles = 1020
+    driver.args = (20, 0)
+    driver.reschedule(sched.now + Timestamp(0, cycle_ns))
+    tracemalloc.start()
+    try:
+        reads.clear()
+        baseline, _ = tracemalloc.get_traced_memory()
+        tracemalloc.reset_peak()
+        sched.run_until_idle()
+        current, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    assert reads == collections.Counter({True: 1000})
+    assert current - baseline < 2 * 1024
+    assert peak - baseline < 8 * 1024
+
+
+def test_fast_read_outputs_without_delay(
+    sched: EventScheduler,
+    addr_bus: list[Net],
+    data_bus: list[Net],
+    chip_select: Net,
+    output_enable: Net,
+    write_enable: Net,
+    ram_chip: RAM62256LP12,
+):
+    ram_chip.poke(1, 11)
+    ram_chip.poke(2, 22)
+    ram_chip.fast = True
+    addr = BusMember(addr_bus)
+    data = BusMember(data_bus)
+    _ = write_enable.take_high()
+    cs_hdl = chip_select.take_low()
+    oe_hdl = output_enable.take_low()
+
+    addr.write(1)
+    assert data.value == 11
+    addr.write(2)
+    assert data.value == 22
+
+    output_enable.take_high(oe_hdl)
+    chip_select.take_high(cs_hdl)
+    assert data.value == NetState.FLOATING
+    assert sched.empty
+
+
+def test_fast_write_skips_timing_checks(
+    sched: EventScheduler,
+    addr_bus: list[Net],
+    data_bus: list[Net],
+    chip_select: Net,
+    output_enable: Net,
+    write_enable: Net,
+):
+    ram_chip = RAM62256LP12(
+        sched,
+        BusMember(addr_bus),
+        BusMember(data_bus),
+        chip_select,
+        output_enable,
+        write_enable,
+        fast=True,
+        check_interval=3,
+    )
+    addr = BusMember(addr_bus)
+    data = BusMember(data_bus)
+    _ = output_enable.take_high()
+    we_hdl = write_enable.take_high()
+    chip_select.take_low()
+
+    def write(value: int):
+        addr.write(value)
+        write_enable.take_low(we_hdl)
+        data.write(value)
+        write_enable.take_high(we_hdl)
+
+    write(1)
+    write(2)
+    assert ram_chip.peek(1) == 1
+    assert ram_chip.peek(2) == 2
+
+    with pytest.raises(UndefinedBehavior):
+        write(3)
+
+
+def test_switch_from_fast_to_timed(
+    sched: EventScheduler,
+    addr_bus: list[Net],
+    data_bus: list[Net],
+    chip_select: Net,
+    output_enable: Net,
+    write_enable: Net,
+    ram_chip: RAM62256LP12,
+):
+    ram_chip.poke(1, 11)
+    ram_chip.poke(2, 22)
+    ram_chip.fast = True
+    addr = BusMember(addr_bus)
+    data = BusMember(data_bus)
+    _ = write_enable.take_high()
+    chip_select.take_low()
+    output_enable.take_low()
+    addr.write(1)
+    assert data.value == 11
+
+    ram_chip.fast = False
+    sched.submit(Timestamp(0, 10), lambda _: addr.write(2))
+    sched.run_until(Timestamp(0, 100))
+    assert data.value == 11
+
+    sched.run_until_idle()
+    assert sched.now == Timestamp(0, 130)
+    assert data.value == 22
+
+
+def test_switch_to_fast_applies_pending_output(
+    sched: EventScheduler,
+    addr_bus: list[Net],
+    data_bus: list[Net],
+    chip_select: Net,
+    output_enable: Net,
+    write_enable: Net,
+    ram_chip: RAM62256LP12,
+):
+    ram_chip.poke(3, 33)
+    addr = BusMember(addr_bus)
+    data = BusMember(data_bus)
+    _ = write_enable.take_high()
+    chip_select.take_low()
+    output_enable.take_low()
+    addr.write(3)
+    assert sched.pending == 1
+
+    ram_chip.fast = True
+
+    assert data.value == 33
+    assert sched.pending == 0
+
+
+def test_deselected_address_changes_are_ignored(
+    sched: EventScheduler,
+    addr_bus: list[Net],
+    data_bus: list[Net],
+    chip_select: Net,
+    output_enable: Net,
+    write_enable: Net,
+    ram_chip: RAM62256LP12,
+):
+    ram_chip.poke(9, 99)
+    addr = BusMember(addr_bus)
+    data = BusMember(data_bus)
+    _ = write_enable.take_high()
+    cs_handle = chip_select.take_high()
+    output_enable.take_low()
+    schedule = mock.Mock(wraps=ram_chip._schedule_output_update)
+    ram_chip._schedule_output_update = schedule
+
+    for i in range(10):
+        addr.write(i)
+    assert schedule.call_count == 0
+
+    sched.run_until(Timestamp(0, 200))
+    chip_select.take_low(cs_handle)
+    stats = sched.run_until_idle()
+
+    # The read delay counts from the select, not the address change.
+    assert stats.events == 1
+    assert sched.now == Timestamp(0, 320)
+    assert data.value == 99
+
+
+def test_deselected_chip_leaves_shared_data_bus_alone(
+    sched: EventScheduler,
+    addr_bus: list[Net],
+    data_bus: list[Net],
+    chip_select: Net,
+    output_enable: Net,
+    write_enable: Net,
+    ram_chip: RAM62256LP12,
+):
+    other_select = Net()
+    _ = other_select.take_high()
+    RAM62256LP12(
+        sched,
+        BusMember(addr_bus),
+        BusMember(data_bus),
+        other_select,
+        output_enable,
+        write_enable,
+    )
+    ram_chip.poke(5, 55)
+    addr = BusMember(addr_bus)
+    data = BusMember(data_bus)
+    _ = write_enable.take_high()
+    oe_handle = output_enable.take_low()
+    chip_select.take_low()
+    addr.write(5)
+    sched.run_until_idle()
+    assert data.value == 55
+
+    output_enable.take_high(oe_handle)
+    stats = sched.run_until_idle()
+
+    # Only the selected chip floats the bus it was driving.
+    assert stats.events == 1
+    assert data.value == NetState.FLOATING
+
+
+def test_floating_address_raises_at_output(
+    sched: EventScheduler,
+    chip_select: Net,
+    output_enable: Net,
+    write_enable: Net,
+    ram_chip: RAM62256LP12,
+):
+    _ = write_enable.take_high()
+    chip_select.take_low()
+    output_enable.take_low()
+
+    with pytest.raises(FloatingNetError):
+        sched.run_until_idle()
+
+
+@pytest.mark.parametrize("fast", [False, True])
+def test_select_before_address_reads_in_both_modes(
+    fast: bool,
+    sched: EventScheduler,
+    addr_bus: list[Net],
+    data_bus: list[Net],
+    chip_select: Net,
+    output_enable: Net,
+    write_enable: Net,
+    ram_chip: RAM62256LP12,
+):
+    ram_chip.fast = fast
+    ram_chip.poke(3, 9)
+    addr = BusMember(addr_bus)
+    data = BusMember(data_bus)
+    _ = write_enable.take_high()
+    output_enable.take_low()
+    sched.submit(Timestamp(0, 10), lambda _: chip_select.take_low())
+    sched.submit(Timestamp(0, 20), lambda _: addr.write(3))
+
+    sched.run_until_idle()
+
+    assert data.value == 9
+
+
+def test_direct_cycles_bypass_the_nets(
+    sched: EventScheduler,
+    data_bus: list[Net],
+    chip_select: Net,
+    ram_chip: RAM62256LP12,
+):
+    data = BusMember(data_bus)
+    cs_hdl = chip_select.take_high()
+    with pytest.raises(RuntimeError):
+        ram_chip.write_cycle(4, 44)
+    ram_chip.fast = True
+
+    ram_chip.write_cycle(4, 44)
+
+    assert ram_chip.read_cycle(4) == 44
+    assert ram_chip.peek(4) == 44
+    for addr in (-1, RAM62256LP12.SIZE):
+        with pytest.raises(IndexError):
+            ram_chip.write_cycle(addr, 7)
+        with pytest.raises(IndexError):
+            ram_chip.read_cycle(addr)
+    assert ram_chip.peek(RAM62256LP12.SIZE - 1) == 0
+    assert data.value == NetState.FLOATING
+    assert sched.empty
+    chip_select.take_low(cs_hdl)
+    with pytest.raises(RuntimeError):
+        ram_chip.read_cycle(4)
@@ -0,0 +1,47 @@
+import pytest
+from sim8bit.components.ram62256lp12 import RAM62256LP12
+from sim8bit.components.timing import TimedComponent, TimingTable
+
+
+class Chip(TimedComponent):
+    MAX_TIME_A_TO_B_NS = 10
+    MIN_TIME_PULSE_NS = 5
+    OTHER_NS = 3
+
+
+class FastChip(Chip):
+    MAX_TIME_A_TO_B_NS = 7
+
+
+def test_compiles_timing_constants():
+    assert dict(Chip.timing) == {"max_a_to_b": 10, "min_pulse": 5}
+
+
+def test_attribute_access():
+    assert Chip.timing.max_a_to_b == 10
+    assert Chip().timing.min_pulse == 5
+
+
+def test_missing_parameter_raises_attribute_error():
+    with pytest.raises(AttributeError, match="no_such"):
+        _ = Chip.timing.no_such
+
+
+def test_subclass_gets_own_table():
+    assert FastChip.timing.max_a_to_b == 7
+    assert FastChip.timing.min_pulse == 5
+    assert Chip.timing.max_a_to_b == 10
+
+
+def test_table_mapping():
+    uut = TimingTable({"max_x": 1})
+    assert uut["max_x"] == 1
+    assert len(uut) == 1
+    assert list(uut) == ["max_x"]
+
+
+def test_ram_timing():
+    timing = RAM62256LP12.timing
+    assert timing.max_addr_set_to_data_out == 120
+    assert timing.min_write_pulse == 70
+    assert len(timing) == 9
@@ -1,4 +1,7 @@
+from sim8bit.components.ram62256lp12 import RAM62256LP12
+from sim8bit.error import UndefinedBehavior
 from sim8bit.events import EventScheduler, Timestamp
+from sim8bit.wire import BusMember, BusValueCallback, Net, NetChangeCallback, NetState
 import unittest.mock as mock
 import pytest
 
@@ -81,3 +84,463 @@ def test_now_read_only():
     uut = EventScheduler()
     with pytest.raises(AttributeError):
         uut.now = mock.Mock(0)  # type: ignore
+
+
+def test_many_events_processed_in_timestamp_then_submission_order():
+    order = []
+    stamps = [Timestamp(0, (i * 37) % 11) for i in range(50)]
+
+    uut = EventScheduler()
+    for i, stamp in enumerate(stamps):
+        uut.submit(stamp, lambda s, i=i: order.append((s, i)))
+
+    while not uut.empty:
+        uut.tick()
+
+    expected = sorted(zip(stamps, range(50)), key=lambda x: (x[0].nanoseconds, x[1]))
+    assert order == expected
+
+
+def _submit_at(uut: EventScheduler, *nanoseconds: int) -> list[mock.Mock]:
+    handlers = []
+    for ns in nanoseconds:
+        handler = mock.Mock()
+        uut.submit(Timestamp(0, ns), handler)
+        handlers.append(handler)
+    return handlers
+
+
+def test_run_until_processes_events_up_to_stamp():
+    uut = EventScheduler()
+    first, second, third = _submit_at(uut, 10, 20, 30)
+
+    stats = uut.run_until(Timestamp(0, 20))
+
+    first.assert_called_once_with(Timestamp(0, 10))
+    second.assert_called_once_with(Timestamp(0, 20))
+    third.assert_not_called()
+    assert stats.events == 2
+    assert not uut.empty
+
+
+def test_run_until_advances_now_to_stamp():
+    uut = EventScheduler()
+    _submit_at(uut, 10)
+
+    stats = uut.run_until(Timestamp(0, 50))
+
+    assert uut.now == Timestamp(0, 50)
+    assert stats.start == Timestamp()
+    assert stats.end == Timestamp(0, 50)
+    assert stats.elapsed == Timestamp(0, 50)
+
+
+def test_run_for_is_relative_to_now():
+    uut = EventScheduler()
+    first, second = _submit_at(uut, 10, 30)
+    uut.run_until(Timestamp(0, 5))
+
+    stats = uut.run_for(Timestamp(0, 10))
+
+    first.assert_called_once()
+    second.assert_not_called()
+    assert stats.elapsed == Timestamp(0, 10)
+    assert uut.now == Timestamp(0, 15)
+
+
+def test_run_until_idle_empties_queue():
+    uut = EventScheduler()
+    handlers = _submit_at(uut, 30, 10, 20)
+
+    stats = uut.run_until_idle()
+
+    for handler in handlers:
+        handler.assert_called_once()
+    assert stats.events == 3
+    assert uut.empty
+    assert uut.now == Timestamp(0, 30)
+
+
+def test_run_until_idle_processes_events_submitted_while_running():
+    uut = EventScheduler()
+    handler = mock.Mock()
+    uut.submit(Timestamp(0, 10), lambda s: uut.submit(s + Timestamp(0, 5), handler))
+
+    stats = uut.run_until_idle()
+
+    handler.assert_called_once_with(Timestamp(0, 15))
+    assert stats.events == 2
+
+
+def test_run_until_idle_max_events():
+    uut = EventScheduler()
+    first, second = _submit_at(uut, 10, 20)
+
+    stats = uut.run_until_idle(max_events=1)
+
+    first.assert_called_once()
+    second.assert_not_called()
+    assert stats.events == 1
+
+
+def test_run_while_stops_when_predicate_false():
+    uut = EventScheduler()
+    first, second = _submit_at(uut, 10, 20)
+
+    stats = uut.run_while(lambda: first.call_count == 0)
+
+    first.assert_called_once()
+    second.assert_not_called()
+    assert stats.events == 1
+
+
+def test_run_while_stops_when_idle():
+    uut = EventScheduler()
+    _submit_at(uut, 10, 20)
+
+    stats = uut.run_while(lambda: True)
+
+    assert stats.events == 2
+    assert uut.empty
+
+
+def test_submit_returns_pending_event():
+    uut = EventScheduler()
+    event = uut.submit(Timestamp(0, 10), mock.Mock())
+    assert event.pending
+    assert event.stamp == Timestamp(0, 10)
+
+
+def test_cancelled_event_not_called():
+    uut = EventScheduler()
+    cancelled, kept = _submit_at(uut, 10, 20)
+    event = uut.submit(Timestamp(0, 5), cancelled)
+
+    event.cancel()
+    stats = uut.run_until_idle()
+
+    cancelled.assert_called_once_with(Timestamp(0, 10))
+    kept.assert_called_once()
+    assert not event.pending
+    assert stats.events == 2
+
+
+def test_cancel_only_event_makes_scheduler_empty():
+    uut = EventScheduler()
+    event = uut.submit(Timestamp(0, 10), mock.Mock())
+
+    event.cancel()
+
+    assert uut.empty
+    with pytest.raises(IndexError):
+        uut.tick()
+
+
+def test_cancel_twice_is_noop():
+    uut = EventScheduler()
+    event = uut.submit(Timestamp(0, 10), mock.Mock())
+    _submit_at(uut, 20)
+
+    event.cancel()
+    event.cancel()
+
+    assert not uut.empty
+
+
+def test_reschedule_pending_event_moves_it():
+    uut = EventScheduler()
+    handler = mock.Mock()
+    event = uut.submit(Timestamp(0, 10), handler)
+
+    event.reschedule(Timestamp(0, 30))
+    stats = uut.run_until_idle()
+
+    handler.assert_called_once_with(Timestamp(0, 30))
+    assert stats.events == 1
+
+
+def test_reschedule_orders_after_same_timestamp_events():
+    uut = EventScheduler()
+    order = []
+    event = uut.submit(Timestamp(0, 10), lambda _: order.append("moved"))
+    uut.submit(Timestamp(0, 20), lambda _: order.append("other"))
+
+    event.reschedule(Timestamp(0, 20))
+    uut.run_until_idle()
+
+    assert order == ["other", "moved"]
+
+
+def test_reschedule_rearms_finished_event():
+    uut = EventScheduler()
+    handler = mock.Mock()
+    event = uut.submit(Timestamp(0, 10), handler)
+    uut.run_until_idle()
+
+    event.reschedule(Timestamp(0, 20))
+
+    assert event.pending
+    assert not uut.empty
+    uut.run_until_idle()
+    assert handler.call_count == 2
+
+
+def test_many_cancellations_compact_queue():
+    uut = EventScheduler()
+    handler = mock.Mock()
+    event = uut.submit(Timestamp(0, 10), handler)
+    for i in range(10000):
+        event.reschedule(Timestamp(0, 10 + i))
+
+    assert len(uut._events) < 2048
+    uut.run_until_idle()
+    handler.assert_called_once_with(Timestamp(0, 10009))
+
+
+def test_run_reports_suppressed_notifications():
+    net = Net()
+    uut = EventScheduler()
+    handle = net.take_high()
+    uut.submit(Timestamp(0, 10), lambda _: net.take_high(handle))
+    uut.submit(Timestamp(0, 20), lambda _: net.take_low(handle))
+
+    stats = uut.run_until_idle()
+
+    assert stats.suppressed_notifications == 1
+
+
+def test_nested_run_reports_its_own_suppressed_notifications():
+    net = Net()
+    uut = EventScheduler()
+    inner = EventScheduler()
+    handle = net.take_high()
+    inner.submit(Timestamp(0, 5), lambda _: net.take_high(handle))
+    inner.submit(Timestamp(0, 6), lambda _: net.take_high(handle))
+    inner_stats = []
+    uut.submit(Timestamp(0, 10), lambda _: net.take_high(handle))
+    uut.submit(Timestamp(0, 20), lambda _: inner_stats.append(inner.run_until_idle()))
+
+    stats = uut.run_until_idle()
+
+    assert stats.suppressed_notifications == 1
+    assert inner_stats[0].suppressed_notifications == 2
+
+
+def test_submit_passes_args_after_stamp():
+    handler = mock.Mock()
+    uut = EventScheduler()
+    event = uut.submit(Timestamp(0, 10), handler, 1, "two")
+
+    uut.tick()
+
+    handler.assert_called_once_with(Timestamp(0, 10), 1, "two")
+    assert event.args == (1, "two")
+
+
+def test_rearmed_event_uses_updated_args():
+    handler = mock.Mock()
+    uut = EventScheduler()
+    event = uut.submit(Timestamp(0, 10), handler, 1)
+    uut.run_until_idle()
+
+    event.args = (2,)
+    event.reschedule(Timestamp(0, 20))
+    uut.run_until_idle()
+
+    handler.assert_called_with(Timestamp(0, 20), 2)
+
+
+def test_restore_returns_to_snapshot():
+    handler = mock.Mock()
+    uut = EventScheduler()
+    kept = uut.submit(Timestamp(0, 10), handler, "kept")
+    uut.submit(Timestamp(0, 5), handler, "done")
+    uut.tick()
+    snapshot = uut.snapshot()
+
+    kept.args = ("changed",)
+    kept.reschedule(Timestamp(0, 50))
+    extra = uut.submit(Timestamp(0, 20), handler, "extra")
+    uut.run_until_idle()
+    late = uut.submit(Timestamp(0, 60), handler, "late")
+
+    uut.restore(snapshot)
+
+    assert uut.now == Timestamp(0, 5)
+    assert uut.pending == 1
+    assert kept.pending
+    assert not extra.pending
+    assert not late.pending
+    handler.reset_mock()
+    uut.run_until_idle()
+    handler.assert_called_once_with(Timestamp(0, 10), "kept")
+
+
+def test_restore_can_fork_repeatedly():
+    handler = mock.Mock()
+    uut = EventScheduler()
+    uut.submit(Timestamp(0, 10), handler, 1)
+    uut.submit(Timestamp(0, 10), handler, 2)
+    snapshot = uut.snapshot()
+
+    for _ in range(3):
+        uut.restore(snapshot)
+        uut.submit(Timestamp(0, 10), handler, 3)
+        handler.reset_mock()
+        uut.run_until_idle()
+        assert [c.args[1] for c in handler.call_args_list] == [1, 2, 3]
+
+
+def test_delta_cycles_suppress_glitches():
+    listener = mock.Mock()
+    net = Net()
+    net.add_listener(listener)
+    handle = net.take_low()
+    uut = EventScheduler(delta_cycles=True)
+    uut.submit(Timestamp(0, 10), lambda _: net.take_high(handle))
+    uut.submit(Timestamp(0, 10), lambda _: net.take_low(handle))
+    uut.submit(Timestamp(0, 20), lambda _: net.take_high(handle))
+
+    stats = uut.run_until_idle()
+
+    assert stats.events == 3
+    assert stats.suppressed_notifications == 1
+    assert listener.on_change.call_args_list == [
+        mock.call(NetState.LOW),
+        mock.call(NetState.HIGH),
+    ]
+
+
+def test_delta_cycles_notify_bus_once_per_timestamp():
+    nets = [Net() for _ in range(4)]
+    callback = mock.Mock()
+    BusMember(nets).add_listener(BusValueCallback(callback))
+    handles = [0] * 4
+
+    def drive(_, i: int):
+        handles[i] = nets[i].take_high(handles[i])
+
+    uut = EventScheduler(delta_cycles=True)
+    for i in range(4):
+        uut.submit(Timestamp(0, 10), drive, i)
+
+    uut.tick()
+
+    callback.assert_called_once_with(15)
+    assert uut.now == Timestamp(0, 10)
+
+
+def test_delta_cycles_settle_listener_changes():
+    first, second = Net(), Net()
+    seen = []
+    first.add_listener(NetChangeCallback(lambda state: second.take_high()))
+    second.add_listener(NetChangeCallback(lambda state: seen.append(uut.now)))
+    uut = EventScheduler(delta_cycles=True)
+    uut.submit(Timestamp(0, 10), lambda _: first.take_high())
+
+    uut.run_until(Timestamp(0, 10))
+
+    assert second.state == NetState.HIGH
+    assert seen == [Timestamp(0, 10)]
+
+
+def test_delta_cycles_raise_if_unstable():
+    net = Net()
+    handle = net.take_low()
+
+    def invert(state: NetState):
+        if state == NetState.LOW:
+            net.take_high(handle)
+        else:
+            net.take_low(handle)
+
+    net.add_listener(NetChangeCallback(invert))
+    uut = EventScheduler(delta_cycles=True)
+    uut.MAX_DELTA_CYCLES = 10
+    uut.submit(Timestamp(0, 10), lambda _: net.take_high(handle))
+
+    with pytest.raises(RuntimeError, match="did not settle"):
+        uut.run_until_idle()
+
+    # The delta cycle is closed, so nets notify immediately again.
+    other = Net()
+    listener = mock.Mock()
+    other.add_listener(listener)
+    other.take_high()
+    listener.on_change.assert_called_once_with(NetState.HIGH)
+
+
+@pytest.mark.parametrize(
+    "inner_delta_cycles, inner_order",
+    [(False, ["inner", "handler"]), (True, ["handler", "inner"])],
+)
+def test_nested_run_keeps_enclosing_delta(
+    inner_delta_cycles: bool, inner_order: list[str]
+):
+    outer_net, inner_net = Net(), Net()
+    seen = []
+    outer_net.add_listener(NetChangeCallback(lambda _: seen.append("outer")))
+    inner_net.add_listener(NetChangeCallback(lambda _: seen.append("inner")))
+    inner = EventScheduler(delta_cycles=inner_delta_cycles)
+    inner.submit(Timestamp(0, 5), lambda _: inner_net.take_high())
+    inner.submit(Timestamp(0, 5), lambda _: seen.append("handler"))
+
+    def drive(_):
+        outer_net.take_high()
+        inner.run_until_idle()
+
+    uut = EventScheduler(delta_cycles=True)
+    uut.submit(Timestamp(0, 10), drive)
+    uut.run_until_idle()
+
+    # The inner run notifies its own changes, in its own mode, and the
+    # outer change is notified when the outer delta is flushed.
+    assert seen == [*inner_order, "outer"]
+
+
+@pytest.mark.parametrize("delta_cycles", [False, True])
+def test_delta_mode_reports_same_ram_timing_errors(delta_cycles: bool):
+    uut = EventScheduler(delta_cycles=delta_cycles)
+    addr_nets = [Net() for _ in range(15)]
+    data_nets = [Net() for _ in range(8)]
+    cs, oe, we = Net(), Net(), Net()
+    RAM62256LP12(uut, BusMember(addr_nets), BusMember(data_nets), cs, oe, we)
+    addr, data = BusMember(addr_nets), BusMember(data_nets)
+    cs_handle = cs.take_high()
+    _ = oe.take_high()
+    we_handle = we.take_high()
+
+    def select(_):
+        addr.write(3)
+        cs.take_low(cs_handle)
+
+    def start(_):
+        we.take_low(we_handle)
+        data.write(1)
+
+    def end(_):
+        data.write(7)
+        we.take_high(we_handle)
+
+    uut.submit(Timestamp(0, 0), select)
+    uut.submit(Timestamp(0, 80), start)
+    uut.submit(Timestamp(0, 160), end)
+
+    with pytest.raises(UndefinedBehavior, match="data stable time"):
+        uut.run_until_idle()
+
+
+def test_bus_value_is_final_in_delta_net_listeners():
+    uut = EventScheduler(delta_cycles=True)
+    nets = [Net() for _ in range(4)]
+    driver = BusMember(nets)
+    reader = BusMember(nets)
+    seen = []
+    nets[0].add_listener(NetChangeCallback(lambda _: seen.append(reader.value)))
+    uut.submit(Timestamp(0, 10), lambda _: driver.write(1))
+    uut.submit(Timestamp(0, 20), lambda _: driver.write(9))
+
+    uut.run_until_idle()
+
+    assert seen == [1]
+    assert reader.value == 9
@@ -0,0 +1,304 @@
+import pytest
+from sim8bit.components.clock import Clock
+from sim8bit.components.ram62256lp12 import RAM62256LP12
+from sim8bit.events import (
+    EventScheduler,
+    Process,
+    Timestamp,
+    change,
+    falling,
+    rising,
+)
+from sim8bit.wire import BusMember, Net, NetState, Netlist
+
+
+def ns(value: int) -> Timestamp:
+    return Timestamp.from_nanoseconds(value)
+
+
+@pytest.fixture
+def sched() -> EventScheduler:
+    return EventScheduler()
+
+
+def test_delays_resume_in_order(sched: EventScheduler):
+    log = []
+
+    def body(name: str, delay: int):
+        for _ in range(3):
+            log.append((sched.now_ns, name))
+            yield ns(delay)
+
+    Process(sched, body("a", 10))
+    Process(sched, body("b", 15), start=ns(5))
+    sched.run_until_idle()
+
+    assert log == [
+        (0, "a"),
+        (5, "b"),
+        (10, "a"),
+        (20, "b"),
+        (20, "a"),
+        (35, "b"),
+    ]
+
+
+def test_keeps_one_pending_event(sched: EventScheduler):
+    def body():
+        for _ in range(1000):
+            yield ns(1)
+
+    uut = Process(sched, body())
+    for _ in range(500):
+        sched.tick()
+        assert sched.pending == 1
+
+    sched.run_until_idle()
+    assert not uut.alive
+    assert sched.pending == 0
+
+
+def test_waits_for_edges(sched: EventScheduler):
+    clk = Net()
+    Clock(sched, clk, ns(100), start=ns(0))
+    log = []
+
+    def body():
+        state = yield rising(clk)
+        log.append((sched.now_ns, state))
+        state = yield falling(clk)
+        log.append((sched.now_ns, state))
+        state = yield change(clk)
+        log.append((sched.now_ns, state))
+
+    Process(sched, body(), start=ns(10))
+    sched.run_until(ns(300))
+
+    assert log == [
+        (100, NetState.HIGH),
+        (150, NetState.LOW),
+        (200, NetState.HIGH),
+    ]
+
+
+def test_waits_for_bus_change(sched: EventScheduler):
+    nets = [Net() for _ in range(4)]
+    driver = BusMember(nets)
+    values = []
+
+    def body():
+        bus = BusMember(nets)
+        while True:
+            values.append((yield change(bus)))
+
+    Process(sched, body())
+    sched.submit(ns(10), lambda _: driver.write(5))
+    sched.submit(ns(20), lambda _: driver.write(9))
+    sched.run_until_idle()
+
+    assert values == [5, 9]
+
+
+def test_conditions_can_be_reused(sched: EventScheduler):
+    clk = Net()
+    Clock(sched, clk, ns(10), start=ns(0))
+    edges = []
+
+    def body():
+        edge = rising(clk)
+        for _ in range(5):
+            yield edge
+            edges.append(sched.now_ns)
+
+    uut = Process(sched, body())
+    sched.run_until(ns(100))
+
+    assert edges == [10, 20, 30, 40, 50]
+    assert not uut.alive
+    assert len(clk._listeners) == 1
+
+
+def test_waiters_share_one_listener(sched: EventScheduler):
+    net = Net()
+    handle = net.take_low()
+
+    def body():
+        yield rising(net)
+
+    for _ in range(3):
+        Process(sched, body())
+    sched.run_until_idle()
+    assert len(net._listeners) == 1
+
+    net.take_high(handle)
+    sched.run_until_idle()
+    Process(sched, body())
+    sched.run_until_idle()
+    assert len(net._listeners) == 1
+
+
+def test_clock_can_skip_after_process_waited(sched: EventScheduler):
+    clk = Net()
+    clock = Clock(sched, clk, ns(10), start=ns(0))
+
+    def body():
+        yield rising(clk)
+
+    Process(sched, body())
+    sched.run_until(ns(20))
+    clock.skip_to(ns(1005))
+
+    assert clock.cycles == 101
+
+
+def test_waits_on_frozen_net(sched: EventScheduler):
+    clk = Net()
+    Clock(sched, clk, ns(20), start=ns(0))
+    edges = []
+
+    def body():
+        while True:
+            yield rising(clk)
+            edges.append(sched.now_ns)
+            yield ns(10)
+
+    Process(sched, body())
+    # Freeze while the process sleeps between waits.
+    sched.run_until(ns(25))
+    Netlist([clk])
+    sched.run_until(ns(65))
+
+    assert edges == [20, 40, 60]
+
+
+def test_waited_bus_goes_idle_when_done(sched: EventScheduler):
+    nets = [Net() for _ in range(4)]
+    driver = BusMember(nets)
+    bus = BusMember(nets)
+
+    def body():
+        yield change(bus)
+
+    Process(sched, body())
+    sched.run_until_idle()
+    assert not bus._idle
+
+    driver.write(3)
+    sched.run_until_idle()
+    assert bus._idle
+
+
+def test_stop_while_waiting(sched: EventScheduler):
+    net = Net()
+    handle = net.take_low()
+    woken = []
+
+    def body():
+        yield rising(net)
+        woken.append(sched.now_ns)
+
+    uut = Process(sched, body())
+    sched.run_until_idle()
+    uut.stop()
+    net.take_high(handle)
+    sched.run_until_idle()
+
+    assert not uut.alive
+    assert woken == []
+
+
+def test_stop_while_sleeping(sched: EventScheduler):
+    def body():
+        yield ns(10)
+
+    uut = Process(sched, body())
+    sched.tick()
+    uut.stop()
+
+    assert sched.pending == 0
+    assert not uut.alive
+
+
+def test_bad_yield_raises(sched: EventScheduler):
+    def body():
+        yield 10
+
+    uut = Process(sched, body())
+    with pytest.raises(TypeError):
+        sched.run_until_idle()
+    assert not uut.alive
+
+
+def test_error_in_body_propagates(sched: EventScheduler):
+    def body():
+        yield ns(1)
+        raise ValueError("boom")
+
+    uut = Process(sched, body())
+    with pytest.raises(ValueError):
+        sched.run_until_idle()
+    assert not uut.alive
+
+
+def test_wakes_in_delta_mode():
+    sched = EventScheduler(delta_cycles=True)
+    net = Net()
+    handle = net.take_low()
+    woken = []
+
+    def waiter():
+        yield rising(net)
+        woken.append(sched.now_ns)
+
+    def driver():
+        yield ns(10)
+        net.take_high(handle)
+        net.take_low(handle)
+        yield ns(10)
+        net.take_high(handle)
+
+    Process(sched, waiter())
+    Process(sched, driver())
+    sched.run_until_idle()
+
+    assert woken == [20]
+
+
+def test_ram_testbench(sched: EventScheduler):
+    addr_nets = [Net() for _ in range(15)]
+    data_nets = [Net() for _ in range(8)]
+    cs, oe, we = Net(), Net(), Net()
+    RAM62256LP12(sched, BusMember(addr_nets), BusMember(data_nets), cs, oe, we)
+    addr = BusMember(addr_nets)
+    data = BusMember(data_nets)
+    cs_hdl = cs.take_high()
+    oe_hdl = oe.take_high()
+    we_hdl = we.take_high()
+    read = []
+
+    def testbench(cycles: int):
+        for i in range(cycles):
+            addr.write(i)
+            cs.take_low(cs_hdl)
+            yield ns(80)
+            we.take_low(we_hdl)
+            data.write(i * 7 & 255)
+            yield ns(80)
+            we.take_high(we_hdl)
+            yield ns(10)
+            data.float_()
+            cs.take_high(cs_hdl)
+            yield ns(130)
+        for i in range(cycles):
+            addr.write(i)
+            cs.take_low(cs_hdl)
+            oe.take_low(oe_hdl)
+            read.append((yield change(data)))
+            oe.take_high(oe_hdl)
+            cs.take_high(cs_hdl)
+            yield ns(100)
+
+    Process(sched, testbench(20))
+    sched.run_until_idle()
+
+    assert read == [i * 7 & 255 for i in range(20)]
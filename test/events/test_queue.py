@@ -0,0 +1,122 @@
+import random
+import unittest.mock as mock
+
+import pytest
+from sim8bit.events import EventScheduler, HeapQueue, Timestamp, TimingWheelQueue
+
+
+class TestHeapQueue:
+    Queue = HeapQueue
+
+    def test_starts_empty(self):
+        uut = self.Queue()
+        assert len(uut) == 0
+
+    def test_pop_empty_raises_index_error(self):
+        uut = self.Queue()
+        with pytest.raises(IndexError):
+            uut.pop()
+
+    def test_pops_smallest_key_first(self):
+        first = (5, 1, mock.Mock())
+        second = (1000000000, 0, mock.Mock())
+
+        uut = self.Queue()
+        uut.push(second)
+        uut.push(first)
+
+        assert len(uut) == 2
+        assert uut.pop() is first
+        assert uut.pop() is second
+
+    def test_equal_keys_pop_in_sequence_order(self):
+        entries = [(5, i, mock.Mock()) for i in range(5)]
+
+        uut = self.Queue()
+        for entry in reversed(entries):
+            uut.push(entry)
+
+        assert [uut.pop() for _ in entries] == entries
+
+    def test_clear_and_iterate(self):
+        entries = [(5, i, mock.Mock()) for i in range(3)]
+
+        uut = self.Queue()
+        for entry in entries:
+            uut.push(entry)
+
+        assert sorted(uut) == entries
+        uut.clear()
+        assert len(uut) == 0
+
+
+class TestTimingWheelQueue(TestHeapQueue):
+    Queue = TimingWheelQueue
+
+    def test_slots_must_be_power_of_two(self):
+        with pytest.raises(ValueError):
+            TimingWheelQueue(1000)
+        with pytest.raises(ValueError):
+            TimingWheelQueue(32)
+
+    @pytest.mark.parametrize("slots", [64, 256])
+    def test_matches_heap_order_across_window_and_overflow(self, slots: int):
+        rng = random.Random(slots)
+        heap, uut = HeapQueue(), TimingWheelQueue(slots)
+        sequence = 0
+        now = 0
+        popped = []
+        for _ in range(2000):
+            if rng.random() < 0.6 or not len(heap):
+                delay = rng.choice([0, 1, 40, 60, 120, rng.randrange(1000)])
+                entry = (now + delay, sequence, mock.Mock())
+                sequence += 1
+                heap.push(entry)
+                uut.push(entry)
+            else:
+                limit = now + rng.randrange(100)
+                expected = heap.pop_until(limit)
+                assert uut.pop_until(limit) is expected
+                if expected is not None:
+                    now = expected[0]
+                    popped.append(expected)
+        assert len(uut) == len(heap)
+        assert [uut.pop() for _ in range(len(uut))] == [
+            heap.pop() for _ in range(len(heap))
+        ]
+        assert popped
+
+    def test_restored_entries_keep_sequence_order(self):
+        entries = [(5, i, mock.Mock()) for i in range(4)]
+
+        uut = TimingWheelQueue()
+        for entry in (entries[2], entries[0], entries[3], entries[1]):
+            uut.push(entry)
+
+        assert [uut.pop() for _ in entries] == entries
+
+    def test_compact_drops_stale_entries(self):
+        live = mock.Mock(_sequence=0)
+        stale = mock.Mock(_sequence=-1)
+
+        uut = TimingWheelQueue(64)
+        uut.push((5, 0, live))
+        uut.push((6, 1, stale))
+        uut.push((100, 2, stale))
+        uut.compact()
+
+        assert len(uut) == 1
+        assert uut.pop()[2] is live
+
+
+def test_scheduler_with_timing_wheel_keeps_fifo_order():
+    handler = mock.Mock()
+    sched = EventScheduler(TimingWheelQueue(64))
+    for i in range(3):
+        sched.submit(Timestamp(0, 40), handler, i)
+    sched.submit(Timestamp(0, 1000), handler, 3)
+    sched.submit(Timestamp(0, 40), handler, 4)
+
+    sched.run_until_idle()
+
+    assert [c.args[1] for c in handler.call_args_list] == [0, 1, 2, 4, 3]
@@ -78,3 +78,43 @@ def test_ge_not_implemented():
 def test_le_not_implemented():
     with pytest.raises(TypeError):
         _ = Timestamp(2, 0) <= 10
+
+
+def test_normalizes_nanoseconds_into_seconds():
+    stamp = Timestamp(1, 2500000000)
+    assert stamp.seconds == 3
+    assert stamp.nanoseconds == 500000000
+
+
+def test_negative_difference_borrows_seconds():
+    stamp = Timestamp(0, 3) - Timestamp(0, 5)
+    assert stamp.seconds == -1
+    assert stamp.nanoseconds == 999999998
+
+
+def test_from_nanoseconds():
+    assert Timestamp.from_nanoseconds(2000000005) == Timestamp(2, 5)
+
+
+def test_total_nanoseconds():
+    assert Timestamp(2, 5).total_nanoseconds == 2000000005
+
+
+def test_exact_past_float_precision():
+    big = Timestamp.from_nanoseconds(2**60)
+    stamp = big + Timestamp(0, 1)
+    assert stamp.total_nanoseconds == 2**60 + 1
+    assert stamp - big == Timestamp(0, 1)
+
+
+def test_hashable():
+    assert len({Timestamp(1, 0), Timestamp(0, 1000000000)}) == 1
+
+
+def test_fields_read_only():
+    with pytest.raises(AttributeError):
+        Timestamp().seconds = 1  # type: ignore
+
+
+def test_eq_other_type_is_false():
+    assert Timestamp() != 0
@@ -0,0 +1,72 @@
+import io
+import unittest.mock as mock
+
+from sim8bit.events import EventScheduler, EventTrace, Timestamp, TraceRecord
+
+
+def test_records_pairs_in_order():
+    handler = mock.Mock()
+    uut = EventTrace()
+    uut.record((10, handler))
+    uut.record((20, handler))
+
+    assert len(uut) == 2
+    assert list(uut) == [
+        TraceRecord(Timestamp(0, 10), handler),
+        TraceRecord(Timestamp(0, 20), handler),
+    ]
+
+
+def test_keeps_most_recent_records():
+    handler = mock.Mock()
+    uut = EventTrace(capacity=2)
+    for ns in range(5):
+        uut.record((ns, handler))
+
+    assert uut.capacity == 2
+    assert [r.stamp for r in uut] == [Timestamp(0, 3), Timestamp(0, 4)]
+
+
+def test_clear():
+    uut = EventTrace()
+    uut.record((0, mock.Mock()))
+    uut.clear()
+    assert len(uut) == 0
+
+
+def test_dump():
+    uut = EventTrace()
+    uut.record((1000000010, "handler"))
+    stream = io.StringIO()
+
+    uut.dump(stream)
+
+    assert stream.getvalue() == "1 sec 10 ns -- handler\n"
+
+
+def test_scheduler_records_ticks_when_enabled():
+    handler = mock.Mock()
+    sched = EventScheduler()
+    sched.trace = EventTrace()
+    sched.submit(Timestamp(0, 10), handler)
+
+    sched.tick()
+
+    assert list(sched.trace) == [TraceRecord(Timestamp(0, 10), handler)]
+
+
+def test_scheduler_records_runs_when_enabled():
+    handler = mock.Mock()
+    sched = EventScheduler()
+    sched.trace = EventTrace()
+    sched.submit(Timestamp(0, 10), handler)
+    sched.submit(Timestamp(0, 20), handler)
+
+    sched.run_until_idle()
+
+    assert [r.stamp for r in sched.trace] == [Timestamp(0, 10), Timestamp(0, 20)]
+
+
+def test_scheduler_trace_disabled_by_default():
+    sched = EventScheduler()
+    assert sched.trace is None
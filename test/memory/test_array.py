@@ -0,0 +1,87 @@
+import pytest
+from sim8bit.memory import ArrayMemory
+
+
+def test_starts_zeroed():
+    uut = ArrayMemory(16)
+    assert len(uut) == 16
+    assert all(uut.peek(i) == 0 for i in range(16))
+
+
+def test_poke_then_peek():
+    uut = ArrayMemory(16)
+    uut.poke(3, 42)
+    assert uut.peek(3) == 42
+
+
+def test_dict_image():
+    uut = ArrayMemory(16, {1: 10, 15: 20})
+    assert uut.peek(1) == 10
+    assert uut.peek(15) == 20
+    assert uut.peek(0) == 0
+
+
+def test_bytes_image_loaded_at_zero():
+    uut = ArrayMemory(16, b"\x01\x02\x03")
+    assert bytes(uut.dump(0, 4)) == b"\x01\x02\x03\x00"
+
+
+def test_load_at_offset():
+    uut = ArrayMemory(16)
+    uut.load(4, bytearray(b"\xaa\xbb"))
+    assert uut.peek(4) == 0xAA
+    assert uut.peek(5) == 0xBB
+
+
+def test_load_out_of_range_raises_index_error():
+    uut = ArrayMemory(4)
+    with pytest.raises(IndexError):
+        uut.load(3, b"\x00\x00")
+
+
+def test_dump_is_read_only_view():
+    uut = ArrayMemory(16)
+    dump = uut.dump(2, 6)
+    uut.poke(2, 7)
+
+    assert dump.readonly
+    assert dump[0] == 7
+    assert len(dump) == 4
+
+
+def test_view_writes_through():
+    uut = ArrayMemory(16)
+    uut.view()[5] = 9
+    assert uut.peek(5) == 9
+
+
+def test_snapshot_is_copy_on_write():
+    uut = ArrayMemory(16, b"\x01\x02")
+    buffer = uut.view()
+    snapshot = uut.snapshot_memory()
+
+    assert snapshot.obj is buffer.obj
+    uut.poke(0, 9)
+
+    assert snapshot[0] == 1
+    assert uut.view().obj is not buffer.obj
+    assert uut.peek(0) == 9
+
+
+def test_restore_shares_snapshot():
+    uut = ArrayMemory(16, b"\x01\x02")
+    snapshot = uut.snapshot_memory()
+    uut.load(0, b"\x07\x08")
+
+    for _ in range(2):
+        uut.restore_memory(snapshot)
+        assert uut.peek(0) == 1
+        uut.poke(0, 3)
+        assert uut.peek(0) == 3
+
+    assert bytes(snapshot[:2]) == b"\x01\x02"
+
+
+def test_restore_wrong_size_raises_value_error():
+    with pytest.raises(ValueError):
+        ArrayMemory(16).restore_memory(ArrayMemory(8).snapshot_memory())
@@ -0,0 +1,73 @@
+import pathlib
+
+import pytest
+from sim8bit.memory import ArrayMemory, MappedMemory
+
+
+@pytest.fixture
+def image_path(tmp_path: pathlib.Path) -> pathlib.Path:
+    path = tmp_path / "image.bin"
+    path.write_bytes(bytes(range(16)))
+    return path
+
+
+def test_peek_reads_file(image_path: pathlib.Path):
+    with MappedMemory(image_path) as uut:
+        assert len(uut) == 16
+        assert uut.peek(5) == 5
+
+
+def test_writes_are_copy_on_write(image_path: pathlib.Path):
+    with MappedMemory(image_path) as uut:
+        uut.poke(5, 99)
+        uut.load(0, b"\xff")
+        assert uut.peek(5) == 99
+        assert uut.peek(0) == 0xFF
+
+    assert image_path.read_bytes() == bytes(range(16))
+
+
+def test_mappings_do_not_share_writes(image_path: pathlib.Path):
+    with MappedMemory(image_path) as a, MappedMemory(image_path) as b:
+        a.poke(1, 42)
+        assert b.peek(1) == 1
+
+
+def test_read_only(image_path: pathlib.Path):
+    with MappedMemory(image_path, writable=False) as uut:
+        assert not uut.writable
+        with pytest.raises(TypeError):
+            uut.poke(0, 1)
+        with pytest.raises(TypeError):
+            uut.load(0, b"\x01")
+
+
+def test_size_limits_mapping(image_path: pathlib.Path):
+    with MappedMemory(image_path, size=8) as uut:
+        assert len(uut) == 8
+
+
+def test_dump(image_path: pathlib.Path):
+    with MappedMemory(image_path) as uut:
+        dump = uut.dump(2, 5)
+        assert bytes(dump) == b"\x02\x03\x04"
+        dump.release()
+
+
+def test_array_memory_uses_writable_image_in_place(image_path: pathlib.Path):
+    mapped = MappedMemory(image_path)
+    uut = ArrayMemory(16, mapped)
+
+    uut.poke(3, 77)
+
+    assert mapped.peek(3) == 77
+    assert image_path.read_bytes() == bytes(range(16))
+
+
+def test_array_memory_copies_read_only_image(image_path: pathlib.Path):
+    with MappedMemory(image_path, writable=False) as mapped:
+        uut = ArrayMemory(32, mapped)
+        uut.poke(3, 77)
+
+        assert uut.peek(15) == 15
+        assert mapped.peek(3) == 3
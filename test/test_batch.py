@@ -0,0 +1,87 @@
+import pytest
+from sim8bit.batch import BatchJob, run_batch
+from sim8bit.components.ram62256lp12 import RAM62256LP12
+from sim8bit.error import UndefinedBehavior
+from sim8bit.events import EventScheduler, Timestamp
+from sim8bit.wire import BusMember, Net
+
+
+def _copy_circuit(image: memoryview, pulse_ns: int):
+    """Copy byte 0 to byte 1 with a write pulse of a given width."""
+    sched = EventScheduler()
+    addr_bus = [Net() for _ in range(15)]
+    data_bus = [Net() for _ in range(8)]
+    chip_select, output_enable, write_enable = Net(), Net(), Net()
+    ram = RAM62256LP12(
+        sched,
+        BusMember(addr_bus),
+        BusMember(data_bus),
+        chip_select,
+        output_enable,
+        write_enable,
+        image,
+    )
+    addr, data = BusMember(addr_bus), BusMember(data_bus)
+    cs_hdl = chip_select.take_high()
+    _ = output_enable.take_high()
+    we_hdl = write_enable.take_high()
+
+    def write(_):
+        addr.write(1)
+        chip_select.take_low(cs_hdl)
+        write_enable.take_low(we_hdl)
+        data.write(ram.peek(0))
+
+    sched.submit(Timestamp(0, 50), write)
+    sched.submit(
+        Timestamp(0, 50 + pulse_ns), lambda _: write_enable.take_high(we_hdl)
+    )
+    return sched, ram
+
+
+def test_results_in_job_order():
+    jobs = [BatchJob(bytes([i]), params=100) for i in range(8)]
+    jobs[3].params = -90
+
+    results = run_batch(_copy_circuit, jobs, RAM62256LP12.SIZE, workers=2)
+
+    assert [r.memory[:2] for i, r in enumerate(results) if i != 3] == [
+        bytes([i, i]) for i in range(8) if i != 3
+    ]
+    assert all(len(r.memory) == RAM62256LP12.SIZE for r in results)
+    assert results[0].ok
+    assert results[0].stats.events == 2
+    assert results[0].stats.end == Timestamp(0, 150)
+    # Job 3 raises /WE before lowering it, so the write never ends.
+    assert results[3].ok
+    assert results[3].stats.end == Timestamp(0, 50)
+    assert results[3].memory[:2] == b"\x03\x00"
+
+
+def test_errors_are_reported_per_job():
+    jobs = [BatchJob(b"\x07", params=100), BatchJob(b"\x07", params=10)]
+
+    results = run_batch(_copy_circuit, jobs, RAM62256LP12.SIZE, workers=2)
+
+    assert results[0].ok
+    assert isinstance(results[1].error, UndefinedBehavior)
+    assert results[1].stats is None
+    assert results[1].memory[:2] == b"\x07\x00"
+
+
+def test_until_stops_early():
+    jobs = [BatchJob(b"\x07", until=Timestamp(0, 100), params=100)]
+
+    (result,) = run_batch(_copy_circuit, jobs, RAM62256LP12.SIZE, workers=1)
+
+    assert result.stats.events == 1
+    assert result.memory[:2] == b"\x07\x00"
+
+
+def test_oversized_image_raises_value_error():
+    with pytest.raises(ValueError):
+        run_batch(_copy_circuit, [BatchJob(bytes(5))], 4)
+
+
+def test_empty_batch():
+    assert run_batch(_copy_circuit, [], 4) == []
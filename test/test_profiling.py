@@ -0,0 +1,127 @@
+import unittest.mock as mock
+
+import pytest
+from sim8bit.events import EventScheduler, EventTrace, Timestamp
+from sim8bit.profiling import Profiler, handler_name, handler_owner
+from sim8bit.wire import BusMember, BusValueCallback, Net, NetChangeCallback
+
+
+class Component:
+    def __init__(self, sched: EventScheduler, net: Net):
+        self.sched = sched
+        self.net = net
+        self.handle = 0
+
+    def toggle(self, _):
+        if self.net.state.name == "HIGH":
+            self.handle = self.net.take_low(self.handle)
+        else:
+            self.handle = self.net.take_high(self.handle)
+
+
+def test_handler_owner_and_name():
+    sched = EventScheduler()
+    component = Component(sched, Net())
+    assert handler_owner(component.toggle) is component
+    assert handler_name(component.toggle) == "Component.toggle"
+
+    def handler(_):
+        pass
+
+    assert handler_owner(handler) is handler
+    assert handler_name(handler).endswith("handler")
+
+
+def test_counts_events_and_time_per_handler():
+    sched = EventScheduler()
+    component = Component(sched, Net())
+    for ns in range(5):
+        sched.submit(Timestamp(0, ns), component.toggle)
+
+    with Profiler(sched) as uut:
+        sched.run_until_idle()
+
+    stats = uut.snapshot()
+    assert stats.events_by_owner == {component: 5}
+    assert stats.events_by_handler == {"Component.toggle": 5}
+    assert stats.seconds_by_handler["Component.toggle"] > 0
+
+
+def test_counts_net_and_bus_callbacks():
+    sched = EventScheduler()
+    nets = [Net() for _ in range(4)]
+    bus = BusMember(nets)
+    bus.add_listener(BusValueCallback(mock.Mock()))
+    nets[0].add_listener(NetChangeCallback(mock.Mock()))
+    sched.submit(Timestamp(), lambda _: BusMember(nets).write(15))
+
+    with Profiler(sched) as uut:
+        sched.run_until_idle()
+
+    stats = uut.snapshot()
+    # The bit listeners of both members plus the extra listener on net 0.
+    assert stats.net_callbacks[nets[0]] == 3
+    assert stats.net_callbacks[nets[1]] == 2
+    assert stats.bus_callbacks[bus] == 1
+
+
+def test_samples_queue_depth():
+    sched = EventScheduler()
+    for ns in range(10):
+        sched.submit(Timestamp(0, ns), mock.Mock())
+
+    with Profiler(sched, depth_interval=4) as uut:
+        sched.run_until_idle()
+
+    assert uut.snapshot().queue_depth == [
+        (Timestamp(0, 0), 9),
+        (Timestamp(0, 4), 5),
+        (Timestamp(0, 8), 1),
+    ]
+
+
+def test_disable_removes_hooks():
+    sched = EventScheduler()
+    net_notify = Net._notify_listeners
+    uut = Profiler(sched)
+
+    uut.enable()
+    assert uut.enabled
+    assert sched.profiler is uut
+    assert Net._notify_listeners is not net_notify
+    uut.disable()
+
+    assert not uut.enabled
+    assert sched.profiler is None
+    assert Net._notify_listeners is net_notify
+
+
+def test_only_one_profiler_enabled():
+    sched = EventScheduler()
+    with Profiler(sched):
+        with pytest.raises(RuntimeError):
+            Profiler(sched).enable()
+
+
+def test_works_with_trace():
+    sched = EventScheduler()
+    sched.trace = EventTrace()
+    handler = mock.Mock()
+    sched.submit(Timestamp(), handler)
+
+    with Profiler(sched) as uut:
+        sched.tick()
+
+    handler.assert_called_once()
+    assert len(sched.trace) == 1
+    assert sum(uut.snapshot().events_by_handler.values()) == 1
+
+
+def test_reset():
+    sched = EventScheduler()
+    sched.submit(Timestamp(), mock.Mock())
+    with Profiler(sched) as uut:
+        sched.run_until_idle()
+        uut.reset()
+
+    assert uut.snapshot().events_by_owner == {}
@@ -0,0 +1,44 @@
+from sim8bit.components.ram62256lp12 import RAM62256LP12
+from sim8bit.events import EventScheduler, Timestamp
+from sim8bit.snapshot import Snapshot
+from sim8bit.wire import BusMember, Net, NetState
+
+
+def test_fork_after_common_prefix():
+    sched = EventScheduler()
+    addr_bus = [Net() for _ in range(15)]
+    data_bus = [Net() for _ in range(8)]
+    chip_select, output_enable, write_enable = Net(), Net(), Net()
+    ram_addr, ram_data = BusMember(addr_bus), BusMember(data_bus)
+    ram = RAM62256LP12(
+        sched, ram_addr, ram_data, chip_select, output_enable, write_enable
+    )
+    addr, data = BusMember(addr_bus), BusMember(data_bus)
+    write_enable.take_high()
+    oe_hdl = output_enable.take_high()
+    cs_hdl = chip_select.take_high()
+
+    # Prefix: select the chip and enable outputs at address 7.
+    ram.poke(7, 42)
+    addr.write(7)
+    chip_select.take_low(cs_hdl)
+    output_enable.take_low(oe_hdl)
+    sched.run_until(Timestamp(0, 50))
+
+    nets = [*addr_bus, *data_bus, chip_select, output_enable, write_enable]
+    buses = [ram_addr, ram_data, addr, data]
+    snapshot = Snapshot([sched, *nets, *buses, ram])
+    assert len(snapshot) == len(nets) + len(buses) + 2
+
+    for value in (1, 2, 3):
+        snapshot.restore()
+        assert ram.peek(7) == 42
+        ram.poke(7, value)
+        sched.run_until_idle()
+
+        assert sched.now == Timestamp(0, 120)
+        assert data.value == value
+
+        output_enable.take_high(oe_hdl)
+        sched.run_until_idle()
+        assert data.value == NetState.FLOATING
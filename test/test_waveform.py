@@ -0,0 +1,97 @@
+import gzip
+import pathlib
+
+import pytest
+from sim8bit.components.clock import Clock
+from sim8bit.events import EventScheduler, Timestamp
+from sim8bit.waveform import WaveformRecorder
+from sim8bit.wire import BusMember, Net
+
+
+def ns(value: int) -> Timestamp:
+    return Timestamp.from_nanoseconds(value)
+
+
+def test_records_changes_as_vcd(tmp_path: pathlib.Path):
+    sched = EventScheduler()
+    clk = Net()
+    nets = [Net() for _ in range(4)]
+    driver = BusMember(nets)
+    Clock(sched, clk, ns(20), start=ns(0))
+    sched.submit(ns(5), lambda _: driver.write(0b1010))
+    sched.submit(ns(15), lambda _: driver.write(0b1010))
+    sched.submit(ns(25), lambda _: driver.float_())
+    sched.submit(ns(25), lambda _: nets[0].take_low())
+    path = tmp_path / "out.vcd"
+
+    uut = WaveformRecorder(sched, path, chunk_size=2)
+    uut.add_net(clk, "clk")
+    uut.add_bus(BusMember(nets), "data")
+    with uut:
+        sched.run_until(ns(30))
+
+    assert path.read_text() == (
+        "$timescale 1ns $end\n"
+        "$scope module sim8bit $end\n"
+        "$var wire 1 ! clk $end\n"
+        '$var wire 4 " data $end\n'
+        "$upscope $end\n"
+        "$enddefinitions $end\n"
+        "#0\n"
+        "$dumpvars\n"
+        "0!\n"
+        'bzzzz "\n'
+        "$end\n"
+        "1!\n"
+        "#5\n"
+        'b1010 "\n'
+        "#10\n"
+        "0!\n"
+        "#20\n"
+        "1!\n"
+        "#25\n"
+        'bzzzz "\n'
+        'bzzz0 "\n'
+        "#30\n"
+        "0!\n"
+    )
+
+
+def test_compressed_output(tmp_path: pathlib.Path):
+    sched = EventScheduler()
+    net = Net()
+    path = tmp_path / "out.vcd.gz"
+    uut = WaveformRecorder(sched, path, compress=True)
+    uut.add_net(net, "n")
+
+    with uut:
+        sched.submit(ns(3), lambda _: net.take_high())
+        sched.run_until_idle()
+
+    assert gzip.decompress(path.read_bytes()).decode().endswith("#3\n1!\n")
+
+
+def test_signals_cannot_be_added_after_open(tmp_path: pathlib.Path):
+    uut = WaveformRecorder(EventScheduler(), tmp_path / "out.vcd")
+    with uut:
+        with pytest.raises(RuntimeError):
+            uut.add_net(Net(), "late")
+
+
+def test_stops_recording_after_close(tmp_path: pathlib.Path):
+    sched = EventScheduler()
+    net = Net()
+    path = tmp_path / "out.vcd"
+    bus = BusMember([Net() for _ in range(4)])
+    uut = WaveformRecorder(sched, path, chunk_size=1)
+    uut.add_net(net, "n")
+    uut.add_bus(bus, "b")
+    with uut:
+        pass
+    size = path.stat().st_size
+
+    net.take_high()
+
+    assert path.stat().st_size == size
+    assert net._listeners == []
+    assert bus._listeners == []
@@ -1,7 +1,17 @@
 import unittest.mock as mock
 
 import pytest
-from sim8bit.wire import BusMember, BusValueCallback, NetState, Net
+from sim8bit.wire import (
+    BusMember,
+    BusValueCallback,
+    Edge,
+    HandleNotOwner,
+    Net,
+    NetChangeCallback,
+    NetState,
+    Sensitivity,
+    SensitivityGroup,
+)
 
 
 def test_bus_value_callback():
@@ -89,3 +99,244 @@ class TestBusMember:
 
         for x in listeners:
             x.on_change.assert_called_with(5)
+
+    def test_write_notifies_listeners_once_with_final_value(self):
+        bus = [Net() for _ in range(8)]
+        listener = mock.Mock()
+        uut = BusMember(bus)
+        uut.add_listener(listener)
+
+        uut.write(0xA5)
+
+        listener.on_change.assert_called_once_with(0xA5)
+
+    def test_write_notifies_other_members_once(self):
+        bus = [Net() for _ in range(8)]
+        listener = mock.Mock()
+        other = BusMember(bus)
+        other.add_listener(listener)
+        uut = BusMember(bus)
+
+        uut.write(0x5A)
+
+        listener.on_change.assert_called_once_with(0x5A)
+
+    def test_write_net_listeners_see_final_states(self):
+        bus = [Net() for _ in range(4)]
+        seen = []
+        bus[0].add_listener(
+            NetChangeCallback(lambda _: seen.append([b.state for b in bus]))
+        )
+        uut = BusMember(bus)
+
+        uut.write(15)
+
+        assert seen == [[NetState.HIGH] * 4]
+
+    def test_float_notifies_listeners_once(self):
+        bus = [Net() for _ in range(8)]
+        listener = mock.Mock()
+        uut = BusMember(bus)
+        uut.write(0xFF)
+        uut.add_listener(listener)
+
+        uut.float_()
+
+        listener.on_change.assert_called_once_with(NetState.FLOATING)
+
+    def test_listener_writing_another_bus_during_write(self):
+        bus_a = [Net() for _ in range(4)]
+        bus_b = [Net() for _ in range(4)]
+        listener = mock.Mock()
+        uut_a = BusMember(bus_a)
+        uut_b = BusMember(bus_b)
+        uut_b.add_listener(listener)
+        uut_a.add_listener(BusValueCallback(lambda v: uut_b.write(v + 1)))
+
+        uut_a.write(3)
+
+        listener.on_change.assert_called_once_with(4)
+
+    def test_write_failure_notifies_driven_nets(self):
+        bus = [Net() for _ in range(4)]
+        _ = bus[2].take_high()
+        listener = mock.Mock()
+        bus[0].add_listener(listener)
+        uut = BusMember(bus)
+
+        with pytest.raises(HandleNotOwner):
+            uut.write(0)
+
+        listener.on_change.assert_called_once_with(NetState.LOW)
+
+    def test_value_tracks_individual_net_changes(self):
+        bus = [Net() for _ in range(4)]
+        uut = BusMember(bus)
+        handles = [b.take_low() for b in bus]
+
+        bus[3].take_high(handles[3])
+        assert uut.value == 8
+        bus[3].take_low(handles[3])
+        bus[1].take_high(handles[1])
+        assert uut.value == 2
+
+    def test_value_of_already_driven_nets(self):
+        bus = [Net() for _ in range(4)]
+        BusMember(bus).write(9)
+
+        uut = BusMember(bus)
+
+        assert uut.value == 9
+        assert uut.floating_mask == 0
+
+    def test_floating_mask(self):
+        bus = [Net() for _ in range(4)]
+        uut = BusMember(bus)
+        assert uut.floating_mask == 0b1111
+
+        bus[0].take_high()
+        bus[2].take_low()
+
+        assert uut.floating_mask == 0b1010
+        assert uut.value == NetState.FLOATING
+
+    def test_value_after_float_and_rewrite(self):
+        bus = [Net() for _ in range(4)]
+        uut = BusMember(bus)
+
+        uut.write(6)
+        uut.float_()
+        uut.write(5)
+
+        assert uut.value == 5
+
+    def test_rewrite_same_value_does_not_notify(self):
+        bus = [Net() for _ in range(4)]
+        listener = mock.Mock()
+        uut = BusMember(bus)
+        uut.add_listener(listener)
+        uut.write(6)
+        before = Net.suppressed_notifications
+
+        uut.write(6)
+
+        listener.on_change.assert_called_once_with(6)
+        assert Net.suppressed_notifications == before + 4
+
+    def test_write_only_notifies_changed_nets(self):
+        bus = [Net() for _ in range(4)]
+        listener = mock.Mock()
+        bus[0].add_listener(listener)
+        uut = BusMember(bus)
+        uut.write(1)
+
+        uut.write(3)
+
+        listener.on_change.assert_called_once_with(NetState.HIGH)
+
+    def test_write_strict_nets_always_notify(self):
+        bus = [Net(strict=True) for _ in range(4)]
+        listener = mock.Mock()
+        uut = BusMember(bus)
+        uut.add_listener(listener)
+        uut.write(6)
+
+        uut.write(6)
+
+        assert listener.on_change.call_count == 2
+
+    def test_restore_returns_value_and_handles(self):
+        bus = [Net() for _ in range(4)]
+        uut = BusMember(bus)
+        uut.write(5)
+        snapshots = [x.snapshot() for x in bus], uut.snapshot()
+        uut.float_()
+        BusMember(bus).write(2)
+
+        for net, snapshot in zip(bus, snapshots[0]):
+            net.restore(snapshot)
+        uut.restore(snapshots[1])
+
+        assert uut.value == 5
+        uut.write(6)
+        assert uut.value == 6
+
+    def test_guard_and_group_sensitivity(self):
+        bus = [Net() for _ in range(4)]
+        guard = Net()
+        guard_handle = guard.take_high()
+        group = SensitivityGroup()
+        uut = BusMember(bus)
+        listener = mock.Mock()
+        uut.add_listener(listener, Sensitivity(guard=guard, group=group))
+        driver = BusMember(bus)
+
+        driver.write(1)
+        guard.take_low(guard_handle)
+        driver.write(2)
+        group.enabled = False
+        driver.write(3)
+
+        listener.on_change.assert_called_once_with(2)
+
+    def test_edge_sensitivity_is_rejected(self):
+        uut = BusMember([Net() for _ in range(4)])
+        with pytest.raises(ValueError):
+            uut.add_listener(mock.Mock(), Sensitivity(Edge.RISING))
+
+    def test_disabled_group_stops_tracking_until_enabled(self):
+        bus = [Net() for _ in range(4)]
+        group = SensitivityGroup(enabled=False)
+        uut = BusMember(bus)
+        listener = mock.Mock()
+        uut.add_listener(listener, Sensitivity(group=group))
+        driver = BusMember(bus)
+
+        driver.write(3)
+        assert uut._high == 0
+        assert uut.value == 3
+
+        driver.write(5)
+        group.enabled = True
+        assert uut._high == 5
+        driver.write(6)
+
+        listener.on_change.assert_called_once_with(6)
+        assert uut.value == 6
+
+    def test_removing_last_disabled_listener_resumes_tracking(self):
+        bus = [Net() for _ in range(4)]
+        uut = BusMember(bus)
+        listener = mock.Mock()
+        uut.add_listener(listener)
+        uut.add_listener(mock.Mock(), Sensitivity(group=SensitivityGroup(False)))
+        assert not uut._idle
+
+        uut.remove_listener(listener)
+        assert uut._idle
+
+    def test_net_listener_reads_final_value_during_write(self):
+        bus = [Net() for _ in range(4)]
+        driver = BusMember(bus)
+        seen = []
+        bus[0].add_listener(NetChangeCallback(lambda _: seen.append(reader.value)))
+        reader = BusMember(bus)
+
+        driver.write(0b1111)
+        bus[0].take_low(driver._handles[0])
+
+        assert seen == [0b1111, 0b1110]
+
+    def test_bus_listener_reads_other_member_on_same_net(self):
+        bus = [Net() for _ in range(4)]
+        first = BusMember(bus)
+        seen = []
+        first.add_listener(BusValueCallback(lambda _: seen.append(second.value)))
+        second = BusMember(bus)
+        driver = BusMember(bus)
+        driver.write(0)
+        seen.clear()
+
+        bus[2].take_high(driver._handles[2])
+
+        assert seen == [0b0100]
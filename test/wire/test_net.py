@@ -1,7 +1,15 @@
 import unittest.mock as mock
 
 import pytest
-from sim8bit.wire import HandleNotOwner, Net, NetChangeCallback, NetState
+from sim8bit.wire import (
+    Edge,
+    HandleNotOwner,
+    Net,
+    NetChangeCallback,
+    NetState,
+    Sensitivity,
+    SensitivityGroup,
+)
 
 
 def test_net_change_callback():
@@ -96,3 +104,111 @@ class TestNet:
         uut.release_floating(h)
         listener_a.on_change.assert_called_with(NetState.FLOATING)
         listener_b.on_change.assert_called_with(NetState.FLOATING)
+
+    def test_removed_listener_is_not_notified(self):
+        uut = Net()
+        listener_a = mock.Mock()
+        listener_b = mock.Mock()
+        uut.add_listener(listener_a)
+        uut.add_listener(listener_b, Sensitivity(Edge.RISING))
+
+        uut.remove_listener(listener_b)
+        _ = uut.take_high()
+
+        listener_a.on_change.assert_called_once_with(NetState.HIGH)
+        listener_b.on_change.assert_not_called()
+        with pytest.raises(ValueError):
+            uut.remove_listener(listener_b)
+
+    def test_unchanged_state_does_not_notify(self):
+        uut = Net()
+        listener = mock.Mock()
+        uut.add_listener(listener)
+        handle = uut.take_high()
+        before = Net.suppressed_notifications
+
+        uut.take_high(handle)
+
+        listener.on_change.assert_called_once_with(NetState.HIGH)
+        assert Net.suppressed_notifications == before + 1
+
+    def test_unchanged_floating_does_not_notify(self):
+        uut = Net()
+        listener = mock.Mock()
+        handle = uut.take_low()
+        uut.release_floating(handle)
+        uut.add_listener(listener)
+
+        handle = uut.take_low()
+        uut.release_floating(handle)
+
+        assert listener.on_change.call_count == 2
+
+    def test_strict_notifies_unchanged_state(self):
+        uut = Net(strict=True)
+        listener = mock.Mock()
+        uut.add_listener(listener)
+        handle = uut.take_low()
+
+        uut.take_low(handle)
+
+        assert uut.strict
+        assert listener.on_change.call_count == 2
+
+    def test_restore_returns_owner_and_state_without_notifying(self):
+        uut = Net()
+        handle = uut.take_high()
+        snapshot = uut.snapshot()
+        uut.release_floating(handle)
+        other = uut.take_low()
+        listener = mock.Mock()
+        uut.add_listener(listener)
+
+        uut.restore(snapshot)
+
+        assert uut.state == NetState.HIGH
+        listener.on_change.assert_not_called()
+        uut.take_low(handle)
+        with pytest.raises(HandleNotOwner):
+            uut.take_low(other)
+
+    def test_edge_sensitivity(self):
+        uut = Net()
+        rising = mock.Mock()
+        falling = mock.Mock()
+        uut.add_listener(rising, Sensitivity(Edge.RISING))
+        uut.add_listener(falling, Sensitivity(Edge.FALLING))
+
+        handle = uut.take_low()
+        uut.take_high(handle)
+        uut.release_floating(handle)
+
+        rising.on_change.assert_called_once_with(NetState.HIGH)
+        falling.on_change.assert_called_once_with(NetState.LOW)
+
+    def test_guard_sensitivity(self):
+        uut = Net()
+        guard = Net()
+        guard_handle = guard.take_high()
+        listener = mock.Mock()
+        uut.add_listener(listener, Sensitivity(guard=guard))
+
+        handle = uut.take_low()
+        guard.take_low(guard_handle)
+        uut.take_high(handle)
+
+        listener.on_change.assert_called_once_with(NetState.HIGH)
+
+    def test_group_sensitivity(self):
+        group = SensitivityGroup(enabled=False)
+        nets = [Net() for _ in range(3)]
+        listener = mock.Mock()
+        for net in nets:
+            net.add_listener(listener, Sensitivity(group=group))
+
+        handles = [net.take_low() for net in nets]
+        group.enabled = True
+        for net, handle in zip(nets, handles):
+            net.take_high(handle)
+
+        assert listener.on_change.call_count == 3
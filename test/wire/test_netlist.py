@@ -0,0 +1,114 @@
+import unittest.mock as mock
+
+import pytest
+from sim8bit.wire import (
+    BusMember,
+    BusValueCallback,
+    Net,
+    NetChangeCallback,
+    Netlist,
+    NetState,
+    Sensitivity,
+    SensitivityGroup,
+)
+
+
+def test_compiles_fanout_into_csr_arrays():
+    nets = [Net() for _ in range(3)]
+    nets[0].add_listener(NetChangeCallback(mock.Mock()))
+    nets[0].add_listener(mock.Mock())
+    bus = BusMember(nets[1:])
+
+    uut = Netlist(nets)
+
+    assert list(uut.offsets) == [0, 2, 3, 4]
+    assert list(uut.targets) == [0, 1, ~0, ~1]
+    assert uut.buses == [bus]
+    assert uut.index(nets[2]) == 2
+    assert uut.states == bytearray([NetState.FLOATING.value] * 3)
+
+
+def test_net_listeners_are_called_directly():
+    callback = mock.Mock()
+    listener = mock.Mock()
+    net = Net()
+    net.add_listener(NetChangeCallback(callback))
+    net.add_listener(listener)
+    uut = Netlist([net])
+
+    handle = net.take_high()
+    net.take_high(handle)
+
+    callback.assert_called_once_with(NetState.HIGH)
+    listener.on_change.assert_called_once_with(NetState.HIGH)
+    assert uut.states[0] == NetState.HIGH.value
+
+
+def test_bus_values_match_object_dispatch():
+    nets = [Net() for _ in range(4)]
+    callback = mock.Mock()
+    watcher = BusMember(nets)
+    watcher.add_listener(BusValueCallback(callback))
+    driver = BusMember(nets)
+    Netlist(nets)
+
+    driver.write(5)
+    driver.write(6)
+
+    assert watcher.value == 6
+    assert callback.call_args_list == [mock.call(5), mock.call(6)]
+    assert watcher.floating_mask == 0
+
+    driver.float_()
+    nets[3].take_high()
+    assert watcher.value == NetState.FLOATING
+    assert watcher.floating_mask == 0b0111
+    assert callback.call_count == 4
+
+
+def test_idle_bus_skips_compiled_bit_updates():
+    nets = [Net() for _ in range(4)]
+    group = SensitivityGroup(enabled=False)
+    callback = mock.Mock()
+    watcher = BusMember(nets)
+    watcher.add_listener(BusValueCallback(callback), Sensitivity(group=group))
+    driver = BusMember(nets)
+    Netlist(nets)
+
+    driver.write(5)
+    assert watcher._high == 0
+    assert watcher.value == 5
+
+    group.enabled = True
+    driver.write(6)
+    callback.assert_called_once_with(6)
+
+
+def test_frozen_nets_reject_listeners_until_thawed():
+    net = Net()
+    bus = BusMember([net])
+    uut = Netlist([net])
+
+    with pytest.raises(RuntimeError):
+        net.add_listener(mock.Mock())
+    with pytest.raises(RuntimeError):
+        bus.add_listener(mock.Mock())
+    with pytest.raises(RuntimeError):
+        Netlist([net])
+
+    uut.thaw()
+    listener = mock.Mock()
+    net.add_listener(listener)
+    net.take_low()
+    listener.on_change.assert_called_once_with(NetState.LOW)
+
+
+def test_restore_state_mirror():
+    net = Net()
+    uut = Netlist([net])
+    snapshot = uut.snapshot()
+    net.take_high()
+
+    uut.restore(snapshot)
+
+    assert uut.states[0] == NetState.FLOATING.value
@@ -0,0 +1,99 @@
+import unittest.mock as mock
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from sim8bit.wire import HandleNotOwner, NetState  # noqa: E402
+from sim8bit.wire.vector import (  # noqa: E402
+    FLOATING_VALUE,
+    VectorBusMember,
+    VectorBusValueCallback,
+    VectorNet,
+    VectorNetCallback,
+)
+
+
+class TestVectorNet:
+    def test_starts_floating(self):
+        uut = VectorNet(3)
+        assert len(uut) == 3
+        assert list(uut.states) == [NetState.FLOATING.value] * 3
+
+    def test_take_high_where(self):
+        callback = mock.Mock()
+        uut = VectorNet(3)
+        uut.add_listener(VectorNetCallback(callback))
+
+        handle = uut.take_high(where=[True, False, True])
+        uut.take_high(handle)
+
+        assert list(uut.states) == [NetState.HIGH.value] * 3
+        changed = [list(c.args[1]) for c in callback.call_args_list]
+        assert changed == [[True, False, True], [False, True, False]]
+
+    def test_unchanged_instances_do_not_notify(self):
+        callback = mock.Mock()
+        uut = VectorNet(2)
+        uut.add_listener(VectorNetCallback(callback))
+        handle = uut.take_low()
+
+        uut.take_low(handle)
+
+        assert callback.call_count == 1
+
+    def test_release_keeps_owner_until_all_float(self):
+        uut = VectorNet(2)
+        handle = uut.take_low()
+
+        uut.release_floating(handle, where=[True, False])
+        with pytest.raises(HandleNotOwner):
+            uut.take_low()
+        uut.release_floating(handle, where=[False, True])
+
+        uut.take_low()
+
+
+class TestVectorBusMember:
+    def test_write_then_value(self):
+        nets = [VectorNet(3) for _ in range(12)]
+        uut = VectorBusMember(nets)
+
+        uut.write([0, 5, 0xABC])
+
+        assert list(uut.value) == [0, 5, 0xABC]
+        assert list(uut.floating_mask) == [0, 0, 0]
+
+    def test_partial_float_value(self):
+        nets = [VectorNet(2) for _ in range(4)]
+        uut = VectorBusMember(nets)
+        uut.write(3)
+
+        uut.float_(where=[False, True])
+
+        assert list(uut.value) == [3, FLOATING_VALUE]
+        assert list(uut.floating_mask) == [0, 0b1111]
+
+    def test_write_notifies_each_member_once(self):
+        nets = [VectorNet(2) for _ in range(4)]
+        callback = mock.Mock()
+        watcher = VectorBusMember(nets)
+        watcher.add_listener(VectorBusValueCallback(callback))
+        uut = VectorBusMember(nets)
+
+        uut.write([6, 9])
+        uut.write([6, 1], where=[True, True])
+
+        assert callback.call_count == 2
+        values, changed = callback.call_args.args
+        assert list(values) == [6, 1]
+        assert list(changed) == [False, True]
+
+    def test_negative_value_raises_value_error(self):
+        uut = VectorBusMember([VectorNet(2) for _ in range(4)])
+        with pytest.raises(ValueError):
+            uut.write([1, -1])
+
+    def test_mismatched_nets_raise_value_error(self):
+        with pytest.raises(ValueError):
+            VectorBusMember([VectorNet(2), VectorNet(3)])